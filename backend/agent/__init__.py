@@ -1,4 +1,15 @@
 # Agent module
-from .orchestration import run_agent
+#
+# ``run_agent`` is resolved on first access: importing it compiles the LangGraph
+# workflow and pulls in LangChain, which CRUD-only code paths (e.g. routes that
+# use ``agent.utils.skill_index``) should not pay for.
 
 __all__ = ["run_agent"]
+
+
+def __getattr__(name):
+    if name == "run_agent":
+        from .orchestration import run_agent
+
+        return run_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,9 @@
+import time
+from functools import wraps
+
 from langgraph.graph import StateGraph, END
+from core.metrics import AGENT_NODE_CALLS, AGENT_NODE_SECONDS
+from core.tracing import span
 from agent.state import AgentState
 from agent.router import route_query
 from agent.nodes.create_job import create_job_node
@@ -10,21 +15,45 @@ from agent.nodes.general_response import general_response_node
 from agent.nodes.safety_block import safety_block_node
 
 
+def instrumented(name: str, node):
+    """Wrap an async graph node so its latency and outcome are recorded."""
+    @wraps(node)
+    async def wrapper(state: AgentState) -> AgentState:
+        start = time.perf_counter()
+        try:
+            with span(f"node.{name}"):
+                result = await node(state)
+        except Exception:
+            AGENT_NODE_CALLS.inc(name, "error")
+            raise
+        finally:
+            AGENT_NODE_SECONDS.observe(time.perf_counter() - start, name)
+        AGENT_NODE_CALLS.inc(name, "ok")
+        return result
+    return wrapper
+
+
+def timed_route_query(state: AgentState) -> str:
+    """Routing decision, timed as the ``router`` node."""
+    with AGENT_NODE_SECONDS.time("router"), span("node.router"):
+        return route_query(state)
+
+
 # Build the graph
 workflow = StateGraph(AgentState)
 
 # Add nodes
-workflow.add_node("create_job_tool", create_job_node)
-workflow.add_node("get_applicants_tool", get_applicants_node)
-workflow.add_node("search_jobs_tool", search_jobs_node)
-workflow.add_node("rank_tool", rank_applicants_node)
-workflow.add_node("sql_tool", sql_query_node)
-workflow.add_node("general_response", general_response_node)
-workflow.add_node("safety_block", safety_block_node)
+workflow.add_node("create_job_tool", instrumented("create_job_tool", create_job_node))
+workflow.add_node("get_applicants_tool", instrumented("get_applicants_tool", get_applicants_node))
+workflow.add_node("search_jobs_tool", instrumented("search_jobs_tool", search_jobs_node))
+workflow.add_node("rank_tool", instrumented("rank_tool", rank_applicants_node))
+workflow.add_node("sql_tool", instrumented("sql_tool", sql_query_node))
+workflow.add_node("general_response", instrumented("general_response", general_response_node))
+workflow.add_node("safety_block", instrumented("safety_block", safety_block_node))
 
 # Set conditional entry point based on routing
 workflow.set_conditional_entry_point(
-    route_query,
+    timed_route_query,
     {
         "create_job_tool": "create_job_tool",
         "get_applicants_tool": "get_applicants_tool",
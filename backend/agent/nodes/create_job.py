@@ -4,10 +4,12 @@ import json
 import re
 from typing import Any, Dict, Optional
 
-from agent.prompts.loader import format_prompt
+from agent.prompts.budget import format_prompt_within_budget
 from agent.state import AgentState
 from agent.tools.job_tools import create_job
-from agent.utils.llm import llm
+from agent.utils.context import NO_CONTEXT, conversation_context, uses_conversation_context
+from agent.utils.llm import invoke_llm
+from agent.utils.preprocess import PreprocessedMessage, get_preprocessed
 from agent.utils.session import (
     get_pending_job,
     store_pending_job,
@@ -83,9 +85,8 @@ def _clean(value: Optional[str]) -> Optional[str]:
     return text or None
 
 
-def _looks_like_job_request(message: str) -> bool:
-    lower = message.lower()
-    return any(keyword in lower for keyword in INTENT_KEYWORDS)
+def _looks_like_job_request(preprocessed: PreprocessedMessage) -> bool:
+    return preprocessed.has_any(INTENT_KEYWORDS)
 
 
 def _is_follow_up_confirmation(message: str) -> bool:
@@ -105,14 +106,14 @@ def _is_follow_up_confirmation(message: str) -> bool:
     )
 
 
-def _is_providing_missing_info(message: str, pending_job: Dict[str, Optional[str]]) -> bool:
+def _is_providing_missing_info(preprocessed: PreprocessedMessage, pending_job: Dict[str, Optional[str]]) -> bool:
     """Check if the message is providing missing info for a pending job."""
     # If we have a pending job with missing fields, any message that doesn't
     # look like a new request is likely providing missing info
     if not pending_job:
         return False
     # Don't treat it as missing info if it's clearly a new job request
-    if _looks_like_job_request(message):
+    if _looks_like_job_request(preprocessed):
         return False
     return True
 
@@ -198,6 +199,19 @@ def _success_response(job: Dict[str, Optional[str]]) -> str:
     return "\n".join(parts)
 
 
+async def _extract_job_details(message: str) -> Dict[str, Any]:
+    """LLM extraction of job fields; the conversation summary resolves references to earlier turns."""
+    summary = await conversation_context()
+    prompt = format_prompt_within_budget(
+        "extract_job_details.md",
+        message=message,
+        conversation_context=summary or NO_CONTEXT,
+    )
+    llm_response = invoke_llm(prompt, "extract_job_details", cache=True)
+    return _safe_json_loads(getattr(llm_response, "content", ""))
+
+
+@uses_conversation_context
 async def create_job_node(state: AgentState) -> AgentState:
     """Create a job posting using structured extraction and simple validation.
     
@@ -218,13 +232,12 @@ async def create_job_node(state: AgentState) -> AgentState:
     pending_job = get_pending_job(conversation_id) if conversation_id else None
     
     # Handle follow-up providing missing information for a pending job
-    if pending_job and not _looks_like_job_request(message):
+    preprocessed = get_preprocessed(state)
+    if pending_job and not _looks_like_job_request(preprocessed):
         # User is providing missing info for a pending job
         # Try to extract the missing fields from this message
         try:
-            prompt = format_prompt("extract_job_details.md", message=message)
-            llm_response = llm.invoke(prompt)
-            extracted = _safe_json_loads(getattr(llm_response, "content", ""))
+            extracted = await _extract_job_details(message)
         except Exception:
             extracted = {}
         
@@ -251,7 +264,7 @@ async def create_job_node(state: AgentState) -> AgentState:
         clear_pending_job(conversation_id)
     else:
         # New job creation request - check for intent
-        if not _looks_like_job_request(message):
+        if not _looks_like_job_request(preprocessed):
             state["response"] = (
                 "I didn't detect a job creation request. Ask me to create a role by sharing the title, "
                 "location, and a brief overview."
@@ -260,9 +273,7 @@ async def create_job_node(state: AgentState) -> AgentState:
 
         # Extract job details from message
         try:
-            prompt = format_prompt("extract_job_details.md", message=message)
-            llm_response = llm.invoke(prompt)
-            extracted = _safe_json_loads(getattr(llm_response, "content", ""))
+            extracted = await _extract_job_details(message)
         except Exception:
             extracted = {}
 
@@ -1,16 +1,19 @@
 from agent.state import AgentState
-from agent.utils.llm import llm
-from agent.utils.safety import contains_dangerous_keywords
-from agent.prompts.loader import format_prompt
+from agent.utils.llm import invoke_llm
+from agent.utils.preprocess import get_preprocessed
+from agent.utils.context import NO_CONTEXT, conversation_context, uses_conversation_context
+from agent.prompts.budget import format_prompt_within_budget
 
 
+@uses_conversation_context
 async def general_response_node(state: AgentState) -> AgentState:
     """Handle general queries."""
     message = state.get("message", "")
+    preprocessed = get_preprocessed(state)
     
     # Safety check: if dangerous keywords detected, provide safety warning
-    if contains_dangerous_keywords(message):
-        if any(word in message.lower() for word in ["job", "data", "record", "entry"]):
+    if preprocessed.is_dangerous:
+        if preprocessed.has_any(["job", "data", "record", "entry"]):
             state["response"] = (
                 "I understand you'd like to perform that operation, but I cannot perform "
                 "delete, update, modify, or any data modification operations through the chatbot "
@@ -25,9 +28,14 @@ async def general_response_node(state: AgentState) -> AgentState:
             )
             return state
     
-    # Normal general response
-    prompt = format_prompt("general_response.md", message=message)
-    response = llm.invoke(prompt)
+    # Normal general response (the conversation summary has been loading since the node started)
+    summary = await conversation_context()
+    prompt = format_prompt_within_budget(
+        "general_response.md",
+        message=message,
+        conversation_context=summary or NO_CONTEXT,
+    )
+    response = invoke_llm(prompt, "general_response")
     state["response"] = response.content
     return state
 
@@ -1,36 +1,80 @@
 from agent.state import AgentState
 from agent.tools.applicant_tools import get_applicants
+from agent.utils.preprocess import get_preprocessed
+from agent.utils.skill_index import indexed_skills, normalize_skill
 import re
 
+# Applicants listed in the chat reply; the rest are summarised by the total count
+APPLICANTS_SHOWN = 5
+
+# Phrasing that always introduces skills ("candidates skilled in Go")
+EXPLICIT_SKILL_PATTERN = re.compile(
+    r"\b(?:skilled in|who know|knowing|experienced in|experience (?:in|with))\s+(.+)$",
+    re.IGNORECASE,
+)
+# "applicants with Kubernetes and Go": only terms found in the recruiter's skill index count
+WITH_PATTERN = re.compile(r"\bwith\s+(.+)$", re.IGNORECASE)
+# Listing qualifiers that follow "with" but are not skills: job ids, statuses, rankings
+NON_SKILL_PATTERN = re.compile(
+    r"^(?:(?:the|a|an)\s+)?(?:(?:job|role)[_\s]?id\b|status\b|(?:highest|lowest|best|top|worst|most|least)\b|scores?\b|rank)",
+    re.IGNORECASE,
+)
+
+
+def _skill_terms(text: str) -> list[str]:
+    text = re.sub(r"^(?:experience|skills?)\s+(?:in|with|of)\s+", "", text.strip(" ?.!"), flags=re.IGNORECASE)
+    text = re.sub(r"\s+(?:for|on|in)\s+(?:the\s+)?(?:job|role)\b.*$", "", text, flags=re.IGNORECASE)
+    text = re.sub(r"\b(?:skills?|experience)$", "", text, flags=re.IGNORECASE)
+    parts = re.split(r",|\band\b|&|/", text)
+    return [part.strip() for part in parts if part.strip() and not NON_SKILL_PATTERN.match(part.strip())]
+
+
+async def _extract_skills(message: str, recruiter_id: str) -> list[str]:
+    """Skill filters in the raw message, e.g. 'skilled in Rust' or 'candidates with Kubernetes and Go'."""
+    explicit = EXPLICIT_SKILL_PATTERN.search(message)
+    if explicit:
+        return _skill_terms(explicit.group(1))
+
+    match = WITH_PATTERN.search(message)
+    terms = _skill_terms(match.group(1)) if match else []
+    if not terms:
+        return []
+    known = await indexed_skills(recruiter_id)
+    return [term for term in terms if normalize_skill(term) in known]
+
 
 async def get_applicants_node(state: AgentState) -> AgentState:
     """Get applicants for a job."""
     try:
-        # Try to extract job_id if mentioned
-        job_id = None
-        id_match = re.search(r'job[_\s]?id[:\s]+([a-f0-9-]+)', state["message"], re.IGNORECASE)
-        if id_match:
-            job_id = id_match.group(1)
+        preprocessed = get_preprocessed(state)
+        # Job id if mentioned ("job_id: ...")
+        job_id = preprocessed.job_id
+
+        # Skill filters, read from the raw message so synonym rewriting cannot turn words into skills
+        skills = await _extract_skills(preprocessed.raw, state.get("user_id"))
         
-        result = await get_applicants(job_id)
+        result = await get_applicants(job_id, skills=skills, recruiter_id=state.get("user_id"), limit=APPLICANTS_SHOWN)
         
-        if isinstance(result, dict) and "error" in result:
+        if "error" in result:
             state["response"] = "I couldn't retrieve the applicants at this time. Please try again."
-        elif not result:
-            if job_id:
+        elif not result["total"]:
+            if skills:
+                state["response"] = f"No applicants with {', '.join(skills)} found yet. Skills are indexed once applicants have been ranked."
+            elif job_id:
                 state["response"] = f"No applicants found for this job yet. Once candidates start applying, you'll see them here!"
             else:
                 state["response"] = "No applications have been received yet. Candidates will appear here once they start applying to your job postings."
         else:
-            applicant_count = len(result)
+            applicant_count = result["total"]
+            shown = result["applicants"]
             state["response"] = f"📊 **Found {applicant_count} applicant{'s' if applicant_count != 1 else ''}**\n\n"
-            for i, app in enumerate(result[:5], 1):  # Show top 5
-                user_info = app.get('users', {})
-                name = user_info.get('full_name', user_info.get('email', 'Unknown'))
+            for i, app in enumerate(shown, 1):
+                user_info = app.get('applicant') or {}
+                name = app.get('applicant_name') or user_info.get('full_name') or user_info.get('email') or 'Unknown'
                 state["response"] += f"{i}. {name}\n"
             
-            if applicant_count > 5:
-                state["response"] += f"\n...and {applicant_count - 5} more applicants."
+            if applicant_count > len(shown):
+                state["response"] += f"\n...and {applicant_count - len(shown)} more applicants."
     
     except Exception as e:
         state["response"] = "I encountered an issue retrieving the applicants. Please try again."
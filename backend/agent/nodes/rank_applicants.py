@@ -1,20 +1,18 @@
 from agent.state import AgentState
 from agent.tools.applicant_tools import rank_applicants_for_job
-import re
+from agent.utils.preprocess import get_preprocessed
 
 
 async def rank_applicants_node(state: AgentState) -> AgentState:
     """Rank applicants for a job."""
     try:
         # Extract job_id
-        id_match = re.search(r'job[_\s]?id[:\s]+([a-f0-9-]+)', state["message"], re.IGNORECASE)
+        job_id = get_preprocessed(state).job_id
         
-        if not id_match:
+        if not job_id:
             state["response"] = "To rank applicants, please provide a job ID. You can find job IDs in your job listings.\n\nExample: 'Rank applicants for job_id: abc-123'"
             return state
         
-        job_id = id_match.group(1)
-        
         result = await rank_applicants_for_job(job_id)
         
         if not result.applicants:
@@ -1,17 +1,17 @@
 from agent.state import AgentState
-from agent.utils.safety import contains_dangerous_keywords
+from agent.utils.preprocess import get_preprocessed
 from agent.prompts.loader import format_prompt
 
 
 async def safety_block_node(state: AgentState) -> AgentState:
     """Block dangerous operations and return safety warning."""
-    message = state.get("message", "").lower()
+    keywords = get_preprocessed(state).dangerous_keywords
     
     # Detect what operation was attempted
     operation = "perform that operation"
-    if any(word in message for word in ["delete", "remove"]):
+    if keywords & {"delete", "remove"}:
         operation = "delete or remove data"
-    elif any(word in message for word in ["update", "modify", "change", "edit"]):
+    elif keywords & {"update", "modify", "change", "edit"}:
         operation = "update or modify data"
     else:
         operation = "perform that operation"
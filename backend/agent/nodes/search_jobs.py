@@ -1,18 +1,26 @@
 from agent.state import AgentState
-from agent.utils.llm import llm
-from agent.prompts.loader import format_prompt
+from agent.utils.llm import invoke_llm
+from agent.prompts.budget import format_prompt_within_budget
 from agent.tools.job_tools import search_jobs
+from agent.utils.preprocess import get_preprocessed
+from agent.utils.context import NO_CONTEXT, conversation_context, uses_conversation_context
 import json
 import re
 
 
+@uses_conversation_context
 async def search_jobs_node(state: AgentState) -> AgentState:
     """Search jobs using structured filters."""
     try:
-        # Load and format prompt
-        extraction_prompt = format_prompt("extract_filters.md", message=state['message'])
+        # Load and format prompt; the summary lets "same but in Berlin" refine an earlier search
+        summary = await conversation_context()
+        extraction_prompt = format_prompt_within_budget(
+            "extract_filters.md",
+            message=state['message'],
+            conversation_context=summary or NO_CONTEXT,
+        )
 
-        response = llm.invoke(extraction_prompt)
+        response = invoke_llm(extraction_prompt, "extract_filters", cache=True)
         json_match = re.search(r'\{.*\}', response.content, re.DOTALL)
         filters = {"keywords": "", "location": "", "salary": ""}
         if json_match:
@@ -25,9 +33,8 @@ async def search_jobs_node(state: AgentState) -> AgentState:
 
         # If everything empty, check if message is actually about jobs
         if not any(filters.values()):
-            message_lower = state["message"].lower()
             # Only treat as keywords if message contains job-related terms
-            if any(term in message_lower for term in ["job", "role", "position", "opening", "vacancy"]):
+            if get_preprocessed(state).has_any(["job", "role", "position", "opening", "vacancy"]):
                 filters["keywords"] = state["message"].strip()
             else:
                 # Not a job search query - return helpful message
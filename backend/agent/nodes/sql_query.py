@@ -1,7 +1,8 @@
 from agent.state import AgentState
-from agent.utils.llm import llm
-from agent.prompts.loader import format_prompt
+from agent.utils.llm import invoke_llm
+from agent.prompts.budget import format_prompt_within_budget
 from agent.tools.sql_tools import run_sql_query
+from agent.utils.preprocess import get_preprocessed
 
 # Define safe, predefined queries only
 SAFE_QUERIES = {
@@ -18,8 +19,7 @@ async def sql_query_node(state: AgentState) -> AgentState:
     """Execute predefined safe SQL queries based on user intent."""
     try:
         # Safety check: block dangerous operations
-        from agent.utils.safety import contains_dangerous_keywords
-        if contains_dangerous_keywords(state['message']):
+        if get_preprocessed(state).is_dangerous:
             state["response"] = (
                 "I cannot perform delete, update, modify, or any data modification operations "
                 "through the chatbot for security reasons. I can only provide read-only statistics. "
@@ -28,8 +28,8 @@ async def sql_query_node(state: AgentState) -> AgentState:
             return state
         
         # Use AI to determine which safe query to run
-        prompt = format_prompt("sql_query_selection.md", message=state['message'])
-        response = llm.invoke(prompt)
+        prompt = format_prompt_within_budget("sql_query_selection.md", message=state['message'])
+        response = invoke_llm(prompt, "sql_query_selection", cache=True)
         query_key = response.content.strip().lower()
 
         if query_key not in SAFE_QUERIES:
@@ -1,11 +1,12 @@
 from agent.state import AgentState
 from agent.graph import agent_graph
 from agent.utils.rate_limit import check_rate_limit
-from agent.utils.session import persist_chat_message, load_recent_messages, summarize_messages_if_needed
-from agent.utils.normalization import normalize_synonyms
-from agent.utils.llm import llm
+from agent.utils.session import persist_chat_message, get_last_intent
+from agent.utils.preprocess import preprocess_message
 from agent.prompts.loader import load_prompt
 from core.config import get_supabase_client
+from core import db
+from core.tracing import span
 
 
 # Load system prompt
@@ -32,37 +33,37 @@ async def run_agent(message: str, user_id: str, conversation_id: str) -> dict:
     )
     
     # Persist incoming user message
-    persist_chat_message(conversation_id, user_id, "user", message)
+    await persist_chat_message(conversation_id, user_id, "user", message)
 
-    # Load recent history and produce a short summary (rolling context)
-    recent = load_recent_messages(conversation_id, limit=12)
-    summary = summarize_messages_if_needed(conversation_id, recent, threshold=6, llm=llm)
+    # Normalize and scan the message once; routing and nodes share the result
+    preprocessed = preprocess_message(message)
+    initial_state["preprocessed"] = preprocessed
 
-    # Normalize synonyms in the incoming message (helps routing)
-    normalized = normalize_synonyms(message)
+    # Resolve the previous intent up front so routing stays free of I/O
+    if preprocessed.is_follow_up:
+        initial_state["last_intent"] = await get_last_intent(conversation_id)
 
-    # If we have a summary, prepend it to the message to reduce tokens vs full history
-    if summary:
-        initial_state["message"] = f"CONTEXT_SUMMARY:\n{summary}\n\nUser: {normalized}"
-    else:
-        initial_state["message"] = normalized
+    # Conversation context is loaded lazily by the nodes that use it (see agent.utils.context),
+    # so routing and keyword-routed tools only ever see the user's message
+    initial_state["message"] = preprocessed.text
 
     # Cache a light system prompt (avoid resending large static instructions)
     initial_state["system_prompt"] = SYSTEM_PROMPT
 
     # Use ainvoke for async nodes with LangSmith metadata
     # LangSmith will automatically trace this execution
-    result = await agent_graph.ainvoke(
-        initial_state,
-        config={
-            "metadata": {
-                "user_id": user_id,
-                "conversation_id": conversation_id,
-                "message_preview": message[:100] if len(message) > 100 else message
-            },
-            "tags": ["recruitment-agent", "chatbot"]
-        }
-    )
+    with span("agent.graph"):
+        result = await agent_graph.ainvoke(
+            initial_state,
+            config={
+                "metadata": {
+                    "user_id": user_id,
+                    "conversation_id": conversation_id,
+                    "message_preview": message[:100] if len(message) > 100 else message
+                },
+                "tags": ["recruitment-agent", "chatbot"]
+            }
+        )
 
     assistant_response = result.get("response", "")
 
@@ -73,16 +74,16 @@ async def run_agent(message: str, user_id: str, conversation_id: str) -> dict:
         initial_state["last_intent"] = last_intent
 
     # Persist assistant response
-    persist_chat_message(conversation_id, user_id, "assistant", assistant_response)
+    await persist_chat_message(conversation_id, user_id, "assistant", assistant_response)
 
     # Also log search queries separately (best-effort)
     try:
         supabase = get_supabase_client()
-        supabase.table("ai_search_logs").insert({
+        await db.execute(supabase.table("ai_search_logs").insert({
             "user_id": user_id,
             "query": message,
             "sql_generated": result.get("sql_generated")
-        }).execute()
+        }), "ai_search_logs", "insert")
     except:
         pass
 
@@ -0,0 +1,188 @@
+"""
+Token-budgeted prompt assembly.
+
+Each prompt template can declare a token budget and a per-field allocation.
+Free-text fields (CV, cover letter, job description, conversation history)
+are trimmed by priority so the rendered prompt stays within the budget
+instead of relying on ad-hoc character truncation at the call sites.
+"""
+
+import re
+from typing import Dict, Optional
+
+from agent.prompts.loader import load_prompt, format_prompt
+
+# Rough heuristic, not a tokenizer and not calibrated against Llama BPE:
+# words count as pieces of up to four characters and every punctuation mark
+# as one token. Counting and trimming use the same pattern, so budgets hold
+# by this measure only; leave headroom below the model's real limits.
+_TOKEN_PATTERN = re.compile(r"\w{1,4}|[^\w\s]")
+
+TRUNCATION_MARKER = " …"
+_MARKER_TOKENS = len(_TOKEN_PATTERN.findall(TRUNCATION_MARKER))
+
+# Per-template budgets.
+#   total_tokens: upper bound for the fully rendered prompt
+#   fields: name -> {priority, max_tokens, min_tokens, keep}
+#     priority   - lower is more important; the highest number is trimmed first
+#     max_tokens - hard cap applied to the field before totals are checked
+#     min_tokens - floor the field may be trimmed down to (default 0)
+#     keep       - "start" (default) keeps the beginning, "end" keeps the tail
+PROMPT_BUDGETS: Dict[str, dict] = {
+    "ats_analysis.md": {
+        "total_tokens": 5000,
+        "fields": {
+            "job_digest": {"priority": 0, "max_tokens": 600, "min_tokens": 200},
+            "cv_text": {"priority": 1, "max_tokens": 2500, "min_tokens": 800},
+            "cover_letter": {"priority": 2, "max_tokens": 500},
+            "motivation": {"priority": 3, "max_tokens": 250},
+            "proud_project": {"priority": 4, "max_tokens": 250},
+        },
+    },
+    "ats_batch_analysis.md": {
+        "total_tokens": 16000,
+        "fields": {
+            "job_digest": {"priority": 0, "max_tokens": 600, "min_tokens": 200},
+        },
+    },
+    "extract_job_digest.md": {
+        "total_tokens": 4000,
+        "fields": {
+            "job_requirements": {"priority": 0, "max_tokens": 1500, "min_tokens": 500},
+            "job_description": {"priority": 1, "max_tokens": 1500, "min_tokens": 300},
+        },
+    },
+    "conversation_summary.md": {
+        "total_tokens": 2000,
+        "fields": {
+            "conversation": {"priority": 0, "max_tokens": 1500, "keep": "end"},
+        },
+    },
+    "general_response.md": {
+        "total_tokens": 3000,
+        "fields": {
+            "message": {"priority": 0, "max_tokens": 1200, "keep": "end"},
+            "conversation_context": {"priority": 1, "max_tokens": 400, "keep": "end"},
+        },
+    },
+    "extract_filters.md": {
+        "total_tokens": 2000,
+        "fields": {
+            "message": {"priority": 0, "max_tokens": 300},
+            "conversation_context": {"priority": 1, "max_tokens": 300, "keep": "end"},
+        },
+    },
+    "extract_job_details.md": {
+        "total_tokens": 3500,
+        "fields": {
+            "message": {"priority": 0, "max_tokens": 1200},
+            "conversation_context": {"priority": 1, "max_tokens": 300, "keep": "end"},
+        },
+    },
+    "sql_query_selection.md": {
+        "total_tokens": 2000,
+        "fields": {
+            "message": {"priority": 0, "max_tokens": 200},
+        },
+    },
+}
+
+# Per-applicant allocation for the blocks of a batched ATS prompt; each block
+# is fitted separately so one long CV cannot crowd out the rest of the batch.
+BATCH_APPLICANT_TOKENS = 1500
+BATCH_APPLICANT_FIELDS: Dict[str, dict] = {
+    "cv_text": {"priority": 0, "max_tokens": 1100, "min_tokens": 500},
+    "cover_letter": {"priority": 1, "max_tokens": 250},
+    "motivation": {"priority": 2, "max_tokens": 120},
+    "proud_project": {"priority": 3, "max_tokens": 120},
+}
+
+
+def count_tokens(text: Optional[str]) -> int:
+    """Approximate the number of LLM tokens in ``text``."""
+    if not text:
+        return 0
+    return len(_TOKEN_PATTERN.findall(text))
+
+
+def trim_to_tokens(text: Optional[str], max_tokens: int, keep: str = "start") -> str:
+    """Trim ``text`` to at most ``max_tokens`` tokens, marking the cut (the marker counts towards the limit)."""
+    if not text:
+        return ""
+    if max_tokens <= 0:
+        return ""
+
+    matches = list(_TOKEN_PATTERN.finditer(text))
+    if len(matches) <= max_tokens:
+        return text
+
+    kept = max_tokens - _MARKER_TOKENS
+    if kept <= 0:
+        return ""
+
+    if keep == "end":
+        start = matches[len(matches) - kept].start()
+        return TRUNCATION_MARKER.strip() + " " + text[start:].lstrip()
+
+    end = matches[kept - 1].end()
+    return text[:end].rstrip() + TRUNCATION_MARKER
+
+
+def fit_fields(values: Dict[str, str], fields: Dict[str, dict], available_tokens: int) -> Dict[str, str]:
+    """Trim budgeted ``values`` so their combined size fits ``available_tokens``.
+
+    Every field is first capped at its own ``max_tokens``. If the total still
+    exceeds the available budget, fields are trimmed towards ``min_tokens``
+    starting with the least important (highest ``priority``).
+    """
+    fitted = dict(values)
+    counts: Dict[str, int] = {}
+
+    for name, spec in fields.items():
+        if name not in fitted:
+            continue
+        text = "" if fitted[name] is None else str(fitted[name])
+        text = trim_to_tokens(text, spec["max_tokens"], spec.get("keep", "start"))
+        fitted[name] = text
+        counts[name] = count_tokens(text)
+
+    excess = sum(counts.values()) - max(available_tokens, 0)
+    if excess <= 0:
+        return fitted
+
+    by_priority = sorted(counts, key=lambda name: fields[name]["priority"], reverse=True)
+    for name in by_priority:
+        if excess <= 0:
+            break
+        spec = fields[name]
+        reducible = counts[name] - spec.get("min_tokens", 0)
+        if reducible <= 0:
+            continue
+        cut = min(reducible, excess)
+        before = counts[name]
+        fitted[name] = trim_to_tokens(fitted[name], before - cut, spec.get("keep", "start"))
+        counts[name] = count_tokens(fitted[name])
+        excess -= before - counts[name]
+
+    return fitted
+
+
+def format_prompt_within_budget(prompt_file: str, **kwargs) -> str:
+    """Format a prompt template, trimming free-text fields to its token budget.
+
+    Templates without a declared budget are formatted unchanged.
+    """
+    budget = PROMPT_BUDGETS.get(prompt_file)
+    if not budget:
+        return format_prompt(prompt_file, **kwargs)
+
+    template = load_prompt(prompt_file)
+    fields = budget["fields"]
+
+    # Tokens used by the static template plus any fields without a budget
+    fixed = {k: ("" if k in fields else v) for k, v in kwargs.items()}
+    fixed_tokens = count_tokens(template.format(**fixed))
+    available = budget["total_tokens"] - fixed_tokens
+
+    fitted = fit_fields(kwargs, fields, available)
+    return template.format(**fitted)
@@ -10,6 +10,7 @@ class PromptLoader:
             prompts_dir = Path(__file__).parent
         self.prompts_dir = Path(prompts_dir)
         self._cache: Dict[str, str] = {}
+        self._metadata: Dict[str, Dict[str, str]] = {}
     
     def load_prompt_template(self, prompt_file: str) -> str:
         """Load prompt template from markdown file.
@@ -44,6 +45,29 @@ class PromptLoader:
         
         return self._cache[cache_key]
     
+    def load_prompt_metadata(self, prompt_file: str) -> Dict[str, str]:
+        """Load the front matter (version, name, description) of a prompt file."""
+        if prompt_file not in self._metadata:
+            file_path = self.prompts_dir / prompt_file
+            
+            if not file_path.exists():
+                raise FileNotFoundError(f"Prompt file not found: {file_path}")
+            
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            
+            metadata: Dict[str, str] = {}
+            match = re.match(r'---\n(.*?)\n---', content, re.DOTALL)
+            if match:
+                for line in match.group(1).splitlines():
+                    key, sep, value = line.partition(":")
+                    if sep:
+                        metadata[key.strip()] = value.strip().strip('"\'')
+            
+            self._metadata[prompt_file] = metadata
+        
+        return self._metadata[prompt_file]
+    
     def format_prompt(self, prompt_file: str, **kwargs) -> str:
         """Load and format a prompt with variables."""
         template = self.load_prompt_template(prompt_file)
@@ -68,3 +92,9 @@ def format_prompt(prompt_file: str, **kwargs) -> str:
     """Convenience function to format a prompt."""
     return get_loader().format_prompt(prompt_file, **kwargs)
 
+def get_prompt_version(prompt_file: str) -> str:
+    """Version declared in a prompt file's front matter ("0" when missing)."""
+    try:
+        return get_loader().load_prompt_metadata(prompt_file).get("version", "0")
+    except FileNotFoundError:
+        return "0"
@@ -1,22 +1,23 @@
 from agent.state import AgentState
-from agent.utils.safety import contains_dangerous_keywords
-from agent.utils.session import get_last_intent, is_follow_up_message
+from agent.utils.preprocess import get_preprocessed
 
 
 def route_query(state: AgentState) -> str:
     """Determine which tool to use based on the query."""
-    message = state["message"].lower()
+    preprocessed = get_preprocessed(state)
+    message = preprocessed.text
+    dangerous = preprocessed.is_dangerous
     conversation_id = state.get("conversation_id", "")
     
     # SAFETY CHECK FIRST - Block dangerous operations
-    if contains_dangerous_keywords(message):
+    if dangerous:
         # Check if it's about jobs/data operations
         if any(word in message for word in ["job", "data", "record", "entry", "database", "table"]):
             return "safety_block"
     
-    # CONTEXT AWARENESS - Handle follow-up messages
-    if is_follow_up_message(message) and conversation_id:
-        last_intent = get_last_intent(conversation_id)
+    # CONTEXT AWARENESS - Handle follow-up messages (last intent is looked up by run_agent)
+    if preprocessed.is_follow_up and conversation_id:
+        last_intent = state.get("last_intent")
         if last_intent:
             return last_intent
     
@@ -36,7 +37,7 @@ def route_query(state: AgentState) -> str:
         "in db", "in database"
     ]
     if any(trigger in message for trigger in sql_triggers):
-        if not contains_dangerous_keywords(message):
+        if not dangerous:
             return "sql_tool"
     
     # JOB CREATION - Comprehensive phrase matching (PRIORITY: Check before search)
@@ -70,7 +71,7 @@ def route_query(state: AgentState) -> str:
     # Check if message contains any job creation phrase
     if any(phrase in message for phrase in create_job_phrases):
         # Double check it's not about deleting/updating
-        if not contains_dangerous_keywords(message):
+        if not dangerous:
             return "create_job_tool"
     
     # RANK APPLICANTS
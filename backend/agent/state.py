@@ -1,5 +1,7 @@
 from typing import TypedDict, NotRequired
 
+from agent.utils.preprocess import PreprocessedMessage
+
 
 class AgentState(TypedDict):
     """State for the agent graph."""
@@ -13,4 +15,5 @@ class AgentState(TypedDict):
     conversation_id: str
     last_intent: NotRequired[str | None]  # Track last routing decision for context
     system_prompt: NotRequired[str | None]  # System prompt for LLM
+    preprocessed: NotRequired[PreprocessedMessage]  # Normalized text, keyword hits and job ids, built once per turn
 
@@ -1,146 +1,465 @@
-from typing import Dict, List, Any
-from core.config import get_supabase_client
+from typing import Awaitable, Callable, Dict, List, Any, Optional
+from core.config import get_supabase_client, Config
+from core import db
 from core.models import RankedApplicant, ATSRankingResponse
-from agent.utils.llm import llm
+from agent.utils.llm import invoke_llm
 from agent.utils.cv_parser import download_and_extract_cv_text
+from agent.utils.job_digest import get_job_digest, format_job_digest, job_version
+from agent.utils.prescreen import prescreen_scores, matched_skills
+from agent.utils.skill_index import record_application_skills, find_applications_by_skills
+from agent.prompts.budget import (
+    format_prompt_within_budget,
+    fit_fields,
+    BATCH_APPLICANT_FIELDS,
+    BATCH_APPLICANT_TOKENS,
+)
+import asyncio
 import json
+import logging
 import re
 
+logger = logging.getLogger("recruitment.ats")
 
-async def get_applicants(job_id: str = None) -> List[Dict[str, Any]]:
-    """Get applicants, optionally filtered by job_id."""
+
+# Summary prefix of results where the ATS model call failed (never stored as a score)
+ANALYSIS_ERROR_PREFIX = "Error analyzing"
+
+# Columns shown in applicant listings (name fallbacks come from the joined user row)
+APPLICANT_LIST_COLUMNS = "id, job_id, applicant_name, created_at, applicant:users!applications_applicant_id_fkey(full_name, email)"
+
+
+async def get_applicants(
+    job_id: str = None,
+    skills: Optional[List[str]] = None,
+    recruiter_id: Optional[str] = None,
+    limit: int = 5,
+) -> Dict[str, Any]:
+    """Get the recruiter's newest applicants, optionally filtered by job_id and by indexed skills.
+
+    Returns ``{"applicants": [...], "total": n}`` where ``applicants`` holds at most ``limit`` rows
+    and ``total`` is the server-side count of every match.
+    """
     try:
+        if not recruiter_id:
+            return {"error": "recruiter_id is required"}
+
         supabase = get_supabase_client()
-        query = supabase.table("applications").select("*, applicant:users!applications_applicant_id_fkey(*)")
-        
+        query = (
+            supabase.table("applications")
+            .select(APPLICANT_LIST_COLUMNS, count="exact")
+            .eq("recruiter_id", recruiter_id)
+        )
+
         if job_id:
             query = query.eq("job_id", job_id)
-        
-        response = query.execute()
-        return response.data
+
+        if skills:
+            application_ids = await find_applications_by_skills(recruiter_id, skills)
+            if not application_ids:
+                return {"applicants": [], "total": 0}
+            query = query.in_("id", application_ids)
+
+        query = query.order("created_at", desc=True).range(0, max(1, limit) - 1)
+        response = await db.execute(query, "applications", "select")
+        applicants = response.data or []
+        total = response.count if response.count is not None else len(applicants)
+        return {"applicants": applicants, "total": total}
     except Exception as e:
         return {"error": str(e)}
 
 
-async def rank_applicants_for_job(job_id: str) -> ATSRankingResponse:
+def _applicant_profile(app: Dict[str, Any]) -> Dict[str, Any]:
+    """Collect the fields used for ATS scoring and display from an application row."""
+    application_id = app.get("id") or app.get("application_id") or app.get("applicant_id")
+
+    applicant_user = app.get("applicant") or {}
+    applicant_email = applicant_user.get("email")
+    display_name = (
+        app.get("applicant_name")
+        or applicant_user.get("full_name")
+        or (applicant_email.split("@")[0] if applicant_email else "Candidate")
+    )
+
+    return {
+        "application_id": str(application_id),
+        "applicant_id": app["applicant_id"],
+        "name": display_name,
+        "email": applicant_email or "unknown@candidate",
+        "cv_url": app.get("cv_url", ""),
+        "cv_text": app.get("cv_text") or "",
+        "cover_letter": app.get("cover_letter") or "",
+        "motivation": app.get("motivation") or "",
+        "proud_project": app.get("proud_project") or "",
+    }
+
+
+def _to_ranked_applicant(profile: Dict[str, Any], result: Dict[str, Any]) -> RankedApplicant:
+    skills = result.get("skills", [])
+    if isinstance(skills, str):
+        skills = [skill.strip() for skill in skills.split(",") if skill.strip()]
+
+    return RankedApplicant(
+        application_id=profile["application_id"],
+        applicant_id=profile["applicant_id"],
+        name=profile["name"],
+        email=profile["email"],
+        score=float(result.get("score", 50)),
+        summary=result.get("summary", ""),
+        cv_url=profile["cv_url"],
+        skills=skills if isinstance(skills, list) else []
+    )
+
+
+def _score_single(job_context: Dict[str, str], profile: Dict[str, Any]) -> RankedApplicant:
+    """Score one applicant with the ats_analysis prompt."""
+    # Free-text fields are trimmed by priority to the ats_analysis token budget
+    prompt = format_prompt_within_budget(
+        "ats_analysis.md",
+        job_title=job_context['title'],
+        job_digest=job_context['digest'],
+        cv_text=profile["cv_text"],
+        cover_letter=profile["cover_letter"],
+        motivation=profile["motivation"],
+        proud_project=profile["proud_project"]
+    )
+
+    try:
+        response = invoke_llm(prompt, "ats_analysis")
+        content = response.content
+
+        # Extract JSON from response
+        json_match = re.search(r'\{.*\}', content, re.DOTALL)
+        if json_match:
+            result = json.loads(json_match.group())
+        else:
+            # Fallback if JSON parsing fails
+            result = {
+                "score": 50,
+                "summary": "Unable to fully analyze application",
+                "skills": []
+            }
+
+        return _to_ranked_applicant(profile, result)
+    except Exception as e:
+        # If analysis fails for one applicant, continue with others
+        return _to_ranked_applicant(profile, {
+            "score": 0,
+            "summary": f"{ANALYSIS_ERROR_PREFIX}: {str(e)}",
+            "skills": []
+        })
+
+
+def _format_applicant_block(index: int, profile: Dict[str, Any]) -> str:
+    fields = fit_fields(
+        {name: profile[name] for name in BATCH_APPLICANT_FIELDS},
+        BATCH_APPLICANT_FIELDS,
+        BATCH_APPLICANT_TOKENS,
+    )
+    return (
+        f"APPLICANT {index} (id: {profile['application_id']})\n"
+        f"CV: {fields['cv_text']}\n"
+        f"Cover Letter: {fields['cover_letter']}\n"
+        f"Motivation: {fields['motivation']}\n"
+        f"Proud Project: {fields['proud_project']}"
+    )
+
+
+def _parse_batch_results(content: str) -> Dict[str, Dict[str, Any]]:
+    """Parse the batched JSON array into application_id -> result."""
+    json_match = re.search(r'\[.*\]', content or "", re.DOTALL)
+    if not json_match:
+        return {}
+    try:
+        items = json.loads(json_match.group())
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(items, list):
+        return {}
+
+    results = {}
+    for item in items:
+        if not isinstance(item, dict) or item.get("id") is None or item.get("score") is None:
+            continue
+        try:
+            item["score"] = float(item["score"])
+        except (TypeError, ValueError):
+            continue
+        results[str(item["id"])] = item
+    return results
+
+
+def _score_batch(job_context: Dict[str, str], profiles: List[Dict[str, Any]]) -> List[RankedApplicant]:
+    """Score several applicants in one LLM call, sending the job context once.
+
+    Applicants missing from (or malformed in) the batched response are
+    re-scored individually with the single-applicant prompt.
     """
-    ATS-style ranking of applicants for a specific job.
-    Uses LLM to analyze CV and cover letter against job requirements.
+    if len(profiles) == 1:
+        return [_score_single(job_context, profiles[0])]
+
+    blocks = "\n\n".join(
+        _format_applicant_block(i, profile) for i, profile in enumerate(profiles, 1)
+    )
+    prompt = format_prompt_within_budget(
+        "ats_batch_analysis.md",
+        job_title=job_context['title'],
+        job_digest=job_context['digest'],
+        applicant_count=len(profiles),
+        applicants=blocks
+    )
+
+    try:
+        response = invoke_llm(prompt, "ats_batch_analysis")
+        results = _parse_batch_results(response.content)
+    except Exception:
+        results = {}
+
+    ranked = []
+    for profile in profiles:
+        result = results.get(profile["application_id"])
+        if result is None:
+            ranked.append(_score_single(job_context, profile))
+        else:
+            ranked.append(_to_ranked_applicant(profile, result))
+    return ranked
+
+
+def _profile_text(profile: Dict[str, Any]) -> str:
+    return "\n".join(
+        profile[field] for field in ("cv_text", "cover_letter", "motivation", "proud_project") if profile[field]
+    )
+
+
+def _prescreen(job: Dict[str, Any], digest: Optional[Dict[str, Any]], profiles: List[Dict[str, Any]]) -> List[tuple]:
+    """Provisional keyword/TF-IDF ranking of ``profiles`` as (profile, score) pairs, best first."""
+    job_text = f"{job.get('title', '')}\n{job.get('requirements', '')}\n{job.get('description', '')}"
+    required_skills = (digest or {}).get("must_have_skills") or []
+    scores = prescreen_scores(job_text, [_profile_text(profile) for profile in profiles], required_skills)
+    order = sorted(range(len(profiles)), key=lambda i: float(scores[i]), reverse=True)
+    return [(profiles[i], float(scores[i])) for i in order]
+
+
+def _provisional_applicant(profile: Dict[str, Any], score: float, digest: Optional[Dict[str, Any]]) -> RankedApplicant:
+    required_skills = (digest or {}).get("must_have_skills") or []
+    return RankedApplicant(
+        application_id=profile["application_id"],
+        applicant_id=profile["applicant_id"],
+        name=profile["name"],
+        email=profile["email"],
+        score=round(score * 100, 1),
+        summary=f"Provisional keyword match of {round(score * 100)}%; not yet analyzed by the ATS model.",
+        cv_url=profile["cv_url"],
+        skills=matched_skills(_profile_text(profile), required_skills),
+        provisional=True
+    )
+
+
+async def _load_job_and_profiles(job_id: str) -> tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Fetch the job and its applications, with CV text extracted for each applicant."""
+    supabase = get_supabase_client()
+
+    # Get job details
+    job_response = await db.execute(supabase.table("jobs").select("*").eq("id", job_id).single(), "jobs", "select")
+    job = job_response.data
+
+    # Get all applications for this job
+    apps_query = (
+        supabase
+        .table("applications")
+        .select("*, applicant:users!applications_applicant_id_fkey(*)")
+        .eq("job_id", job_id)
+    )
+    apps_response = await db.execute(apps_query, "applications", "select")
+    profiles = [_applicant_profile(app) for app in apps_response.data or []]
+
+    # Download and extract CVs concurrently, except those whose text was stored at submission
+    missing = [profile for profile in profiles if not profile["cv_text"]]
+    cv_texts = await asyncio.gather(
+        *(download_and_extract_cv_text(profile["cv_url"]) for profile in missing),
+        return_exceptions=True
+    )
+    for profile, cv_text in zip(missing, cv_texts):
+        if isinstance(cv_text, Exception):
+            cv_text = f"Could not extract CV text: {str(cv_text)}"
+        profile["cv_text"] = cv_text
+
+    return job, profiles
+
+
+async def load_application_scores(job_id: str, version: str) -> Dict[str, Dict[str, Any]]:
+    """Stored ATS results for ``job_id`` that were computed against job version ``version``, by application id."""
+    try:
+        supabase = get_supabase_client()
+        query = (
+            supabase.table("application_scores")
+            .select("application_id, score, summary, skills")
+            .eq("job_id", job_id)
+            .eq("job_version", version)
+        )
+        response = await db.execute(query, "application_scores", "select")
+    except Exception as e:
+        # Without stored scores everyone is simply scored again
+        logger.warning("Loading ATS scores for job %s failed: %s", job_id, e)
+        return {}
+    return {str(row["application_id"]): row for row in response.data or []}
+
+
+async def save_application_scores(job: Dict[str, Any], applicants: List[RankedApplicant]):
+    """Store ATS results keyed by the job version they were scored against (best-effort)."""
+    rows = [
+        {
+            "application_id": applicant.application_id,
+            "job_id": job["id"],
+            "recruiter_id": job.get("created_by"),
+            "job_version": job_version(job),
+            "score": applicant.score,
+            "summary": applicant.summary,
+            "skills": applicant.skills,
+        }
+        for applicant in applicants
+        if not applicant.provisional and not applicant.summary.startswith(ANALYSIS_ERROR_PREFIX)
+    ]
+    if not rows:
+        return
+    try:
+        supabase = get_supabase_client()
+        await db.execute(supabase.table("application_scores").upsert(rows), "application_scores", "upsert")
+    except Exception as e:
+        logger.warning("Storing ATS scores for job %s failed: %s", job.get("id"), e)
+
+
+async def score_application(application: Dict[str, Any]):
+    """Analyze a newly submitted application against its job and store the result.
+
+    Runs as a background task after the application is created and its CV
+    text stored (``application["cv_text"]``, see
+    ``cv_parser.store_uploaded_cv_text``); the CV is downloaded only if that
+    text is missing. Failures are logged; the application is scored at
+    ranking time instead.
     """
     try:
         supabase = get_supabase_client()
-        
-        # Get job details
-        job_response = supabase.table("jobs").select("*").eq("id", job_id).single().execute()
+        job_response = await db.execute(supabase.table("jobs").select("*").eq("id", application["job_id"]).single(), "jobs", "select")
         job = job_response.data
-        
-        # Get all applications for this job
-        apps_response = (
-            supabase
-            .table("applications")
-            .select("*, applicant:users!applications_applicant_id_fkey(*)")
-            .eq("job_id", job_id)
-            .execute()
+        profile = _applicant_profile(application)
+        if not profile["cv_text"]:
+            profile["cv_text"] = await download_and_extract_cv_text(profile["cv_url"])
+
+        digest = await get_job_digest(job)
+        job_context = {"title": job["title"], "digest": format_job_digest(job, digest)}
+        applicant = await asyncio.to_thread(_score_single, job_context, profile)
+        await save_application_scores(job, [applicant])
+        if applicant.skills:
+            await record_application_skills(job.get("created_by"), applicant.application_id, job["id"], applicant.skills)
+    except Exception as e:
+        logger.warning("Background ATS scoring of application %s failed: %s", application.get("id"), e)
+
+
+async def prescreen_applicants_for_job(job_id: str) -> ATSRankingResponse:
+    """Provisional ranking of every applicant by the local pre-screen, without per-applicant ATS analysis.
+
+    Not free: CVs with no stored text are downloaded and parsed, and the job
+    digest is extracted with one LLM call when no digest is stored for the
+    current job version.
+    """
+    try:
+        job, profiles = await _load_job_and_profiles(job_id)
+        digest = await get_job_digest(job) if profiles else None
+        return ATSRankingResponse(
+            job_id=job_id,
+            job_title=job["title"],
+            applicants=[
+                _provisional_applicant(profile, score, digest)
+                for profile, score in _prescreen(job, digest, profiles)
+            ]
         )
-        applications = apps_response.data
+    except Exception as e:
+        raise Exception(f"Error pre-screening applicants: {str(e)}")
+
+
+async def rank_applicants_for_job(
+    job_id: str,
+    batch_size: Optional[int] = None,
+    top_k: Optional[int] = None,
+    on_result: Optional[Callable[[List[RankedApplicant], int], Awaitable[None]]] = None,
+    scored: Optional[List[RankedApplicant]] = None,
+) -> ATSRankingResponse:
+    """
+    ATS-style ranking of applicants for a specific job.
+    Uses LLM to analyze CV and cover letter against job requirements.
+
+    Applicants are first pre-screened locally; only the best ``top_k``
+    (defaults to ``Config.ATS_PRESCREEN_TOP_K``, 0 sends everyone) are
+    analyzed by the LLM, ``batch_size`` at a time (defaults to
+    ``Config.ATS_BATCH_SIZE``). The remaining applicants are listed after
+    the analyzed ones with their provisional pre-screen score.
+
+    Applicants with a stored score for the current job version (computed
+    when they applied, see ``score_application``) or listed in ``scored``
+    (matched by application id) are reused instead of re-analyzed; only the
+    rest are pre-screened and sent to the LLM. ``on_result(applicants,
+    total)`` is awaited once with the reused applicants before scoring
+    starts and again with each newly scored batch; ``total`` counts the
+    reused and shortlisted applicants.
+    """
+    try:
+        job, profiles = await _load_job_and_profiles(job_id)
         
-        if not applications:
+        if not profiles:
             return ATSRankingResponse(
                 job_id=job_id,
                 job_title=job["title"],
                 applicants=[]
             )
+
+        # Score against the job's requirement digest (extracted once per job version)
+        digest = await get_job_digest(job)
+        job_context = {"title": job["title"], "digest": format_job_digest(job, digest)}
+
+        previous = {applicant.application_id: applicant for applicant in scored or []}
+        stored = await load_application_scores(job_id, job_version(job))
+        for profile in profiles:
+            if profile["application_id"] in stored and profile["application_id"] not in previous:
+                previous[profile["application_id"]] = _to_ranked_applicant(profile, stored[profile["application_id"]])
+        ranked_applicants = [previous[profile["application_id"]] for profile in profiles if profile["application_id"] in previous]
+        unscored = [profile for profile in profiles if profile["application_id"] not in previous]
+
+        top_k = Config.ATS_PRESCREEN_TOP_K if top_k is None else top_k
+        prescreened = _prescreen(job, digest, unscored) if unscored else []
+        if top_k > 0:
+            shortlisted = [profile for profile, _ in prescreened[:top_k]]
+            remaining = prescreened[top_k:]
+        else:
+            shortlisted = unscored
+            remaining = []
+
+        total = len(ranked_applicants) + len(shortlisted)
+        if on_result:
+            await on_result(list(ranked_applicants), total)
+
+        batch_size = max(1, batch_size or Config.ATS_BATCH_SIZE)
+        newly_scored = []
+        for start in range(0, len(shortlisted), batch_size):
+            # LLM calls block; run them off the event loop so other requests keep being served
+            batch = await asyncio.to_thread(_score_batch, job_context, shortlisted[start:start + batch_size])
+            newly_scored.extend(batch)
+            if on_result:
+                await on_result(batch, total)
+        ranked_applicants.extend(newly_scored)
+
+        # Keep new results for later rankings, and their skills in the recruiter's skill index
+        await save_application_scores(job, newly_scored)
+        await asyncio.gather(*(
+            record_application_skills(job.get("created_by"), applicant.application_id, job_id, applicant.skills)
+            for applicant in newly_scored
+            if applicant.skills
+        ))
         
-        ranked_applicants = []
-        
-        for app in applications:
-            # Extract actual CV text from PDF
-            cv_url = app.get('cv_url', '')
-            try:
-                cv_text = await download_and_extract_cv_text(cv_url)
-            except Exception as e:
-                cv_text = f"Could not extract CV text: {str(e)}"
-            
-            cover_letter = app.get("cover_letter", "")
-            
-            # Include additional application fields if available
-            motivation = app.get("motivation", "")
-            proud_project = app.get("proud_project", "")
-            
-            # Combine all applicant content for better analysis
-            applicant_content = cv_text
-            if motivation:
-                applicant_content += f"\n\nMotivation/Why This Role:\n{motivation}"
-            if proud_project:
-                applicant_content += f"\n\nProud Project/Achievement:\n{proud_project}"
-            
-            application_id = app.get("id") or app.get("application_id") or app.get("applicant_id")
-            application_id = str(application_id)
-
-            applicant_user = app.get("applicant") or {}
-            applicant_email = applicant_user.get("email")
-            display_name = (
-                app.get("applicant_name")
-                or applicant_user.get("full_name")
-                or (applicant_email.split("@")[0] if applicant_email else "Candidate")
-            )
-            
-            # Use LLM to score and analyze applicant
-            from agent.prompts.loader import format_prompt
-            prompt = format_prompt(
-                "ats_analysis.md",
-                job_title=job['title'],
-                job_requirements=job['requirements'],
-                job_description=job['description'],
-                cv_text=applicant_content,  # Now includes CV text + motivation + proud project
-                cover_letter=cover_letter
-            )
-            
-            try:
-                response = llm.invoke(prompt)
-                content = response.content
-                
-                # Extract JSON from response
-                json_match = re.search(r'\{.*\}', content, re.DOTALL)
-                if json_match:
-                    result = json.loads(json_match.group())
-                else:
-                    # Fallback if JSON parsing fails
-                    result = {
-                        "score": 50,
-                        "summary": "Unable to fully analyze application",
-                        "skills": []
-                    }
-                
-                skills = result.get("skills", [])
-                if isinstance(skills, str):
-                    skills = [skill.strip() for skill in skills.split(",") if skill.strip()]
-
-                ranked_applicants.append(RankedApplicant(
-                    application_id=application_id,
-                    applicant_id=app["applicant_id"],
-                    name=display_name,
-                    email=applicant_email or "unknown@candidate",
-                    score=float(result.get("score", 50)),
-                    summary=result.get("summary", ""),
-                    cv_url=app["cv_url"],
-                    skills=skills if isinstance(skills, list) else []
-                ))
-            except Exception as e:
-                # If analysis fails for one applicant, continue with others
-                ranked_applicants.append(RankedApplicant(
-                    application_id=application_id,
-                    applicant_id=app["applicant_id"],
-                    name=display_name,
-                    email=applicant_email or "unknown@candidate",
-                    score=0,
-                    summary=f"Error analyzing: {str(e)}",
-                    cv_url=app["cv_url"],
-                    skills=[]
-                ))
-        
-        # Sort by score descending
+        # Sort by score descending; pre-screened-out applicants follow in pre-screen order
         ranked_applicants.sort(key=lambda x: x.score, reverse=True)
+        ranked_applicants.extend(
+            _provisional_applicant(profile, score, digest) for profile, score in remaining
+        )
         
         return ATSRankingResponse(
             job_id=job_id,
@@ -150,4 +469,3 @@ async def rank_applicants_for_job(job_id: str) -> ATSRankingResponse:
     
     except Exception as e:
         raise Exception(f"Error ranking applicants: {str(e)}")
-
@@ -1,4 +1,4 @@
-from agent.utils.llm import llm
+from agent.utils.llm import invoke_llm
 
 
 async def summarize_cv(cv_text: str) -> str:
@@ -10,7 +10,7 @@ async def summarize_cv(cv_text: str) -> str:
 
 Summary:"""
         
-        response = llm.invoke(prompt)
+        response = invoke_llm(prompt, "summarize_cv")
         return response.content
     except Exception as e:
         return f"Error summarizing CV: {str(e)}"
@@ -32,7 +32,7 @@ Create a compelling job description including:
 
 Job Description:"""
         
-        response = llm.invoke(prompt)
+        response = invoke_llm(prompt, "generate_job_description")
         return response.content
     except Exception as e:
         return f"Error generating job description: {str(e)}"
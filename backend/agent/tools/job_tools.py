@@ -1,5 +1,7 @@
 from typing import Dict, List, Any, Optional
 from core.config import get_supabase_client
+from core import db
+from core.cache import invalidate_dashboard, notify_job_write
 import re
 
 
@@ -30,14 +32,16 @@ async def create_job(title: str, description: str, requirements: str, location:
 
         supabase = get_supabase_client()
         try:
-            response = supabase.table("jobs").insert({
+            response = await db.execute(supabase.table("jobs").insert({
                 "title": title,
                 "description": description,
                 "requirements": requirements,
                 "location": location,
                 "salary": salary,
                 "created_by": user_id
-            }).execute()
+            }), "jobs", "insert")
+            invalidate_dashboard(user_id)
+            notify_job_write(response.data[0])
             return response.data[0]
         except Exception as e:
             # If the created_by value is not a valid UUID (e.g., during local testing with placeholder user_id),
@@ -45,13 +49,14 @@ async def create_job(title: str, description: str, requirements: str, location:
             msg = str(e)
             if 'invalid input syntax for type uuid' in msg or 'invalid input syntax for type uuid' in msg.lower():
                 try:
-                    response = supabase.table("jobs").insert({
+                    response = await db.execute(supabase.table("jobs").insert({
                         "title": title,
                         "description": description,
                         "requirements": requirements,
                         "location": location,
                         "salary": salary
-                    }).execute()
+                    }), "jobs", "insert")
+                    notify_job_write(response.data[0])
                     return response.data[0]
                 except Exception as e2:
                     return {"error": str(e2)}
@@ -68,7 +73,7 @@ async def search_jobs(keywords: Optional[str] = None, location: Optional[str] =
         supabase = get_supabase_client()
 
         # Get all jobs first (we'll filter in Python for more flexibility)
-        response = supabase.table("jobs").select("*").order("created_at", desc=True).execute()
+        response = await db.execute(supabase.table("jobs").select("*").order("created_at", desc=True), "jobs", "select")
         all_jobs = response.data
 
         # Filter by location
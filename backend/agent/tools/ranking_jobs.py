@@ -0,0 +1,209 @@
+"""
+Background ATS ranking jobs.
+
+``POST /ats/rank`` holds the request open for the whole ranking, which runs
+past proxy timeouts for large applicant pools. A ranking job runs
+``rank_applicants_for_job`` as an asyncio task instead and writes progress
+to the ``ranking_jobs`` table after every scored batch: the applicants
+scored so far (best first), how much of the shortlist is done and the
+status. Any worker can serve reads and cancellations from the row; the
+running task notices a cancellation at its next progress write. Jobs left
+queued or running by a stopped worker are claimed and resumed at startup
+(and by a periodic sweep), reusing the scores already saved.
+
+Staleness is judged by ``updated_at``, so a running job also touches its
+row every ``RANKING_JOB_HEARTBEAT_SECONDS`` while profiles load and
+between batches. Each start or claim sets a fresh ``lease_id`` and every
+write filters on it, so a run whose job was claimed by another worker
+can no longer write and stops at its next write or heartbeat.
+"""
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from core import db
+from core.config import Config, get_supabase_client
+from core.models import RankedApplicant
+
+logger = logging.getLogger("recruitment.ranking_jobs")
+
+ACTIVE_STATUSES = ("queued", "running")
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+# Tasks started by this worker, by ranking job id
+_tasks: Dict[str, asyncio.Task] = {}
+
+
+class RankingJobCancelled(Exception):
+    """The ranking job left the active states while it was running."""
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _new_lease() -> str:
+    return str(uuid.uuid4())
+
+
+async def _update_if_active(ranking_job_id: str, lease_id: Optional[str], values: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Write ``values`` unless the job was cancelled, finished or claimed by another run; returns the updated row."""
+    supabase = get_supabase_client()
+    query = (
+        supabase.table("ranking_jobs")
+        .update({**values, "updated_at": _now()})
+        .eq("id", ranking_job_id)
+        .eq("lease_id", lease_id)
+        .in_("status", list(ACTIVE_STATUSES))
+    )
+    response = await db.execute(query, "ranking_jobs", "update")
+    return response.data[0] if response.data else None
+
+
+async def get_ranking_job(ranking_job_id: str) -> Optional[Dict[str, Any]]:
+    supabase = get_supabase_client()
+    query = supabase.table("ranking_jobs").select("*").eq("id", ranking_job_id).limit(1)
+    response = await db.execute(query, "ranking_jobs", "select")
+    return response.data[0] if response.data else None
+
+
+async def create_ranking_job(job_id: str, job_title: str, recruiter_id: str) -> Dict[str, Any]:
+    """Persist a queued ranking job for ``job_id`` and start it on this worker."""
+    supabase = get_supabase_client()
+    row = {
+        "job_id": job_id,
+        "job_title": job_title,
+        "recruiter_id": recruiter_id,
+        "status": "queued",
+        "total": 0,
+        "completed": 0,
+        "applicants": [],
+        "lease_id": _new_lease(),
+        "updated_at": _now(),
+    }
+    response = await db.execute(supabase.table("ranking_jobs").insert(row), "ranking_jobs", "insert")
+    ranking_job = response.data[0]
+    start_ranking_job(ranking_job)
+    return ranking_job
+
+
+def start_ranking_job(ranking_job: Dict[str, Any]) -> asyncio.Task:
+    task = asyncio.create_task(_run_ranking_job(ranking_job))
+    _tasks[ranking_job["id"]] = task
+    task.add_done_callback(lambda _: _tasks.pop(ranking_job["id"], None))
+    return task
+
+
+async def _heartbeat(ranking_job_id: str, lease_id: Optional[str], task: asyncio.Task):
+    """Keep ``updated_at`` fresh while ``task`` works; cancel it once the job is no longer ours to run."""
+    while True:
+        await asyncio.sleep(Config.RANKING_JOB_HEARTBEAT_SECONDS)
+        try:
+            row = await _update_if_active(ranking_job_id, lease_id, {})
+        except Exception as e:
+            logger.warning("Ranking job %s heartbeat failed: %s", ranking_job_id, e)
+            continue
+        if row is None:
+            task.cancel()
+            return
+
+
+async def _run_ranking_job(ranking_job: Dict[str, Any]):
+    # Loaded on first use: ATS scoring pulls in the LLM and CV parsing stack
+    from agent.tools.applicant_tools import rank_applicants_for_job
+
+    ranking_job_id = ranking_job["id"]
+    lease_id = ranking_job.get("lease_id")
+    scored: Dict[str, Dict[str, Any]] = {
+        applicant["application_id"]: applicant for applicant in ranking_job.get("applicants") or []
+        if not applicant.get("provisional")
+    }
+
+    async def on_result(applicants: List[RankedApplicant], total: int):
+        for applicant in applicants:
+            scored[applicant.application_id] = applicant.model_dump(mode="json")
+        ordered = sorted(scored.values(), key=lambda applicant: applicant["score"], reverse=True)
+        values = {"status": "running", "total": total, "completed": len(scored), "applicants": ordered}
+        if await _update_if_active(ranking_job_id, lease_id, values) is None:
+            raise RankingJobCancelled(ranking_job_id)
+
+    try:
+        if await _update_if_active(ranking_job_id, lease_id, {"status": "running"}) is None:
+            return
+        heartbeat = asyncio.create_task(_heartbeat(ranking_job_id, lease_id, asyncio.current_task()))
+        try:
+            result = await rank_applicants_for_job(
+                ranking_job["job_id"],
+                on_result=on_result,
+                scored=[RankedApplicant(**applicant) for applicant in scored.values()],
+            )
+        finally:
+            heartbeat.cancel()
+        await _update_if_active(ranking_job_id, lease_id, {
+            "status": "completed",
+            "completed": len(scored),
+            "applicants": [applicant.model_dump(mode="json") for applicant in result.applicants],
+        })
+    except Exception as e:
+        # No-op when the failure came from a cancellation (the row is no longer active)
+        await _update_if_active(ranking_job_id, lease_id, {"status": "failed", "error": str(e)})
+
+
+async def cancel_ranking_job(ranking_job_id: str) -> Optional[Dict[str, Any]]:
+    """Mark the job cancelled and stop it if it runs here; other workers stop at their next progress write."""
+    supabase = get_supabase_client()
+    query = (
+        supabase.table("ranking_jobs")
+        .update({"status": "cancelled", "updated_at": _now()})
+        .eq("id", ranking_job_id)
+        .in_("status", list(ACTIVE_STATUSES))
+    )
+    await db.execute(query, "ranking_jobs", "update")
+    task = _tasks.get(ranking_job_id)
+    if task is not None:
+        task.cancel()
+    return await get_ranking_job(ranking_job_id)
+
+
+async def resume_ranking_jobs() -> int:
+    """Claim and restart active jobs with no progress for ``RANKING_JOB_STALE_SECONDS``; returns how many."""
+    supabase = get_supabase_client()
+    stale_before = (datetime.now(timezone.utc) - timedelta(seconds=Config.RANKING_JOB_STALE_SECONDS)).isoformat()
+    query = (
+        supabase.table("ranking_jobs")
+        .select("*")
+        .in_("status", list(ACTIVE_STATUSES))
+        .lt("updated_at", stale_before)
+    )
+    response = await db.execute(query, "ranking_jobs", "select")
+
+    resumed = 0
+    for ranking_job in response.data or []:
+        if ranking_job["id"] in _tasks:
+            continue
+        # Claim by compare-and-set on updated_at so only one restarting worker picks the job up;
+        # the new lease locks out the previous run if it is in fact still going
+        claim = (
+            supabase.table("ranking_jobs")
+            .update({"updated_at": _now(), "lease_id": _new_lease()})
+            .eq("id", ranking_job["id"])
+            .eq("updated_at", ranking_job["updated_at"])
+        )
+        claimed = await db.execute(claim, "ranking_jobs", "update")
+        if claimed.data:
+            start_ranking_job(claimed.data[0])
+            resumed += 1
+    return resumed
+
+
+async def resume_ranking_jobs_periodically():
+    """Resume stale jobs now and then every ``RANKING_JOB_STALE_SECONDS`` (started from the app lifespan)."""
+    while True:
+        try:
+            await resume_ranking_jobs()
+        except Exception as e:
+            logger.warning("Resuming ranking jobs failed: %s", e)
+        await asyncio.sleep(Config.RANKING_JOB_STALE_SECONDS)
@@ -0,0 +1,69 @@
+"""
+Demand-driven conversation context for agent nodes.
+
+Loading recent history and summarizing it costs a database round trip and
+possibly an LLM call, and most routes (safety block, SQL, keyword-routed
+tools) never look at it. Nodes that do need it are decorated with
+``uses_conversation_context``: the decorator starts loading the context as a
+background task when the node is entered, so it overlaps with the node's own
+pre-work, and the node awaits ``conversation_context()`` at the point it
+actually needs the summary. Routing always sees the plain user message.
+General responses, job creation and job search use the summary today.
+"""
+
+import asyncio
+from contextvars import ContextVar
+from functools import wraps
+from typing import Optional
+
+from core.tracing import span
+from agent.utils.session import load_recent_messages, summarize_messages_if_needed
+
+# Messages loaded for the summary and how many of them trigger one
+CONTEXT_HISTORY_LIMIT = 12
+CONTEXT_SUMMARY_THRESHOLD = 6
+# Prompt text used when there is no summary (short or new conversation, or loading failed)
+NO_CONTEXT = "(no earlier messages)"
+
+_context_task: ContextVar[Optional[asyncio.Task]] = ContextVar("conversation_context_task", default=None)
+
+
+async def load_conversation_context(conversation_id: str) -> Optional[str]:
+    """Short summary of the recent conversation, or ``None`` when it is still short."""
+    from agent.utils.llm import get_llm
+
+    with span("agent.context"):
+        recent = await load_recent_messages(conversation_id, limit=CONTEXT_HISTORY_LIMIT)
+        # Summarizing is a blocking LLM call; keep it off the event loop
+        return await asyncio.to_thread(
+            summarize_messages_if_needed, conversation_id, recent, CONTEXT_SUMMARY_THRESHOLD, get_llm()
+        )
+
+
+async def conversation_context() -> Optional[str]:
+    """Await the context started for the current node (``None`` outside a context-using node or on failure)."""
+    task = _context_task.get()
+    if task is None:
+        return None
+    try:
+        return await task
+    except Exception:
+        return None
+
+
+def uses_conversation_context(node):
+    """Mark an async graph node as needing conversation context and prefetch it while the node runs."""
+    @wraps(node)
+    async def wrapper(state):
+        conversation_id = state.get("conversation_id")
+        task = asyncio.ensure_future(load_conversation_context(conversation_id)) if conversation_id else None
+        token = _context_task.set(task)
+        try:
+            return await node(state)
+        finally:
+            _context_task.reset(token)
+            if task is not None and not task.done():
+                task.cancel()
+
+    wrapper.uses_conversation_context = True
+    return wrapper
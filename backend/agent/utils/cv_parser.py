@@ -2,14 +2,58 @@
 CV/Resume Text Extraction Utility
 
 This module provides functions to download and extract text from PDF CVs
-stored in Supabase storage.
+stored in Supabase storage, and to keep the extracted text on the
+application row (``applications.cv_text``) for rankings and job
+recommendations.
 """
 
+import asyncio
 import io
+import logging
 import httpx
 from typing import Optional
 from PyPDF2 import PdfReader
 
+from core import db
+from core.config import get_supabase_client
+from core.tracing import span
+
+logger = logging.getLogger("recruitment.cv_parser")
+
+
+async def fetch_cv_text(cv_url: str, max_chars: int = 8000) -> str:
+    """Download a PDF CV and extract its text (raises if it cannot be downloaded or parsed)."""
+    with span("cv.download"):
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            response = await client.get(cv_url)
+            response.raise_for_status()
+            pdf_bytes = response.content
+    return extract_cv_text(pdf_bytes, max_chars)
+
+
+async def save_cv_text(application_id: str, cv_text: str):
+    """Store extracted CV text on the application row."""
+    supabase = get_supabase_client()
+    await db.execute(
+        supabase.table("applications").update({"cv_text": cv_text}).eq("id", application_id),
+        "applications",
+        "update",
+    )
+
+
+async def store_uploaded_cv_text(application_id: str, cv_bytes: bytes) -> str:
+    """Extract the text of a just-uploaded CV and store it; returns ``""`` if either step failed."""
+    try:
+        cv_text = await asyncio.to_thread(extract_cv_text, cv_bytes)
+    except Exception as e:
+        logger.warning("Extracting the CV of application %s failed: %s", application_id, e)
+        return ""
+    try:
+        await save_cv_text(application_id, cv_text)
+    except Exception as e:
+        logger.warning("Storing the CV text of application %s failed: %s", application_id, e)
+    return cv_text
+
 
 async def download_and_extract_cv_text(cv_url: str, max_chars: int = 8000) -> str:
     """
@@ -26,48 +70,53 @@ async def download_and_extract_cv_text(cv_url: str, max_chars: int = 8000) -> st
         return "No CV provided"
     
     try:
-        # Download the PDF file
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(cv_url)
-            response.raise_for_status()
-            pdf_bytes = response.content
-        
-        # Extract text from PDF
-        pdf_file = io.BytesIO(pdf_bytes)
-        reader = PdfReader(pdf_file)
-        
-        text_parts = []
-        total_chars = 0
-        
-        for page in reader.pages:
-            page_text = page.extract_text() or ""
-            text_parts.append(page_text)
-            total_chars += len(page_text)
-            
-            # Stop if we've extracted enough text
-            if total_chars >= max_chars:
-                break
-        
-        full_text = "\n".join(text_parts)
-        
-        # Truncate if too long
-        if len(full_text) > max_chars:
-            full_text = full_text[:max_chars] + "..."
-        
-        # Clean up the text
-        full_text = _clean_cv_text(full_text)
-        
-        if not full_text.strip():
-            return "CV appears to be empty or could not be parsed (possibly scanned image)"
-        
-        return full_text
-    
+        return await fetch_cv_text(cv_url, max_chars)
     except httpx.HTTPStatusError as e:
         return f"Could not download CV: HTTP {e.response.status_code}"
     except Exception as e:
         return f"Could not extract CV text: {str(e)}"
 
 
+def extract_cv_text(pdf_bytes: bytes, max_chars: int = 8000) -> str:
+    """
+    Extract text content from PDF bytes (raises if the file cannot be parsed).
+    
+    Args:
+        pdf_bytes: Raw PDF file content
+        max_chars: Maximum characters to extract (to avoid token limits)
+    
+    Returns:
+        Extracted text from the CV, or a note when no text could be found
+    """
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+    
+    text_parts = []
+    total_chars = 0
+    
+    for page in reader.pages:
+        page_text = page.extract_text() or ""
+        text_parts.append(page_text)
+        total_chars += len(page_text)
+        
+        # Stop if we've extracted enough text
+        if total_chars >= max_chars:
+            break
+    
+    full_text = "\n".join(text_parts)
+    
+    # Truncate if too long
+    if len(full_text) > max_chars:
+        full_text = full_text[:max_chars] + "..."
+    
+    # Clean up the text
+    full_text = _clean_cv_text(full_text)
+    
+    if not full_text.strip():
+        return "CV appears to be empty or could not be parsed (possibly scanned image)"
+    
+    return full_text
+
+
 def _clean_cv_text(text: str) -> str:
     """Clean up extracted CV text by removing excessive whitespace."""
     import re
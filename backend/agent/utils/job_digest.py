@@ -0,0 +1,137 @@
+"""
+Job requirement digests.
+
+A digest is a compact, structured checklist (must-have skills, years of
+experience, location constraints, ...) extracted once per job version and
+reused by every ATS scoring prompt for that job. Digests are cached in
+memory and persisted on the job row so they survive restarts.
+"""
+
+import hashlib
+import json
+import re
+from typing import Any, Dict, Optional
+
+from core.config import get_supabase_client
+from core import db
+from agent.prompts.budget import format_prompt_within_budget, trim_to_tokens
+from agent.utils.llm import invoke_llm
+
+# In-memory digest cache (job_id -> {"version": str, "digest": dict})
+DIGEST_CACHE: dict[str, dict] = {}
+
+DIGEST_LIST_FIELDS = ("must_have_skills", "nice_to_have_skills", "key_responsibilities")
+DIGEST_TEXT_FIELDS = ("education", "location_constraints")
+
+
+def job_version(job: Dict[str, Any]) -> str:
+    """Stable hash of the job fields that influence scoring."""
+    parts = [str(job.get(field) or "").strip() for field in ("title", "requirements", "description", "location")]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def _normalize_digest(raw: Dict[str, Any]) -> Dict[str, Any]:
+    digest: Dict[str, Any] = {}
+    for field in DIGEST_LIST_FIELDS:
+        values = raw.get(field) or []
+        if isinstance(values, str):
+            values = [value.strip() for value in values.split(",")]
+        digest[field] = [str(value).strip() for value in values if str(value).strip()]
+
+    years = raw.get("min_years_experience")
+    try:
+        digest["min_years_experience"] = int(float(years)) if years is not None else None
+    except (TypeError, ValueError):
+        digest["min_years_experience"] = None
+
+    for field in DIGEST_TEXT_FIELDS:
+        value = raw.get(field)
+        digest[field] = str(value).strip() if value and str(value).strip().lower() != "null" else None
+    return digest
+
+
+def extract_job_digest(job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Ask the LLM for a structured requirements checklist. Returns None on failure."""
+    prompt = format_prompt_within_budget(
+        "extract_job_digest.md",
+        job_title=job.get("title") or "",
+        job_location=job.get("location") or "",
+        job_requirements=job.get("requirements") or "",
+        job_description=job.get("description") or "",
+    )
+    try:
+        response = invoke_llm(prompt, "extract_job_digest", cache=True)
+        json_match = re.search(r'\{.*\}', response.content or "", re.DOTALL)
+        if not json_match:
+            return None
+        digest = _normalize_digest(json.loads(json_match.group()))
+    except Exception:
+        return None
+
+    if not digest["must_have_skills"] and not digest["key_responsibilities"]:
+        return None
+    return digest
+
+
+async def _persist_digest(job_id: str, version: str, digest: Dict[str, Any]):
+    """Store the digest on the job row (best-effort)."""
+    try:
+        supabase = get_supabase_client()
+        await db.execute(supabase.table("jobs").update({
+            "requirements_digest": digest,
+            "requirements_digest_version": version,
+        }).eq("id", job_id), "jobs", "update")
+    except Exception:
+        pass
+
+
+async def get_job_digest(job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the digest for the current version of ``job``, extracting it if needed."""
+    job_id = str(job.get("id") or "")
+    version = job_version(job)
+
+    cached = DIGEST_CACHE.get(job_id)
+    if cached and cached["version"] == version:
+        return cached["digest"]
+
+    stored = job.get("requirements_digest")
+    if stored and job.get("requirements_digest_version") == version:
+        digest = _normalize_digest(stored if isinstance(stored, dict) else json.loads(stored))
+    else:
+        digest = extract_job_digest(job)
+        if digest is None:
+            return None
+        if job_id:
+            await _persist_digest(job_id, version, digest)
+
+    if job_id:
+        DIGEST_CACHE[job_id] = {"version": version, "digest": digest}
+    return digest
+
+
+def format_job_digest(job: Dict[str, Any], digest: Optional[Dict[str, Any]]) -> str:
+    """Render a digest as the compact checklist used in scoring prompts.
+
+    Falls back to trimmed raw requirements and description when no digest
+    could be extracted.
+    """
+    if not digest:
+        requirements = trim_to_tokens(job.get("requirements") or "", 400)
+        description = trim_to_tokens(job.get("description") or "", 200)
+        return f"Requirements: {requirements}\nDescription: {description}"
+
+    lines = []
+    if digest.get("must_have_skills"):
+        lines.append(f"Must-have skills: {', '.join(digest['must_have_skills'])}")
+    if digest.get("nice_to_have_skills"):
+        lines.append(f"Nice-to-have skills: {', '.join(digest['nice_to_have_skills'])}")
+    if digest.get("min_years_experience") is not None:
+        lines.append(f"Minimum experience: {digest['min_years_experience']} years")
+    if digest.get("education"):
+        lines.append(f"Education: {digest['education']}")
+    if digest.get("location_constraints"):
+        lines.append(f"Location constraints: {digest['location_constraints']}")
+    if digest.get("key_responsibilities"):
+        lines.append(f"Key responsibilities: {'; '.join(digest['key_responsibilities'])}")
+    return "\n".join(lines)
+
@@ -0,0 +1,287 @@
+"""
+Job recommendations for applicants from their stored CV text.
+
+Open jobs are vectorized with hashed TF-IDF (tokens hashed into
+``JOB_RECOMMENDER_FEATURES`` buckets, no vocabulary or external model) and
+kept as rows of one dense float32 matrix of sublinear term frequencies.
+A recommendation is a single matrix-vector product: ``tf @ (cv_tf * idf**2)``
+divided by the job and CV norms gives the cosine similarity of the
+IDF-weighted vectors for every job at once.
+
+Job writes update the index in place (``JobVectorIndex.upsert`` and
+``remove``, through the ``core.cache.on_job_write`` listener this module
+registers on import) in O(features): the row, the document frequencies
+and that row's norm. IDF weights and all norms are recomputed lazily once
+``IDF_REFRESH_FRACTION`` of the catalogue has changed. A full rebuild from
+the ``jobs`` table runs on first use and every
+``JOB_RECOMMENDER_REFRESH_SECONDS`` to pick up writes made by other workers.
+"""
+
+import asyncio
+import time
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from core import db
+from core.cache import on_job_write
+from core.config import Config, get_supabase_client
+from agent.utils.prescreen import tokenize
+
+# Job fields vectorized for matching and returned with recommendations
+JOB_TEXT_FIELDS = ("title", "requirements", "description")
+JOB_COLUMNS = "id, title, description, requirements, location, salary, created_by, created_at, status"
+
+# Share of the catalogue that may change before IDF weights and job norms are recomputed
+IDF_REFRESH_FRACTION = 0.1
+
+
+def _is_open(job: Dict[str, Any]) -> bool:
+    return (job.get("status") or "open") != "closed"
+
+
+class JobVectorIndex:
+    """Hashed TF-IDF vectors of open jobs with incremental updates."""
+
+    def __init__(self, n_features: int):
+        self.n_features = n_features
+        self._tf = np.zeros((0, n_features), dtype=np.float32)  # rows beyond len(_job_ids) are spare capacity
+        self._df = np.zeros(n_features, dtype=np.float32)
+        self._job_ids: List[str] = []
+        self._jobs: List[Dict[str, Any]] = []
+        self._rows: Dict[str, int] = {}
+        # Squared IDF weights and IDF-weighted row norms (same capacity as _tf); None until refreshed
+        self._idf_squared: Optional[np.ndarray] = None
+        self._norms = np.zeros(0, dtype=np.float32)
+        self._writes_since_refresh = 0
+        self.built_at: Optional[float] = None
+        # Writes seen while a rebuild is reading the table, replayed on top of it
+        self._pending: Optional[Dict[str, Optional[Dict[str, Any]]]] = None
+
+    def __len__(self) -> int:
+        return len(self._job_ids)
+
+    def vectorize(self, text: str) -> np.ndarray:
+        """Sublinear term frequencies of ``text`` over the hashed feature space."""
+        tokens = tokenize(text)
+        counts = np.zeros(self.n_features, dtype=np.float32)
+        if tokens:
+            buckets = [zlib.crc32(token.encode("utf-8")) % self.n_features for token in tokens]
+            np.add.at(counts, np.array(buckets), 1.0)
+        return np.log1p(counts, out=counts)
+
+    def _job_vector(self, job: Dict[str, Any]) -> np.ndarray:
+        return self.vectorize("\n".join(str(job.get(field) or "") for field in JOB_TEXT_FIELDS))
+
+    def _refresh_weights(self):
+        idf = np.log((1.0 + len(self)) / (1.0 + self._df)) + 1.0
+        self._idf_squared = (idf * idf).astype(np.float32)
+        tf = self._tf[:len(self)]
+        self._norms[:len(self)] = np.sqrt(np.einsum("ij,ij,j->i", tf, tf, self._idf_squared))
+        self._writes_since_refresh = 0
+
+    def _after_write(self):
+        self._writes_since_refresh += 1
+        if self._writes_since_refresh > max(16, IDF_REFRESH_FRACTION * len(self)):
+            self._idf_squared = None
+
+    def begin_build(self):
+        self._pending = {}
+
+    def cancel_build(self):
+        self._pending = None
+
+    def vectorize_jobs(self, jobs: Iterable[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], np.ndarray]:
+        """Open jobs among ``jobs`` and their term-frequency matrix (does not touch the index)."""
+        open_jobs = [job for job in jobs if _is_open(job)]
+        tf = np.zeros((max(len(open_jobs), 16), self.n_features), dtype=np.float32)
+        for row, job in enumerate(open_jobs):
+            tf[row] = self._job_vector(job)
+        return open_jobs, tf
+
+    def build(self, jobs: Iterable[Dict[str, Any]], vectorized: Optional[Tuple[List[Dict[str, Any]], np.ndarray]] = None):
+        """Replace the index with ``jobs`` (closed ones are skipped), then replay writes seen since ``begin_build``.
+
+        ``vectorized`` is the result of ``vectorize_jobs(jobs)`` when it was computed off the event loop.
+        """
+        pending, self._pending = self._pending or {}, None
+        open_jobs, self._tf = vectorized or self.vectorize_jobs(jobs)
+        self._norms = np.zeros(self._tf.shape[0], dtype=np.float32)
+        self._job_ids = [str(job["id"]) for job in open_jobs]
+        self._jobs = list(open_jobs)
+        self._rows = {job_id: row for row, job_id in enumerate(self._job_ids)}
+        self._df = (self._tf[:len(open_jobs)] > 0).sum(axis=0).astype(np.float32)
+        self._idf_squared = None
+        self.built_at = time.monotonic()
+        for job_id, job in pending.items():
+            if job is None:
+                self.remove(job_id)
+            else:
+                self.upsert(job)
+
+    def upsert(self, job: Dict[str, Any]):
+        """Add or re-vectorize one job; closing a job removes it."""
+        job_id = str(job.get("id") or "")
+        if not job_id:
+            return
+        if self._pending is not None:
+            self._pending[job_id] = job
+        if self.built_at is None:
+            return
+        if not _is_open(job):
+            self.remove(job_id)
+            return
+
+        vector = self._job_vector(job)
+        row = self._rows.get(job_id)
+        if row is None:
+            row = len(self._job_ids)
+            if row == self._tf.shape[0]:
+                grown = np.zeros((max(16, row * 2), self.n_features), dtype=np.float32)
+                grown[:row] = self._tf[:row]
+                self._tf = grown
+                self._norms = np.resize(self._norms, grown.shape[0])
+            self._job_ids.append(job_id)
+            self._jobs.append(job)
+            self._rows[job_id] = row
+        else:
+            self._df -= self._tf[row] > 0
+            self._jobs[row] = job
+        self._tf[row] = vector
+        self._df += vector > 0
+        if self._idf_squared is not None:
+            self._norms[row] = np.sqrt((vector * vector) @ self._idf_squared)
+        self._after_write()
+
+    def remove(self, job_id: str):
+        """Drop one job, moving the last row into its slot."""
+        job_id = str(job_id)
+        if self._pending is not None:
+            self._pending[job_id] = None
+        row = self._rows.pop(job_id, None)
+        if row is None:
+            return
+        self._df -= self._tf[row] > 0
+        last = len(self._job_ids) - 1
+        if row != last:
+            self._tf[row] = self._tf[last]
+            self._norms[row] = self._norms[last]
+            self._job_ids[row] = self._job_ids[last]
+            self._jobs[row] = self._jobs[last]
+            self._rows[self._job_ids[row]] = row
+        self._tf[last] = 0.0
+        self._job_ids.pop()
+        self._jobs.pop()
+        self._after_write()
+
+    def top_k(self, text: str, k: int, exclude: Iterable[str] = ()) -> List[Tuple[Dict[str, Any], float]]:
+        """The ``k`` open jobs most similar to ``text`` as (job, cosine similarity) pairs, best first."""
+        count = len(self)
+        query = self.vectorize(text)
+        if not count or k <= 0 or not query.any():
+            return []
+
+        if self._idf_squared is None:
+            self._refresh_weights()
+        squared_idf = self._idf_squared
+        query_norm = float(np.sqrt((query * query) @ squared_idf))
+        denominator = self._norms[:count] * query_norm
+        scores = np.divide(
+            self._tf[:count] @ (query * squared_idf),
+            denominator,
+            out=np.zeros(count, dtype=np.float32),
+            where=denominator > 0,
+        )
+
+        excluded = [row for row in (self._rows.get(str(job_id)) for job_id in exclude) if row is not None]
+        scores[excluded] = -1.0
+        wanted = min(k + len(excluded), count)
+        candidates = np.argpartition(-scores, wanted - 1)[:wanted]
+        ranked = candidates[np.argsort(-scores[candidates])]
+        return [(self._jobs[row], float(scores[row])) for row in ranked if scores[row] > 0][:k]
+
+
+job_index = JobVectorIndex(Config.JOB_RECOMMENDER_FEATURES)
+_build_lock = asyncio.Lock()
+
+
+@on_job_write
+def _apply_job_write(job: Optional[Dict[str, Any]], removed_job_id: Optional[str]):
+    # Keep recommendation vectors current without waiting for the periodic rebuild
+    if job is not None:
+        job_index.upsert(job)
+    if removed_job_id:
+        job_index.remove(removed_job_id)
+
+
+def _is_fresh() -> bool:
+    built_at = job_index.built_at
+    return built_at is not None and time.monotonic() - built_at < Config.JOB_RECOMMENDER_REFRESH_SECONDS
+
+
+async def ensure_job_index() -> JobVectorIndex:
+    """Build the index on first use and rebuild it once it is older than ``JOB_RECOMMENDER_REFRESH_SECONDS``."""
+    if _is_fresh() or (job_index.built_at is not None and _build_lock.locked()):
+        # Serve the previous vectors while another request rebuilds them
+        return job_index
+    async with _build_lock:
+        if not _is_fresh():
+            job_index.begin_build()
+            try:
+                supabase = get_supabase_client()
+                response = await db.execute(supabase.table("jobs").select(JOB_COLUMNS), "jobs", "select")
+                jobs = response.data or []
+                # Vectorizing a large catalogue takes a while; writes meanwhile are replayed by build()
+                vectorized = await asyncio.to_thread(job_index.vectorize_jobs, jobs)
+            except Exception:
+                job_index.cancel_build()
+                raise
+            job_index.build(jobs, vectorized)
+    return job_index
+
+
+async def _backfill_cv_text(applications: List[Dict[str, Any]]) -> Optional[str]:
+    """Extract and store the text of the latest CV for applications made before CV text was stored."""
+    # Loaded on first use: PDF parsing is only needed when no text is stored yet
+    from agent.utils.cv_parser import fetch_cv_text, save_cv_text
+
+    latest = next((application for application in applications if application.get("cv_url")), None)
+    if latest is None:
+        return None
+    try:
+        cv_text = await fetch_cv_text(latest["cv_url"])
+    except Exception:
+        return None
+    try:
+        await save_cv_text(latest["id"], cv_text)
+    except Exception:
+        pass
+    return cv_text
+
+
+async def recommend_jobs(applicant_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+    """Open jobs closest to the applicant's latest stored CV, skipping jobs they applied to.
+
+    Each job row gets a ``score`` (cosine similarity in [0, 1]). When none of
+    the applicant's applications has CV text yet, the latest CV is extracted
+    and stored once; returns an empty list if that fails too.
+    """
+    supabase = get_supabase_client()
+    query = (
+        supabase.table("applications")
+        .select("id, job_id, cv_url, cv_text, created_at")
+        .eq("applicant_id", applicant_id)
+        .order("created_at", desc=True)
+    )
+    response = await db.execute(query, "applications", "select")
+    applications = response.data or []
+    cv_text = next((application["cv_text"] for application in applications if application.get("cv_text")), None)
+    if not cv_text:
+        cv_text = await _backfill_cv_text(applications)
+    if not cv_text:
+        return []
+
+    index = await ensure_job_index()
+    applied = {str(application["job_id"]) for application in applications}
+    return [{**job, "score": round(score, 4)} for job, score in index.top_k(cv_text, limit, exclude=applied)]
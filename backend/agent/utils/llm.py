@@ -1,6 +1,91 @@
-from langchain_groq import ChatGroq
+import time
+from collections import defaultdict
+
 from core.config import Config
+from core.metrics import LLM_CALLS, LLM_CALL_SECONDS, LLM_TOKENS
+from core.tracing import span
+from agent.prompts.budget import count_tokens
+from agent.prompts.loader import get_prompt_version
+from agent.utils.llm_cache import cache_key, get_llm_cache, record_cache_result
+
+# Shared LLM instance, created on first use (tests and benchmarks may assign a stand-in)
+llm = None
+
+
+def get_llm():
+    """The shared chat model; importing langchain_groq is deferred until an LLM is needed."""
+    global llm
+    if llm is None:
+        from langchain_groq import ChatGroq
+
+        llm = ChatGroq(api_key=Config.GROQ_API_KEY, model="llama-3.3-70b-versatile")
+    return llm
+
+# Token usage per prompt name (prompt name -> counters)
+LLM_USAGE: defaultdict[str, dict] = defaultdict(
+    lambda: {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0}
+)
+
+
+def record_usage(prompt_name: str, prompt: str, response) -> dict:
+    """Record prompt and completion token counts for one LLM call.
+
+    Uses the provider-reported usage when available and falls back to the
+    local token estimate otherwise.
+    """
+    usage = getattr(response, "usage_metadata", None) or {}
+    prompt_tokens = usage.get("input_tokens") or count_tokens(prompt)
+    completion_tokens = usage.get("output_tokens") or count_tokens(getattr(response, "content", "") or "")
+
+    stats = LLM_USAGE[prompt_name]
+    stats["calls"] += 1
+    stats["prompt_tokens"] += prompt_tokens
+    stats["completion_tokens"] += completion_tokens
+    LLM_TOKENS.inc(prompt_name, "prompt", amount=prompt_tokens)
+    LLM_TOKENS.inc(prompt_name, "completion", amount=completion_tokens)
+    return {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens}
+
+
+def _timed_invoke(client, prompt: str, prompt_name: str):
+    """Call the model, recording latency and outcome under ``prompt_name``."""
+    start = time.perf_counter()
+    try:
+        with span(f"llm.{prompt_name}"):
+            response = client.invoke(prompt)
+    except Exception:
+        LLM_CALLS.inc(prompt_name, "error")
+        raise
+    finally:
+        LLM_CALL_SECONDS.observe(time.perf_counter() - start, prompt_name)
+    LLM_CALLS.inc(prompt_name, "ok")
+    record_usage(prompt_name, prompt, response)
+    return response
+
+
+def invoke_llm(prompt: str, prompt_name: str = "adhoc", client=None, cache: bool = False):
+    """Invoke the shared LLM (or ``client``) and record token usage under ``prompt_name``.
+
+    With ``cache=True`` the response is looked up in (and stored to) the disk
+    cache, keyed on the model, the version of ``<prompt_name>.md`` and the
+    rendered prompt. Only opt in for deterministic extraction prompts.
+    """
+    client = client or get_llm()
+    store = get_llm_cache() if cache else None
+    if store is None:
+        return _timed_invoke(client, prompt, prompt_name)
+
+    model = getattr(client, "model_name", None) or type(client).__name__
+    key = cache_key(model, prompt_name, get_prompt_version(f"{prompt_name}.md"), prompt)
+    cached = store.get(key)
+    record_cache_result(prompt_name, cached is not None)
+    if cached is not None:
+        LLM_CALLS.inc(prompt_name, "cache_hit")
+        from langchain_core.messages import AIMessage
 
-# Shared LLM instance
-llm = ChatGroq(api_key=Config.GROQ_API_KEY, model="llama-3.3-70b-versatile")
+        return AIMessage(content=cached)
 
+    response = _timed_invoke(client, prompt, prompt_name)
+    content = getattr(response, "content", None)
+    if isinstance(content, str) and content.strip():
+        store.set(key, prompt_name, model, content)
+    return response
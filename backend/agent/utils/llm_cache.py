@@ -0,0 +1,128 @@
+"""
+Disk-backed LLM response cache.
+
+Deterministic extraction prompts (filters, job details, SQL intent, job
+digests) are answered from a local SQLite store keyed on the model name,
+the prompt template version and a hash of the rendered prompt. Entries are
+evicted least-recently-used once the store exceeds its size limit. Call
+sites opt in via ``invoke_llm(..., cache=True)``.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Optional
+
+from core.config import Config
+
+# Hit/miss counters per prompt name
+CACHE_STATS: defaultdict[str, dict] = defaultdict(lambda: {"hits": 0, "misses": 0})
+
+
+def cache_key(model: str, prompt_name: str, prompt_version: str, prompt: str) -> str:
+    """Cache key for one rendered prompt."""
+    prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    return f"{model}:{prompt_name}:{prompt_version}:{prompt_hash}"
+
+
+class LLMResponseCache:
+    """SQLite store of LLM responses with size-based LRU eviction."""
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                prompt_name TEXT NOT NULL,
+                model TEXT NOT NULL,
+                content TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_access ON llm_cache(last_access)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT content FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+            return row[0]
+
+    def set(self, key: str, prompt_name: str, model: str, content: str):
+        now = time.time()
+        size = len(key) + len(content.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, prompt_name, model, content, size, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, prompt_name, model, content, size, now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Drop least recently used entries until the store fits ``max_bytes``."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT key, size FROM llm_cache ORDER BY last_access ASC").fetchall()
+        expired = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            expired.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM llm_cache WHERE key = ?", expired)
+
+    def size_bytes(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Get or create the process-wide cache (None when disabled)."""
+    global _cache
+    if not Config.LLM_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LLMResponseCache(Config.LLM_CACHE_PATH, Config.LLM_CACHE_MAX_BYTES)
+    return _cache
+
+
+def record_cache_result(prompt_name: str, hit: bool):
+    CACHE_STATS[prompt_name]["hits" if hit else "misses"] += 1
+
+
+def cache_hit_rates() -> dict[str, float]:
+    """Hit rate per prompt name."""
+    return {
+        prompt_name: stats["hits"] / (stats["hits"] + stats["misses"])
+        for prompt_name, stats in CACHE_STATS.items()
+        if stats["hits"] + stats["misses"]
+    }
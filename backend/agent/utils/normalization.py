@@ -6,12 +6,12 @@ SYNONYMS = {
     "applicant": ["candidate", "person"]
 }
 
+# One compiled pass over the text instead of a re.sub per variant; no canonical
+# term is itself a variant, so this matches the old sequential replacement.
+_CANONICAL = {variant: canonical for canonical, variants in SYNONYMS.items() for variant in variants}
+_SYNONYM_PATTERN = re.compile(r"\b(?:" + "|".join(re.escape(variant) for variant in _CANONICAL) + r")\b")
+
 
 def normalize_synonyms(text: str) -> str:
     """Replace simple synonyms with canonical terms to help routing and tooling."""
-    lower = text.lower()
-    for canonical, variants in SYNONYMS.items():
-        for v in variants:
-            lower = re.sub(rf"\b{re.escape(v)}\b", canonical, lower)
-    return lower
-
+    return _SYNONYM_PATTERN.sub(lambda match: _CANONICAL[match.group(0)], text.lower())
@@ -0,0 +1,65 @@
+"""
+Per-turn message preprocessing shared by the router and the graph nodes.
+
+``run_agent`` builds one ``PreprocessedMessage`` for the incoming message and
+stores it in ``AgentState["preprocessed"]``; routing and the nodes read the
+normalized text, keyword hits and extracted job ids from it instead of
+lowercasing and rescanning the message themselves.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple
+
+from agent.utils.normalization import normalize_synonyms
+from agent.utils.safety import DANGEROUS_OPERATION_KEYWORDS
+from agent.utils.session import is_follow_up_message
+
+# "job_id: abc-123", "job id abc-123" (matched on the raw message, before synonyms rewrite "job")
+_JOB_ID_PATTERN = re.compile(r"job[_\s]?id[:\s]+([a-f0-9-]+)", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class PreprocessedMessage:
+    """Everything routing and the nodes derive from one user message."""
+
+    raw: str
+    text: str  # lowercased with synonyms normalized (what the nodes see as state["message"])
+    dangerous_keywords: frozenset
+    job_ids: Tuple[str, ...]
+    is_follow_up: bool
+
+    @property
+    def is_dangerous(self) -> bool:
+        return bool(self.dangerous_keywords)
+
+    @property
+    def job_id(self) -> Optional[str]:
+        return self.job_ids[0] if self.job_ids else None
+
+    def has_any(self, phrases: Iterable[str]) -> bool:
+        """Whether any phrase occurs in the normalized text (substring match, like the old checks)."""
+        return any(phrase in self.text for phrase in phrases)
+
+
+@lru_cache(maxsize=1024)
+def preprocess_message(message: str) -> PreprocessedMessage:
+    """Normalize and scan ``message`` once; repeated calls with the same text are served from a cache."""
+    text = normalize_synonyms(message)
+    return PreprocessedMessage(
+        raw=message,
+        text=text,
+        dangerous_keywords=frozenset(keyword for keyword in DANGEROUS_OPERATION_KEYWORDS if keyword in text),
+        job_ids=tuple(_JOB_ID_PATTERN.findall(message)),
+        is_follow_up=is_follow_up_message(text),
+    )
+
+
+def get_preprocessed(state) -> PreprocessedMessage:
+    """The turn's ``PreprocessedMessage``, built from ``state["message"]`` if ``run_agent`` did not set one."""
+    preprocessed = state.get("preprocessed")
+    if preprocessed is None:
+        preprocessed = preprocess_message(state.get("message", ""))
+        state["preprocessed"] = preprocessed
+    return preprocessed
@@ -0,0 +1,104 @@
+"""
+Local applicant pre-screen.
+
+Scores every applicant against a job in one vectorized NumPy pass (TF-IDF
+cosine similarity over the job's vocabulary blended with must-have skill
+coverage). Used to produce an instant provisional ranking and to decide
+which applicants are worth a full LLM analysis.
+"""
+
+import re
+from typing import List, Optional
+
+import numpy as np
+
+_WORD_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+STOP_WORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have",
+    "in", "is", "it", "of", "on", "or", "our", "that", "the", "their", "this", "to",
+    "we", "will", "with", "you", "your", "years", "year", "experience", "role",
+    "team", "work", "working", "strong", "ability", "skills", "knowledge",
+})
+
+# Weight of must-have skill coverage vs. TF-IDF similarity when both are available
+SKILL_COVERAGE_WEIGHT = 0.6
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercase word tokens with stop words removed (keeps terms like c++, c#, node.js)."""
+    if not text:
+        return []
+    return [token for token in _WORD_PATTERN.findall(text.lower()) if token not in STOP_WORDS]
+
+
+def _count_matrix(documents: List[List[str]], vocabulary: dict[str, int]) -> np.ndarray:
+    """Term-count matrix (documents x vocabulary) built with one scatter-add."""
+    counts = np.zeros((len(documents), len(vocabulary)), dtype=np.float32)
+    rows: List[int] = []
+    cols: List[int] = []
+    for row, tokens in enumerate(documents):
+        for token in tokens:
+            col = vocabulary.get(token)
+            if col is not None:
+                rows.append(row)
+                cols.append(col)
+    if rows:
+        np.add.at(counts, (np.array(rows), np.array(cols)), 1.0)
+    return counts
+
+
+def _skill_patterns(skills: List[str]) -> List[re.Pattern]:
+    return [re.compile(rf"(?<![a-z0-9]){re.escape(skill.lower())}(?![a-z0-9])") for skill in skills]
+
+
+def matched_skills(document: str, skills: List[str]) -> List[str]:
+    """Skills from ``skills`` that are mentioned in ``document``."""
+    lowered = (document or "").lower()
+    return [skill for skill, pattern in zip(skills, _skill_patterns(skills)) if pattern.search(lowered)]
+
+
+def skill_coverage(documents: List[str], skills: List[str]) -> np.ndarray:
+    """Fraction of ``skills`` mentioned in each document (documents x skills averaged)."""
+    if not skills or not documents:
+        return np.zeros(len(documents), dtype=np.float32)
+    patterns = _skill_patterns(skills)
+    lowered = [document.lower() for document in documents]
+    hits = np.array(
+        [[bool(pattern.search(document)) for pattern in patterns] for document in lowered],
+        dtype=np.float32,
+    )
+    return hits.mean(axis=1)
+
+
+def prescreen_scores(job_text: str, documents: List[str], required_skills: Optional[List[str]] = None) -> np.ndarray:
+    """Score ``documents`` against ``job_text``; returns one value in [0, 1] per document."""
+    if not documents:
+        return np.zeros(0, dtype=np.float32)
+
+    job_tokens = tokenize(job_text)
+    vocabulary = {term: index for index, term in enumerate(dict.fromkeys(job_tokens))}
+    if not vocabulary:
+        similarity = np.zeros(len(documents), dtype=np.float32)
+    else:
+        counts = _count_matrix([tokenize(document) for document in documents], vocabulary)
+        job_counts = _count_matrix([job_tokens], vocabulary)[0]
+
+        # Smoothed IDF over the applicant pool, sublinear TF
+        document_frequency = (counts > 0).sum(axis=0)
+        idf = np.log((1.0 + len(documents)) / (1.0 + document_frequency)) + 1.0
+        weights = np.log1p(counts) * idf
+        job_vector = np.log1p(job_counts) * idf
+
+        norms = np.linalg.norm(weights, axis=1) * np.linalg.norm(job_vector)
+        similarity = np.divide(
+            weights @ job_vector,
+            norms,
+            out=np.zeros(len(documents), dtype=np.float32),
+            where=norms > 0,
+        )
+
+    if required_skills:
+        coverage = skill_coverage(documents, required_skills)
+        return SKILL_COVERAGE_WEIGHT * coverage + (1.0 - SKILL_COVERAGE_WEIGHT) * similarity
+    return similarity
@@ -1,6 +1,11 @@
 """Safety utilities for blocking dangerous operations."""
-import re
-from typing import List
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import sqlparse
+from sqlparse import tokens as T
 
 
 # Dangerous SQL keywords that should be blocked
@@ -15,6 +20,32 @@ DANGEROUS_OPERATION_KEYWORDS = [
     "drop", "truncate", "alter", "clear", "wipe", "erase"
 ]
 
+# Tables the SQL node may read from
+ALLOWED_SQL_TABLES = frozenset({"jobs", "applications", "users", "chat_messages"})
+
+# Verdicts kept in memory, keyed by a hash of the query text
+SQL_VERDICT_CACHE_SIZE = 512
+
+_DANGEROUS_SQL_KEYWORDS = frozenset(DANGEROUS_SQL_KEYWORDS)
+_TABLE_KEYWORDS = ("FROM", "JOIN")
+# Keywords that close a FROM clause at the current nesting level
+_FROM_CLAUSE_END = frozenset({
+    "WHERE", "GROUP BY", "ORDER BY", "HAVING", "LIMIT", "OFFSET", "FETCH", "WINDOW", "FOR", "RETURNING",
+})
+
+
+@dataclass(frozen=True)
+class SQLVerdict:
+    """Outcome of validating one SQL query."""
+
+    is_safe: bool
+    error: str = ""
+    tables: Tuple[str, ...] = ()
+    dangerous_keywords: frozenset = frozenset()
+
+
+_verdicts: "OrderedDict[str, SQLVerdict]" = OrderedDict()
+
 
 def contains_dangerous_keywords(message: str) -> bool:
     """Check if message contains dangerous operation keywords."""
@@ -22,44 +53,114 @@ def contains_dangerous_keywords(message: str) -> bool:
     return any(keyword in message_lower for keyword in DANGEROUS_OPERATION_KEYWORDS)
 
 
+def _identifier(token) -> Optional[str]:
+    """Unquoted names fold to lower case; quoted ones keep their case, as in Postgres."""
+    if token.ttype in T.String.Symbol:
+        return token.value.strip('"')
+    if token.ttype in T.Name:
+        return token.value.lower()
+    return None
+
+
+def _referenced_tables(tokens: List) -> Tuple[str, ...]:
+    """Every table named in a FROM clause of a flattened token stream.
+
+    Covers comma-separated lists (``FROM jobs, users``), joins and subqueries
+    (scanned for their own FROM). Inside a table list any keyword other than
+    LATERAL/ONLY is taken as a table name, so reserved words cannot slip a
+    table past the allowlist.
+    """
+    tables = []
+    depth = 0
+    in_from = {0: False}  # paren depth -> inside a FROM clause at that depth
+    expect_table = False
+    index = 0
+    while index < len(tokens):
+        token = tokens[index]
+        index += 1
+        if token.match(T.Punctuation, "("):
+            depth += 1
+            in_from[depth] = False
+            expect_table = False
+        elif token.match(T.Punctuation, ")"):
+            in_from.pop(depth, None)
+            depth = max(depth - 1, 0)
+        elif token.match(T.Punctuation, ","):
+            expect_table = in_from.get(depth, False)
+        elif token.ttype in T.Keyword:
+            keyword = token.normalized
+            if keyword in _TABLE_KEYWORDS or keyword.endswith(" JOIN"):
+                in_from[depth] = True
+                expect_table = True
+            elif keyword in _FROM_CLAUSE_END:
+                in_from[depth] = False
+                expect_table = False
+            elif expect_table and keyword not in ("LATERAL", "ONLY"):
+                tables.append(token.value.lower())
+                expect_table = False
+        elif expect_table:
+            expect_table = False
+            name = _identifier(token)
+            if name is None:
+                continue
+            # schema-qualified: keep the last part of "public.jobs"
+            while index + 1 < len(tokens) and tokens[index].match(T.Punctuation, ".") and _identifier(tokens[index + 1]) is not None:
+                name = _identifier(tokens[index + 1])
+                index += 2
+            tables.append(name)
+    return tuple(tables)
+
+
+def _validate(query: str) -> SQLVerdict:
+    statements = [statement for statement in sqlparse.parse(query) if statement.value.strip(" \t\r\n;")]
+    if not statements:
+        return SQLVerdict(False, "Only SELECT queries are allowed for security reasons.")
+
+    tokens = [token for statement in statements for token in statement.flatten() if not token.is_whitespace]
+    dangerous = frozenset(
+        token.value.upper() for token in tokens
+        if (token.ttype in T.Keyword or token.ttype in T.Name) and token.value.upper() in _DANGEROUS_SQL_KEYWORDS
+    )
+
+    if statements[0].get_type() != "SELECT":
+        return SQLVerdict(False, "Only SELECT queries are allowed for security reasons.", dangerous_keywords=dangerous)
+    if dangerous:
+        return SQLVerdict(False, "This query contains dangerous operations (DELETE, UPDATE, etc.) which are not allowed.", dangerous_keywords=dangerous)
+    # Stacked statements, comments and UNION are the usual injection shapes
+    if len(statements) > 1 or any(
+        token.ttype in T.Comment or (token.ttype in T.Keyword and token.normalized.startswith("UNION")) for token in tokens
+    ):
+        return SQLVerdict(False, "Query contains potentially dangerous patterns.")
+
+    tables = _referenced_tables(tokens)
+    if not tables:
+        return SQLVerdict(False, "Could not parse table name")
+    for table in tables:
+        if table not in ALLOWED_SQL_TABLES:
+            return SQLVerdict(False, f"Access to table '{table}' is not allowed for security reasons.", tables=tables)
+    return SQLVerdict(True, tables=tables)
+
+
+def validate_sql_query(query: str) -> SQLVerdict:
+    """Tokenize ``query`` once and decide whether the SQL node may run it; verdicts are cached by query hash."""
+    key = hashlib.sha256(query.strip().encode("utf-8")).hexdigest()
+    verdict: Optional[SQLVerdict] = _verdicts.get(key)
+    if verdict is not None:
+        _verdicts.move_to_end(key)
+        return verdict
+    verdict = _validate(query)
+    _verdicts[key] = verdict
+    while len(_verdicts) > SQL_VERDICT_CACHE_SIZE:
+        _verdicts.popitem(last=False)
+    return verdict
+
+
 def is_dangerous_sql_query(query: str) -> bool:
     """Check if SQL query contains dangerous operations."""
-    query_upper = query.upper().strip()
-    
-    # Check for dangerous keywords
-    for keyword in DANGEROUS_SQL_KEYWORDS:
-        # Use word boundaries to avoid false positives
-        pattern = r'\b' + re.escape(keyword) + r'\b'
-        if re.search(pattern, query_upper):
-            return True
-    
-    return False
+    return bool(validate_sql_query(query).dangerous_keywords)
 
 
 def sanitize_sql_query(query: str) -> tuple[bool, str]:
     """Sanitize and validate SQL query. Returns (is_safe, error_message)."""
-    query_upper = query.upper().strip()
-    
-    # Only allow SELECT queries
-    if not query_upper.startswith('SELECT'):
-        return False, "Only SELECT queries are allowed for security reasons."
-    
-    # Check for dangerous keywords
-    if is_dangerous_sql_query(query):
-        return False, "This query contains dangerous operations (DELETE, UPDATE, etc.) which are not allowed."
-    
-    # Check for SQL injection patterns
-    dangerous_patterns = [
-        r';\s*(DELETE|UPDATE|DROP|INSERT)',
-        r'--',  # SQL comments
-        r'/\*.*\*/',  # Multi-line comments
-        r'UNION.*SELECT',  # SQL injection
-        r'EXEC\s*\(',
-    ]
-    
-    for pattern in dangerous_patterns:
-        if re.search(pattern, query_upper, re.IGNORECASE):
-            return False, "Query contains potentially dangerous patterns."
-    
-    return True, ""
-
+    verdict = validate_sql_query(query)
+    return verdict.is_safe, verdict.error
@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 from core.config import get_supabase_client
+from core import db
 
 # In-memory fallback store for sessions (conversation_id -> list of messages)
 SESSION_STORE: dict[str, list[dict]] = {}
@@ -24,18 +25,18 @@ def clear_pending_job(session_id: str):
     PENDING_JOBS.pop(session_id, None)
 
 
-def persist_chat_message(session_id: str, user_id: str, role: str, content: str):
+async def persist_chat_message(session_id: str, user_id: str, role: str, content: str):
     """Persist a chat message to Supabase if available, else store in-memory."""
     timestamp = datetime.now(timezone.utc).isoformat()
     try:
         supabase = get_supabase_client()
-        supabase.table("chat_messages").insert({
+        await db.execute(supabase.table("chat_messages").insert({
             "session_id": session_id,
             "user_id": user_id,
             "role": role,
             "content": content,
             "created_at": timestamp
-        }).execute()
+        }), "chat_messages", "insert")
     except Exception:
         SESSION_STORE.setdefault(session_id, []).append({
             "session_id": session_id,
@@ -46,11 +47,11 @@ def persist_chat_message(session_id: str, user_id: str, role: str, content: str)
         })
 
 
-def load_recent_messages(session_id: str, limit: int = 12) -> list[dict]:
+async def load_recent_messages(session_id: str, limit: int = 12) -> list[dict]:
     """Load recent messages for a session from Supabase or in-memory store."""
     try:
         supabase = get_supabase_client()
-        response = supabase.table("chat_messages").select("*").eq("session_id", session_id).order("created_at", desc=True).limit(limit).execute()
+        response = await db.execute(supabase.table("chat_messages").select("*").eq("session_id", session_id).order("created_at", desc=True).limit(limit), "chat_messages", "select")
         if response.data:
             return list(reversed(response.data))
     except Exception:
@@ -65,11 +66,12 @@ def summarize_messages_if_needed(session_id: str, messages: list[dict], threshol
     if len(messages) <= threshold:
         return None
     combined = "\n".join([f"{m['role'].capitalize()}: {m['content']}" for m in messages[-threshold:]])
-    from agent.prompts.loader import format_prompt
-    prompt = format_prompt("conversation_summary.md", conversation=combined)
+    from agent.prompts.budget import format_prompt_within_budget
+    from agent.utils.llm import invoke_llm
+    prompt = format_prompt_within_budget("conversation_summary.md", conversation=combined)
     try:
         if llm is not None:
-            resp = llm.invoke(prompt)
+            resp = invoke_llm(prompt, "conversation_summary", client=llm)
             summary = (resp.content or "").strip()
             if summary:
                 SESSION_SUMMARIES[session_id] = summary
@@ -79,14 +81,14 @@ def summarize_messages_if_needed(session_id: str, messages: list[dict], threshol
     return None
 
 
-def get_last_intent(session_id: str) -> str | None:
+async def get_last_intent(session_id: str) -> str | None:
     """Get the last intent/routing decision from conversation history."""
     # First, check if there's a pending job - if so, route to create_job_tool
     if session_id in PENDING_JOBS:
         return "create_job_tool"
     
     try:
-        messages = load_recent_messages(session_id, limit=5)
+        messages = await load_recent_messages(session_id, limit=5)
         # Look for assistant messages that indicate what action was taken
         for msg in reversed(messages):
             if msg.get("role") == "assistant":
@@ -0,0 +1,155 @@
+"""
+Skill index over applications.
+
+Skills extracted by ATS scoring are persisted to ``application_skills`` and
+kept in an in-memory inverted index (skill -> application ids) per
+recruiter, so candidates can be filtered by skill without re-ranking.
+"""
+
+import re
+import time
+from typing import Iterable, List, Optional
+
+from core.config import get_supabase_client
+from core import db
+
+# Common spellings mapped to one canonical skill name
+SKILL_ALIASES = {
+    "k8s": "kubernetes",
+    "js": "javascript",
+    "ts": "typescript",
+    "py": "python",
+    "golang": "go",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "reactjs": "react",
+    "react.js": "react",
+    "vuejs": "vue",
+    "vue.js": "vue",
+    "amazon web services": "aws",
+    "gcp": "google cloud",
+    "ml": "machine learning",
+}
+
+# Seconds before a recruiter's index is reloaded from the database
+SKILL_INDEX_TTL = 300
+
+# recruiter_id -> skill -> application ids
+SKILL_INDEX: dict[str, dict[str, set[str]]] = {}
+# application_id -> (recruiter_id, skills) for updates and removals
+APPLICATION_SKILLS: dict[str, tuple[str, set[str]]] = {}
+# recruiter_id -> time the index was loaded from the database
+_LOADED_AT: dict[str, float] = {}
+
+
+def normalize_skill(skill: str) -> str:
+    """Canonical lowercase form of a skill name."""
+    text = re.sub(r"\s+", " ", str(skill or "").strip().lower())
+    return SKILL_ALIASES.get(text, text)
+
+
+def normalize_skills(skills: Iterable[str]) -> List[str]:
+    return sorted({normalized for normalized in (normalize_skill(skill) for skill in skills or []) if normalized})
+
+
+def _index_application(recruiter_id: str, application_id: str, skills: set[str]):
+    _unindex_application(application_id)
+    recruiter_index = SKILL_INDEX.setdefault(recruiter_id, {})
+    for skill in skills:
+        recruiter_index.setdefault(skill, set()).add(application_id)
+    APPLICATION_SKILLS[application_id] = (recruiter_id, skills)
+
+
+def _unindex_application(application_id: str):
+    previous = APPLICATION_SKILLS.pop(application_id, None)
+    if not previous:
+        return
+    recruiter_id, skills = previous
+    recruiter_index = SKILL_INDEX.get(recruiter_id, {})
+    for skill in skills:
+        ids = recruiter_index.get(skill)
+        if ids is not None:
+            ids.discard(application_id)
+            if not ids:
+                recruiter_index.pop(skill, None)
+
+
+async def record_application_skills(recruiter_id: str, application_id: str, job_id: Optional[str], skills: Iterable[str]):
+    """Replace the indexed skills of one application and persist them (best-effort)."""
+    if not recruiter_id or not application_id:
+        return
+    normalized = set(normalize_skills(skills))
+    _index_application(recruiter_id, application_id, normalized)
+
+    try:
+        supabase = get_supabase_client()
+        await db.execute(supabase.table("application_skills").delete().eq("application_id", application_id), "application_skills", "delete")
+        if normalized:
+            await db.execute(supabase.table("application_skills").insert([
+                {"application_id": application_id, "recruiter_id": recruiter_id, "job_id": job_id, "skill": skill}
+                for skill in sorted(normalized)
+            ]), "application_skills", "insert")
+    except Exception:
+        pass
+
+
+def remove_application_skills(application_id: str):
+    """Drop an application from the in-memory index (rows cascade in the database)."""
+    _unindex_application(application_id)
+
+
+async def _ensure_loaded(recruiter_id: str):
+    loaded_at = _LOADED_AT.get(recruiter_id)
+    if loaded_at and time.time() - loaded_at < SKILL_INDEX_TTL:
+        return
+    try:
+        supabase = get_supabase_client()
+        query = (
+            supabase
+            .table("application_skills")
+            .select("application_id, skill")
+            .eq("recruiter_id", recruiter_id)
+        )
+        response = await db.execute(query, "application_skills", "select")
+    except Exception:
+        return
+
+    by_application: dict[str, set[str]] = {}
+    for row in response.data or []:
+        by_application.setdefault(str(row["application_id"]), set()).add(row["skill"])
+
+    for application_id, (owner, _) in list(APPLICATION_SKILLS.items()):
+        if owner == recruiter_id and application_id not in by_application:
+            _unindex_application(application_id)
+    for application_id, skills in by_application.items():
+        _index_application(recruiter_id, application_id, skills)
+    _LOADED_AT[recruiter_id] = time.time()
+
+
+async def indexed_skills(recruiter_id: str) -> set[str]:
+    """Normalized skill names indexed for ``recruiter_id``'s applications."""
+    if not recruiter_id:
+        return set()
+    await _ensure_loaded(recruiter_id)
+    return set(SKILL_INDEX.get(recruiter_id, {}))
+
+
+async def find_applications_by_skills(recruiter_id: str, skills: Iterable[str], match_all: bool = True) -> List[str]:
+    """Application ids of ``recruiter_id`` having all (or any) of ``skills``."""
+    wanted = normalize_skills(skills)
+    if not recruiter_id or not wanted:
+        return []
+    await _ensure_loaded(recruiter_id)
+
+    recruiter_index = SKILL_INDEX.get(recruiter_id, {})
+    # Intersect smallest posting lists first
+    postings = sorted((recruiter_index.get(skill, set()) for skill in wanted), key=len)
+    if match_all:
+        if not postings[0]:
+            return []
+        result = set(postings[0]).intersection(*postings[1:])
+    else:
+        result = set().union(*postings)
+    return sorted(result)
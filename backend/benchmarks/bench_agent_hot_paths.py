@@ -0,0 +1,113 @@
+"""
+Benchmark: agent hot paths over synthetic job catalogues.
+
+Times routing, message preprocessing, the safety checks (cold and cached
+SQL verdicts), salary matching, ``search_jobs`` and a full ``run_agent``
+turn against an in-memory Supabase and a fake LLM, for catalogues of 1k,
+10k and 100k jobs.
+
+Run from the backend directory:
+    python -m benchmarks.bench_agent_hot_paths --save-baseline
+    python -m benchmarks.bench_agent_hot_paths            # compare against the baseline
+"""
+
+import itertools
+import json
+import os
+
+os.environ.setdefault("GROQ_API_KEY", "benchmark")
+
+from agent.orchestration import run_agent
+from agent.router import route_query
+from agent.tools.job_tools import _salary_matches, search_jobs
+from agent.utils.normalization import normalize_synonyms
+from agent.utils.preprocess import preprocess_message
+from agent.utils import safety
+from agent.utils.safety import contains_dangerous_keywords, sanitize_sql_query
+from tests.fakes import FakeSupabase
+from benchmarks.fakes import FakeLLM, fake_backend, synthetic_jobs
+from benchmarks.harness import BenchmarkRunner, build_parser, finish
+
+MESSAGES = [
+    "Find python jobs in London over 100k",
+    "Show jobs in Berlin",
+    "How many applications did we get this week?",
+    "Create a job for a senior backend engineer in Dublin paying 90k",
+    "Rank the applicants for the data scientist position",
+    "Who applied to the DevOps opening?",
+    "Please delete all job records",
+    "Help me write a rejection message for a candidate",
+    "What vacancies are available for remote roles?",
+    "Summarize CV for the latest applicant",
+    "yes please",
+    "Tell me about your company benefits",
+]
+
+SQL_QUERIES = [
+    "SELECT * FROM jobs",
+    "SELECT title, location FROM jobs WHERE salary > 100000",
+    "SELECT * FROM applications; DROP TABLE users",
+    "SELECT * FROM users UNION SELECT * FROM chat_messages",
+    "DELETE FROM jobs",
+]
+
+SALARY_FILTERS = ["over 100k", "under 60k", "80k", "$120,000"]
+
+
+def _filters_responder(prompt: str) -> str:
+    if "extracting search filters" in prompt:
+        return json.dumps({"keywords": "python", "location": "london", "salary": "over 100k"})
+    return "Here is a short synthetic reply."
+
+
+def bench_message_paths(runner: BenchmarkRunner):
+    states = [{"message": message.lower(), "conversation_id": "bench-routing"} for message in MESSAGES]
+    with fake_backend(FakeSupabase()):
+        runner.run("route_query", lambda: [route_query(state) for state in states], messages=len(states))
+    runner.run("normalize_synonyms", lambda: [normalize_synonyms(message) for message in MESSAGES], messages=len(MESSAGES))
+    # Uncached build of the per-turn PreprocessedMessage
+    runner.run("preprocess_message", lambda: [preprocess_message.__wrapped__(message) for message in MESSAGES], messages=len(MESSAGES))
+    runner.run("contains_dangerous_keywords", lambda: [contains_dangerous_keywords(message) for message in MESSAGES], messages=len(MESSAGES))
+    # Cold tokenization pass vs. the verdict cache
+    runner.run("validate_sql_query_uncached", lambda: [safety._validate(query) for query in SQL_QUERIES], queries=len(SQL_QUERIES))
+    runner.run("sanitize_sql_query", lambda: [sanitize_sql_query(query) for query in SQL_QUERIES], queries=len(SQL_QUERIES))
+
+
+def bench_catalogue(runner: BenchmarkRunner, size: int):
+    jobs = synthetic_jobs(size)
+    salaries = [job["salary"].lower() for job in jobs if job["salary"]]
+    runner.run(
+        "salary_matches",
+        lambda: [_salary_matches(salary, salary_filter) for salary_filter in SALARY_FILTERS for salary in salaries],
+        jobs=size,
+    )
+
+    supabase = FakeSupabase({"jobs": jobs})
+    llm = FakeLLM(_filters_responder)
+    users = itertools.count()
+
+    async def agent_turn():
+        # Fresh chat history per turn so the fake tables do not grow across rounds
+        supabase.tables["chat_messages"] = []
+        supabase.tables["ai_search_logs"] = []
+        return await run_agent(MESSAGES[0], user_id=f"bench-user-{next(users)}", conversation_id="bench-conversation")
+
+    with fake_backend(supabase, llm):
+        runner.run("search_jobs", lambda: search_jobs(keywords="python", location="london", salary="over 100k"), jobs=size)
+        runner.run("run_agent", agent_turn, jobs=size)
+
+
+def main():
+    parser = build_parser(__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated catalogue sizes")
+    args = parser.parse_args()
+
+    runner = BenchmarkRunner(rounds=args.rounds, min_time=args.min_time)
+    bench_message_paths(runner)
+    for size in (int(size) for size in args.sizes.split(",") if size.strip()):
+        bench_catalogue(runner, size)
+    finish(args, runner, "agent_hot_paths.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark: single vs batched ATS scoring.
+
+Scores a synthetic applicant pool with a fake LLM that charges a fixed
+round-trip latency plus a per-token cost, and reports prompt tokens, LLM
+calls and wall time for single-applicant prompts versus batched prompts.
+
+Run from the backend directory:
+    python -m benchmarks.bench_ats_batching --applicants 40 --batch-sizes 1,5,10
+"""
+
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("GROQ_API_KEY", "benchmark")
+
+from agent.tools import applicant_tools
+from agent.utils.job_digest import format_job_digest
+from benchmarks.fakes import SKILLS, FakeLLM, canned_responder, fake_backend
+
+
+JOB = {
+    "title": "Senior Backend Engineer",
+    "requirements": "5+ years Python, FastAPI or Django, PostgreSQL, Docker, Kubernetes, AWS. " * 4,
+    "description": "Own the design and operation of our hiring platform APIs and data pipelines. " * 6,
+}
+JOB_DIGEST = {
+    "must_have_skills": ["Python", "FastAPI", "PostgreSQL", "Docker", "Kubernetes", "AWS"],
+    "nice_to_have_skills": ["Django"],
+    "min_years_experience": 5,
+    "education": None,
+    "location_constraints": None,
+    "key_responsibilities": ["Design hiring platform APIs", "Operate data pipelines"],
+}
+JOB_CONTEXT = {"title": JOB["title"], "digest": format_job_digest(JOB, JOB_DIGEST)}
+
+
+def _synthetic_profiles(count: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    profiles = []
+    for i in range(count):
+        skills = ", ".join(rng.sample(SKILLS, 6))
+        profiles.append({
+            "application_id": f"app-{i}",
+            "applicant_id": f"user-{i}",
+            "name": f"Candidate {i}",
+            "email": f"candidate{i}@example.com",
+            "cv_url": f"https://example.com/cv/{i}.pdf",
+            "cv_text": f"Software engineer with {rng.randint(1, 12)} years of experience. Skills: {skills}. " * 25,
+            "cover_letter": "I am excited to apply for this role and bring my backend experience. " * 5,
+            "motivation": "I want to work on hiring tools.",
+            "proud_project": "Built a distributed job scheduler.",
+        })
+    return profiles
+
+
+def run(applicants: int, batch_sizes: list[int], base_latency: float, per_token_latency: float) -> list[dict]:
+    profiles = _synthetic_profiles(applicants)
+    results = []
+    for batch_size in batch_sizes:
+        fake = FakeLLM(canned_responder, base_latency, per_token_latency)
+        with fake_backend(llm=fake):
+            started = time.perf_counter()
+            for start in range(0, len(profiles), batch_size):
+                applicant_tools._score_batch(JOB_CONTEXT, profiles[start:start + batch_size])
+            elapsed = time.perf_counter() - started
+        results.append({
+            "batch_size": batch_size,
+            "llm_calls": fake.calls,
+            "prompt_tokens": fake.prompt_tokens,
+            "wall_time_s": round(elapsed, 3),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--applicants", type=int, default=40)
+    parser.add_argument("--batch-sizes", default="1,5,10")
+    parser.add_argument("--base-latency", type=float, default=0.05, help="Seconds per LLM round trip")
+    parser.add_argument("--per-token-latency", type=float, default=0.00002, help="Seconds per prompt token")
+    args = parser.parse_args()
+
+    batch_sizes = [int(size) for size in args.batch_sizes.split(",") if size.strip()]
+    results = run(args.applicants, batch_sizes, args.base_latency, args.per_token_latency)
+
+    baseline = results[0]
+    print(f"{'batch':>5} {'calls':>6} {'prompt tokens':>14} {'wall (s)':>9} {'tokens vs 1st':>14}")
+    for row in results:
+        ratio = row["prompt_tokens"] / baseline["prompt_tokens"] if baseline["prompt_tokens"] else 0
+        print(f"{row['batch_size']:>5} {row['llm_calls']:>6} {row['prompt_tokens']:>14} "
+              f"{row['wall_time_s']:>9} {ratio:>13.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark: cold-start import time of ``main:app``.
+
+Each case starts a fresh interpreter, so module caches never carry over.
+Cases cover importing the app under the "full" and "crud" deployment
+profiles and the one-off cost of the first agent use (compiling the
+LangGraph workflow and importing LangChain) after the app is up.
+
+Run from the backend directory:
+    python -m benchmarks.bench_import_time --save-baseline
+    python -m benchmarks.bench_import_time            # compare against the baseline
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.harness import BenchmarkRunner, build_parser, finish
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+SNIPPETS = {
+    "import_main": "import main",
+    "import_main_then_agent": "import main, agent.orchestration",
+}
+
+ENV_DEFAULTS = {
+    "GROQ_API_KEY": "benchmark",
+    "SUPABASE_URL": "https://example.supabase.co",
+    "SUPABASE_ANON_KEY": "benchmark",
+    "SUPABASE_SERVICE_ROLE_KEY": "benchmark",
+}
+
+
+def _interpreter(code: str, profile: str):
+    env = {**ENV_DEFAULTS, **os.environ, "DEPLOYMENT_PROFILE": profile}
+
+    def run():
+        subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR, env=env, check=True, stdout=subprocess.DEVNULL)
+
+    return run
+
+
+def main():
+    parser = build_parser(__doc__.splitlines()[1])
+    parser.set_defaults(min_time=0.0)
+    args = parser.parse_args()
+
+    runner = BenchmarkRunner(rounds=args.rounds, min_time=args.min_time)
+    runner.run("python_startup", _interpreter("pass", "full"))
+    for profile in ("full", "crud"):
+        runner.run("import_main", _interpreter(SNIPPETS["import_main"], profile), profile=profile)
+    runner.run("import_main_then_agent", _interpreter(SNIPPETS["import_main_then_agent"], "full"), profile="full")
+    finish(args, runner, "import_time.json")
+
+
+if __name__ == "__main__":
+    main()
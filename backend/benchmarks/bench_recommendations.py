@@ -0,0 +1,62 @@
+"""
+Benchmark: hashed TF-IDF job recommendations.
+
+Times a full index build, one recommendation query (a single matrix-vector
+product over every open job) and an incremental upsert for synthetic
+catalogues of 1k, 10k and 50k jobs, so query latency can be checked to stay
+flat as the catalogue grows.
+
+Run from the backend directory:
+    python -m benchmarks.bench_recommendations --save-baseline
+    python -m benchmarks.bench_recommendations            # compare against the baseline
+"""
+
+import itertools
+import os
+
+os.environ.setdefault("GROQ_API_KEY", "benchmark")
+
+from agent.utils.job_recommender import JobVectorIndex
+from benchmarks.fakes import synthetic_jobs
+from benchmarks.harness import BenchmarkRunner, build_parser, finish
+from core.config import Config
+
+CV_TEXT = (
+    "Senior backend engineer with eight years of Python, FastAPI and Django. "
+    "Built event-driven services on Kafka and PostgreSQL, deployed with Docker "
+    "and Kubernetes on AWS, infrastructure managed in Terraform."
+)
+
+
+def bench_catalogue(runner: BenchmarkRunner, size: int):
+    jobs = synthetic_jobs(size)
+    index = JobVectorIndex(Config.JOB_RECOMMENDER_FEATURES)
+    runner.run("build_index", lambda: index.build(jobs), jobs=size)
+
+    index.top_k(CV_TEXT, 10)  # warm the cached norms, as after any write
+    runner.run("top_k", lambda: index.top_k(CV_TEXT, 10), jobs=size)
+
+    counter = itertools.count()
+
+    def upsert():
+        job = dict(jobs[next(counter) % size])
+        job["description"] += " Updated."
+        index.upsert(job)
+
+    runner.run("upsert", upsert, jobs=size)
+    runner.run("upsert_then_top_k", lambda: (upsert(), index.top_k(CV_TEXT, 10)), jobs=size)
+
+
+def main():
+    parser = build_parser(__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="1000,10000,50000", help="Comma-separated catalogue sizes")
+    args = parser.parse_args()
+
+    runner = BenchmarkRunner(rounds=args.rounds, min_time=args.min_time)
+    for size in (int(size) for size in args.sizes.split(",") if size.strip()):
+        bench_catalogue(runner, size)
+    finish(args, runner, "recommendations.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark: list-response serialization for 5k-row job catalogues.
+
+Compares the ``response_model`` path FastAPI takes for ``List[Job]``
+(model validation + ``jsonable_encoder`` + ``json.dumps``) with the
+``project_rows`` + orjson fast path, times gzip compression of the body,
+and measures a full GET /jobs through the app with an in-memory Supabase.
+
+Run from the backend directory:
+    python -m benchmarks.bench_serialization --save-baseline
+    python -m benchmarks.bench_serialization            # compare against the baseline
+"""
+
+import gzip
+import json
+import os
+
+os.environ.setdefault("GROQ_API_KEY", "benchmark")
+
+import httpx
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from tests.fakes import FakeSupabase
+from benchmarks.fakes import fake_backend, synthetic_jobs
+from benchmarks.harness import BenchmarkRunner, build_parser, finish
+from core.config import Config
+from core.models import Job
+from core.serialization import FastJSONResponse, project_rows
+
+JOB_LIST = TypeAdapter(list[Job])
+
+
+def _model_path(rows: list) -> bytes:
+    jobs = JOB_LIST.validate_python(rows)
+    return json.dumps(jsonable_encoder(jobs)).encode()
+
+
+def _fast_path(rows: list) -> bytes:
+    return FastJSONResponse(project_rows(rows, Job)).body
+
+
+def bench_encoding(runner: BenchmarkRunner, size: int):
+    rows = synthetic_jobs(size)
+    runner.run("model_validate_json_dumps", lambda: _model_path(rows), rows=size)
+    runner.run("project_rows_orjson", lambda: _fast_path(rows), rows=size)
+
+    body = _fast_path(rows)
+    compressed = gzip.compress(body, compresslevel=Config.GZIP_COMPRESS_LEVEL)
+    print(f"{'body bytes':<60} {len(body):>10}  gzip {len(compressed):>10} ({len(compressed) / len(body):.0%})")
+    runner.run("gzip_body", lambda: gzip.compress(body, compresslevel=Config.GZIP_COMPRESS_LEVEL), rows=size)
+
+
+def bench_endpoint(runner: BenchmarkRunner, size: int):
+    from main import app
+
+    supabase = FakeSupabase({"jobs": synthetic_jobs(size)})
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+
+    async def get_jobs(encoding: str):
+        response = await client.get("/jobs", headers={"Accept-Encoding": encoding})
+        response.raise_for_status()
+        return response
+
+    with fake_backend(supabase):
+        runner.run("GET /jobs", lambda: get_jobs("identity"), rows=size, encoding="identity")
+        runner.run("GET /jobs", lambda: get_jobs("gzip"), rows=size, encoding="gzip")
+
+
+def main():
+    parser = build_parser(__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="5000", help="Comma-separated row counts")
+    args = parser.parse_args()
+
+    runner = BenchmarkRunner(rounds=args.rounds, min_time=args.min_time)
+    for size in (int(size) for size in args.sizes.split(",") if size.strip()):
+        bench_encoding(runner, size)
+        bench_endpoint(runner, size)
+    finish(args, runner, "serialization.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+In-memory stand-ins for Supabase and the LLM used by the benchmarks.
+
+``FakeSupabase`` lives with the tests (``tests/fakes.py``). ``FakeLLM`` returns deterministic responses after a configurable
+latency. ``fake_backend`` wires both into every module that imported
+``get_supabase_client`` or the shared ``llm``.
+"""
+
+import importlib
+import json
+import random
+import time
+from contextlib import ExitStack, contextmanager
+from typing import Callable, List, Optional
+from unittest.mock import patch
+
+from agent.prompts.budget import count_tokens
+from tests.fakes import FakeSupabase
+
+# Modules that bind ``get_supabase_client`` at import time
+SUPABASE_CLIENT_MODULES = (
+    "core.config",
+    "core.auth",
+    "agent.orchestration",
+    "agent.tools.job_tools",
+    "agent.tools.sql_tools",
+    "agent.tools.applicant_tools",
+    "agent.tools.ranking_jobs",
+    "agent.utils.cv_parser",
+    "agent.utils.job_digest",
+    "agent.utils.job_recommender",
+    "agent.utils.skill_index",
+    "agent.utils.session",
+    "routes.auth",
+    "routes.jobs",
+    "routes.applications",
+    "routes.ats",
+    "routes.files",
+    "routes.dashboard",
+)
+
+# Modules holding the shared ``llm`` (read through ``get_llm()`` everywhere else)
+LLM_MODULES = ("agent.utils.llm",)
+
+
+class FakeMessage:
+    def __init__(self, content: str):
+        self.content = content
+        self.usage_metadata = None
+
+
+def canned_responder(prompt: str) -> str:
+    """Plausible JSON for every prompt family (batch ATS arrays, otherwise one object with all keys)."""
+    ids = [line.split("(id: ", 1)[1].rstrip(")") for line in prompt.splitlines()
+           if line.startswith("APPLICANT ") and "(id: " in line]
+    if ids:
+        return json.dumps([
+            {"id": app_id, "score": 50 + (i * 7) % 50, "summary": "Synthetic", "skills": SKILLS[:3]}
+            for i, app_id in enumerate(ids)
+        ])
+    return json.dumps({
+        "score": 70,
+        "summary": "Synthetic",
+        "skills": SKILLS[:3],
+        "keywords": "python",
+        "location": "london",
+        "salary": "",
+        "must_have_skills": SKILLS[:4],
+        "nice_to_have_skills": SKILLS[4:6],
+        "key_responsibilities": ["Build APIs"],
+        "min_years_experience": 3,
+    })
+
+
+class FakeLLM:
+    """Deterministic stand-in for ChatGroq with simulated round-trip and per-token latency.
+
+    ``responder`` maps the rendered prompt to the response text (``canned_responder`` by default).
+    """
+
+    model_name = "fake-llm"
+
+    def __init__(self, responder: Optional[Callable[[str], str]] = None, base_latency: float = 0.0, per_token_latency: float = 0.0):
+        self.responder = responder or canned_responder
+        self.base_latency = base_latency
+        self.per_token_latency = per_token_latency
+        self.calls = 0
+        self.prompt_tokens = 0
+
+    def invoke(self, prompt: str) -> FakeMessage:
+        tokens = count_tokens(prompt)
+        self.calls += 1
+        self.prompt_tokens += tokens
+        delay = self.base_latency + tokens * self.per_token_latency
+        if delay:
+            time.sleep(delay)
+        return FakeMessage(self.responder(prompt))
+
+
+@contextmanager
+def fake_backend(supabase: Optional[FakeSupabase] = None, llm: Optional[FakeLLM] = None):
+    """Route Supabase and LLM access through the fakes (and disable the disk LLM cache)."""
+    with ExitStack() as stack:
+        stack.enter_context(patch("core.config.Config.LLM_CACHE_ENABLED", False))
+        if supabase is not None:
+            for module_name in SUPABASE_CLIENT_MODULES:
+                module = importlib.import_module(module_name)
+                stack.enter_context(patch.object(module, "get_supabase_client", lambda: supabase))
+        if llm is not None:
+            for module_name in LLM_MODULES:
+                stack.enter_context(patch.object(importlib.import_module(module_name), "llm", llm))
+        yield
+
+
+LOCATIONS = ["London", "Manchester", "Berlin", "Remote", "New York", "San Francisco", "Dublin", "Paris"]
+TITLES = [
+    "Backend Engineer", "Frontend Developer", "Data Scientist", "Product Manager", "DevOps Engineer",
+    "Site Reliability Engineer", "Marketing Coordinator", "Sales Specialist", "QA Analyst", "CTO",
+]
+SKILLS = [
+    "Python", "FastAPI", "Django", "PostgreSQL", "Kubernetes", "Docker", "AWS",
+    "React", "TypeScript", "Terraform", "Kafka", "Redis", "GraphQL", "Go",
+]
+
+
+def synthetic_jobs(count: int, seed: int = 11, recruiters: int = 50) -> List[dict]:
+    """Deterministic job catalogue shaped like rows of the ``jobs`` table."""
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(count):
+        title = rng.choice(TITLES)
+        skills = ", ".join(rng.sample(SKILLS, 4))
+        low = rng.randrange(30, 180, 5)
+        salary = rng.choice([f"£{low}k - £{low + 20}k", f"${low},000", f"{low}k", "Competitive", ""])
+        jobs.append({
+            "id": f"job-{i}",
+            "title": f"{rng.choice(['Senior ', 'Junior ', 'Lead ', ''])}{title}",
+            "description": f"Join our team as a {title.lower()} working on hiring products. " * 3,
+            "requirements": f"Experience with {skills}. {rng.randint(1, 10)}+ years in a similar role.",
+            "location": rng.choice(LOCATIONS),
+            "salary": salary,
+            "status": "open" if rng.random() > 0.1 else "closed",
+            "created_by": f"recruiter-{i % recruiters}",
+            "created_at": f"2024-{1 + i % 12:02d}-{1 + i % 28:02d}T00:00:00+00:00",
+        })
+    return jobs
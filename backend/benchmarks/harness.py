@@ -0,0 +1,169 @@
+"""
+Minimal benchmark harness with JSON baselines.
+
+Each case is timed over several rounds; the median and p95 per-call times
+are reported. ``--save-baseline`` writes the results to a JSON file and later
+runs compare against it, flagging any case whose median got slower by more
+than ``--tolerance`` (exit code 1 when a regression is found). Baselines are
+committed under ``benchmarks/baselines/``; a missing baseline exits with code
+2 rather than passing unchecked, unless ``--allow-missing-baseline`` is given.
+"""
+
+import argparse
+import asyncio
+import inspect
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+
+def case_key(name: str, params: Dict[str, Any]) -> str:
+    if not params:
+        return name
+    return f"{name}[{','.join(f'{key}={value}' for key, value in sorted(params.items()))}]"
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class BenchmarkRunner:
+    """Times benchmark cases and collects their results."""
+
+    def __init__(self, rounds: int = 5, min_time: float = 0.05):
+        self.rounds = rounds
+        self.min_time = min_time
+        self.results: Dict[str, dict] = {}
+        self._loop = asyncio.new_event_loop()
+
+    def _call(self, func: Callable[[], Any]):
+        result = func()
+        if inspect.isawaitable(result):
+            return self._loop.run_until_complete(result)
+        return result
+
+    def _calibrate(self, func: Callable[[], Any]) -> int:
+        """Calls per round so that one round takes at least ``min_time``."""
+        number = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(number):
+                self._call(func)
+            elapsed = time.perf_counter() - start
+            if elapsed >= self.min_time or number >= 1_000_000:
+                return number
+            number *= 10 if elapsed < self.min_time / 10 else 2
+
+    def run(self, name: str, func: Callable[[], Any], **params) -> dict:
+        """Time ``func`` (sync or async) and record the per-call statistics."""
+        number = self._calibrate(func)
+        samples = []
+        for _ in range(self.rounds):
+            start = time.perf_counter()
+            for _ in range(number):
+                self._call(func)
+            samples.append((time.perf_counter() - start) / number)
+
+        result = {
+            "name": name,
+            "params": params,
+            "calls_per_round": number,
+            "median_s": statistics.median(samples),
+            "p95_s": _percentile(samples, 0.95),
+            "min_s": min(samples),
+        }
+        key = case_key(name, params)
+        self.results[key] = result
+        print(f"{key:<60} median {_format_seconds(result['median_s']):>10}  p95 {_format_seconds(result['p95_s']):>10}")
+        return result
+
+    def close(self):
+        self._loop.close()
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.2f} µs"
+
+
+def load_baseline(path: Path) -> Optional[dict]:
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+def save_baseline(path: Path, results: Dict[str, dict]):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+
+
+def compare(results: Dict[str, dict], baseline: dict, tolerance: float) -> List[dict]:
+    """Cases whose median is slower than the baseline by more than ``tolerance`` (0.2 = 20%)."""
+    regressions = []
+    print(f"\n{'case':<60} {'baseline':>10} {'current':>10} {'change':>8}")
+    for key, result in results.items():
+        previous = baseline.get("results", {}).get(key)
+        if not previous:
+            print(f"{key:<60} {'-':>10} {_format_seconds(result['median_s']):>10} {'new':>8}")
+            continue
+        change = result["median_s"] / previous["median_s"] - 1 if previous["median_s"] else 0.0
+        flag = ""
+        if change > tolerance:
+            flag = "  REGRESSION"
+            regressions.append({"case": key, "baseline_s": previous["median_s"], "current_s": result["median_s"], "change": change})
+        print(f"{key:<60} {_format_seconds(previous['median_s']):>10} {_format_seconds(result['median_s']):>10} {change:>+7.0%}{flag}")
+    return regressions
+
+
+def build_parser(description: str) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per case")
+    parser.add_argument("--min-time", type=float, default=0.05, help="Minimum seconds per round")
+    parser.add_argument("--baseline", type=Path, default=None, help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="Write results to the baseline file")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed median slowdown before flagging")
+    parser.add_argument("--allow-missing-baseline", action="store_true",
+                        help="Only warn (exit 0) when there is no baseline to compare against")
+    return parser
+
+
+def finish(args: argparse.Namespace, runner: BenchmarkRunner, default_baseline: str):
+    """Save or compare against the baseline and exit non-zero on regressions."""
+    runner.close()
+    path = args.baseline or BASELINE_DIR / default_baseline
+    if args.save_baseline:
+        save_baseline(path, runner.results)
+        print(f"\nBaseline written to {path}")
+        return
+
+    baseline = load_baseline(path)
+    if baseline is None:
+        print(f"\nNo baseline at {path}; nothing was compared. Run with --save-baseline to create one.", file=sys.stderr)
+        if not args.allow_missing_baseline:
+            sys.exit(2)
+        return
+    if (baseline.get("python"), baseline.get("machine")) != (platform.python_version(), platform.machine()):
+        print(f"\nBaseline was recorded on Python {baseline.get('python')} ({baseline.get('machine')}); "
+              "timings from another interpreter or machine are only roughly comparable.", file=sys.stderr)
+    regressions = compare(runner.results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}")
+        sys.exit(1)
+    print("\nNo regressions.")
@@ -0,0 +1,361 @@
+"""
+Load test: drive the FastAPI app with a weighted scenario mix.
+
+Virtual users issue chat turns, job listings, application uploads and ATS
+rankings back to back for a fixed duration, against stand-ins for Supabase,
+storage, Groq and CV downloads (each with configurable latency). Reports
+throughput and p50/p95/p99 latency per endpoint, plus event-loop lag of the
+loop serving the app.
+
+Run from the backend directory:
+    python -m benchmarks.load_test --users 20 --duration 10
+    python -m benchmarks.load_test --mix chat=1,list_jobs=6,apply=2,rank=1 --db-latency 0.02
+    python -m benchmarks.load_test --serve-port 8765      # same stubs, over localhost via uvicorn
+    python -m benchmarks.load_test --url http://localhost:8000 --token <jwt> --mix list_jobs=1
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import threading
+import time
+from collections import defaultdict
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional
+from unittest.mock import patch
+
+os.environ.setdefault("GROQ_API_KEY", "benchmark")
+
+import httpx
+from fastapi import Request
+
+from tests.fakes import FakeSupabase
+from benchmarks.fakes import FakeLLM, fake_backend, synthetic_jobs
+from core.auth import verify_jwt, verify_recruiter
+from core.models import User
+
+USER_HEADER = "X-Load-User"
+PDF_BYTES = b"%PDF-1.4\n% synthetic load-test CV\n"
+
+
+@dataclass
+class Stubs:
+    """Latencies (seconds) of the stand-ins for external services."""
+
+    db_latency: float = 0.005
+    llm_latency: float = 0.2
+    cv_latency: float = 0.05
+    jobs: int = 1000
+    recruiters: int = 20
+    applicants: int = 200
+    applications_per_job: int = 5
+
+
+def _seed_tables(stubs: Stubs) -> Dict[str, List[dict]]:
+    jobs = synthetic_jobs(stubs.jobs, recruiters=stubs.recruiters)
+    users = [{"id": f"recruiter-{i}", "email": f"recruiter{i}@example.com", "role": "recruiter", "full_name": f"Recruiter {i}"}
+             for i in range(stubs.recruiters)]
+    users += [{"id": f"applicant-{i}", "email": f"applicant{i}@example.com", "role": "applicant", "full_name": f"Applicant {i}"}
+              for i in range(stubs.applicants)]
+    applications = []
+    for index, job in enumerate(jobs[:200]):
+        for n in range(stubs.applications_per_job):
+            applicant = f"applicant-{(index * 7 + n) % stubs.applicants}"
+            applications.append({
+                "id": f"{job['id']}-app-{n}",
+                "job_id": job["id"],
+                "applicant_id": applicant,
+                "recruiter_id": job["created_by"],
+                "applicant_name": applicant,
+                "cv_url": f"https://storage.example.com/cv-uploads/{applicant}.pdf",
+                "cover_letter": "I would love to join.",
+                "motivation": "Hiring tools matter.",
+                "proud_project": "A job scheduler.",
+                "created_at": job["created_at"],
+            })
+    return {"jobs": jobs, "users": users, "applications": applications}
+
+
+def install_stubs(stubs: Stubs, app) -> ExitStack:
+    """Patch Supabase, storage, Groq, CV downloads and auth for the duration of the returned stack."""
+    supabase = FakeSupabase(_seed_tables(stubs), latency=stubs.db_latency)
+    llm = FakeLLM(base_latency=stubs.llm_latency)
+    users = {row["id"]: row for row in supabase.tables["users"]}
+
+    async def fake_cv_download(cv_url: str, max_chars: int = 8000) -> str:
+        await asyncio.sleep(stubs.cv_latency)
+        return "Backend engineer with Python, FastAPI, PostgreSQL and Docker experience. " * 20
+
+    def fake_user(request: Request) -> User:
+        row = users[request.headers.get(USER_HEADER, "applicant-0")]
+        return User(id=row["id"], email=row["email"], role=row["role"], full_name=row["full_name"])
+
+    # Per-request trace lines would dominate the output
+    logging.getLogger("recruitment.tracing").setLevel(logging.WARNING)
+    # The synthetic upload is not a parseable PDF; its extraction failure is expected
+    logging.getLogger("recruitment.cv_parser").setLevel(logging.ERROR)
+
+    stack = ExitStack()
+    stack.enter_context(fake_backend(supabase, llm))
+    stack.enter_context(patch("agent.tools.applicant_tools.download_and_extract_cv_text", fake_cv_download))
+    stack.enter_context(patch("agent.utils.rate_limit.RATE_LIMIT_MAX_REQUESTS", 10 ** 9))
+    app.dependency_overrides[verify_jwt] = fake_user
+    app.dependency_overrides[verify_recruiter] = fake_user
+    stack.callback(app.dependency_overrides.clear)
+    return stack
+
+
+# Scenario: coroutine issuing one request for a virtual user
+Scenario = Callable[[httpx.AsyncClient, random.Random, Stubs], Awaitable[httpx.Response]]
+
+
+def _recruiter(rng: random.Random, stubs: Stubs) -> str:
+    return f"recruiter-{rng.randrange(stubs.recruiters)}"
+
+
+def _job_id(rng: random.Random, stubs: Stubs, owned_by: Optional[str] = None) -> str:
+    # Jobs are assigned to recruiters round-robin; only the first 200 have applications
+    if owned_by is None:
+        return f"job-{rng.randrange(stubs.jobs)}"
+    recruiter = int(owned_by.rsplit("-", 1)[1])
+    candidates = range(recruiter, min(stubs.jobs, 200), stubs.recruiters)
+    return f"job-{rng.choice(candidates)}" if candidates else f"job-{recruiter}"
+
+
+async def scenario_list_jobs(client, rng, stubs):
+    return await client.get("/jobs")
+
+
+async def scenario_get_job(client, rng, stubs):
+    return await client.get(f"/jobs/{_job_id(rng, stubs)}")
+
+
+async def scenario_chat(client, rng, stubs):
+    message = rng.choice([
+        "Find python jobs in London",
+        "How many applications do we have?",
+        "Help me write a rejection message",
+        "Show jobs in Berlin over 80k",
+    ])
+    user = _recruiter(rng, stubs)
+    return await client.post("/agent/chat", json={"message": message, "user_id": user, "conversation_id": f"load-{user}"},
+                             headers={USER_HEADER: user})
+
+
+async def scenario_apply(client, rng, stubs):
+    applicant = f"applicant-{rng.randrange(stubs.applicants)}"
+    return await client.post(
+        "/applications",
+        data={"job_id": _job_id(rng, stubs), "motivation": "I like the mission.", "proud_project": "Scheduler"},
+        files={"cv_file": ("cv.pdf", PDF_BYTES, "application/pdf")},
+        headers={USER_HEADER: applicant},
+    )
+
+
+async def scenario_rank(client, rng, stubs):
+    recruiter = _recruiter(rng, stubs)
+    return await client.post("/ats/rank", json={"job_id": _job_id(rng, stubs, owned_by=recruiter)}, headers={USER_HEADER: recruiter})
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "list_jobs": scenario_list_jobs,
+    "get_job": scenario_get_job,
+    "chat": scenario_chat,
+    "apply": scenario_apply,
+    "rank": scenario_rank,
+}
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    mix = {}
+    for part in text.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        if name.strip() not in SCENARIOS:
+            raise SystemExit(f"Unknown scenario '{name.strip()}' (choose from {', '.join(SCENARIOS)})")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+class LoopLagMonitor:
+    """Measures how late a periodic sleep wakes up on the event loop serving the app."""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.samples: List[float] = []
+        self._running = False
+
+    async def run(self):
+        self._running = True
+        while self._running:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, time.perf_counter() - start - self.interval))
+
+    def stop(self):
+        self._running = False
+
+
+@dataclass
+class LoadResult:
+    latencies: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    elapsed: float = 0.0
+
+
+async def _virtual_user(client, mix, stubs, rng, deadline, result: LoadResult):
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    while time.perf_counter() < deadline:
+        name = rng.choices(names, weights)[0]
+        start = time.perf_counter()
+        try:
+            response = await SCENARIOS[name](client, rng, stubs)
+            failed = response.status_code >= 400
+        except httpx.HTTPError:
+            failed = True
+        result.latencies[name].append(time.perf_counter() - start)
+        if failed:
+            result.errors[name] += 1
+
+
+async def generate_load(client: httpx.AsyncClient, mix, stubs: Stubs, users: int, duration: float, seed: int) -> LoadResult:
+    result = LoadResult()
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*(
+        _virtual_user(client, mix, stubs, random.Random(seed + i), deadline, result) for i in range(users)
+    ))
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+def summarize(result: LoadResult, lag: List[float]) -> dict:
+    endpoints = {}
+    for name, samples in sorted(result.latencies.items()):
+        endpoints[name] = {
+            "requests": len(samples),
+            "errors": result.errors.get(name, 0),
+            "rps": round(len(samples) / result.elapsed, 2) if result.elapsed else 0.0,
+            "p50_ms": round(_percentile(samples, 0.50) * 1000, 1),
+            "p95_ms": round(_percentile(samples, 0.95) * 1000, 1),
+            "p99_ms": round(_percentile(samples, 0.99) * 1000, 1),
+        }
+    total = sum(len(samples) for samples in result.latencies.values())
+    return {
+        "duration_s": round(result.elapsed, 2),
+        "requests": total,
+        "throughput_rps": round(total / result.elapsed, 2) if result.elapsed else 0.0,
+        "endpoints": endpoints,
+        "loop_lag_ms": {
+            "p50": round(_percentile(lag, 0.50) * 1000, 1),
+            "p99": round(_percentile(lag, 0.99) * 1000, 1),
+            "max": round(max(lag, default=0.0) * 1000, 1),
+            "mean": round(statistics.fmean(lag) * 1000, 1) if lag else 0.0,
+        },
+    }
+
+
+def print_report(summary: dict):
+    print(f"\n{summary['requests']} requests in {summary['duration_s']} s -> {summary['throughput_rps']} req/s")
+    print(f"{'endpoint':<12} {'reqs':>7} {'errors':>7} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for name, row in summary["endpoints"].items():
+        print(f"{name:<12} {row['requests']:>7} {row['errors']:>7} {row['rps']:>8} {row['p50_ms']:>8} {row['p95_ms']:>8} {row['p99_ms']:>8}")
+    lag = summary["loop_lag_ms"]
+    if lag["max"]:
+        print(f"event-loop lag: p50 {lag['p50']} ms, p99 {lag['p99']} ms, max {lag['max']} ms")
+
+
+async def run_in_process(app, args, mix, stubs) -> dict:
+    monitor = LoopLagMonitor()
+    monitor_task = asyncio.create_task(monitor.run())
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=args.timeout) as client:
+        result = await generate_load(client, mix, stubs, args.users, args.duration, args.seed)
+    monitor.stop()
+    await monitor_task
+    return summarize(result, monitor.samples)
+
+
+async def run_over_http(base_url: str, args, mix, stubs, monitor: Optional[LoopLagMonitor] = None) -> dict:
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, timeout=args.timeout, limits=limits) as client:
+        result = await generate_load(client, mix, stubs, args.users, args.duration, args.seed)
+    return summarize(result, monitor.samples if monitor else [])
+
+
+def serve_in_thread(app, port: int):
+    """Start uvicorn on localhost in a background thread; returns (server, loop, lag monitor)."""
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", lifespan="off"))
+    loop = asyncio.new_event_loop()
+    monitor = LoopLagMonitor()
+
+    def run():
+        asyncio.set_event_loop(loop)
+        loop.create_task(monitor.run())
+        loop.run_until_complete(server.serve())
+
+    threading.Thread(target=run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, loop, monitor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mix", default="list_jobs=5,get_job=2,chat=1,apply=1,rank=1", help="scenario=weight,...")
+    parser.add_argument("--users", type=int, default=20, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of load")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--db-latency", type=float, default=Stubs.db_latency, help="Seconds per Supabase/storage call")
+    parser.add_argument("--llm-latency", type=float, default=Stubs.llm_latency, help="Seconds per LLM call")
+    parser.add_argument("--cv-latency", type=float, default=Stubs.cv_latency, help="Seconds per CV download")
+    parser.add_argument("--jobs", type=int, default=Stubs.jobs, help="Synthetic catalogue size")
+    parser.add_argument("--serve-port", type=int, default=None, help="Serve the stubbed app with uvicorn on this port")
+    parser.add_argument("--url", default=None, help="Target an already running server (no stubs)")
+    parser.add_argument("--token", default=None, help="Bearer token for --url")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    stubs = Stubs(db_latency=args.db_latency, llm_latency=args.llm_latency, cv_latency=args.cv_latency, jobs=args.jobs)
+
+    if args.url:
+        summary = asyncio.run(run_over_http(args.url, args, mix, stubs))
+    else:
+        from main import app
+
+        with install_stubs(stubs, app):
+            if args.serve_port:
+                server, loop, monitor = serve_in_thread(app, args.serve_port)
+                try:
+                    summary = asyncio.run(run_over_http(f"http://127.0.0.1:{args.serve_port}", args, mix, stubs, monitor))
+                finally:
+                    loop.call_soon_threadsafe(monitor.stop)
+                    server.should_exit = True
+            else:
+                summary = asyncio.run(run_in_process(app, args, mix, stubs))
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_report(summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,9 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from supabase import create_client, Client
 
 from .config import get_supabase_client
+from . import db
 from .models import User
+from .tracing import span
 
 security = HTTPBearer()
 
@@ -26,7 +28,8 @@ async def verify_jwt(credentials: HTTPAuthorizationCredentials = Security(securi
         supabase.postgrest.auth(token)
         
         # Get user from Supabase using the token
-        response = supabase.auth.get_user(token)
+        with span("auth.get_user"):
+            response = await db.run_sync(supabase.auth.get_user, token)
         
         if not response or not response.user:
             raise HTTPException(status_code=401, detail="Invalid token")
@@ -35,18 +38,18 @@ async def verify_jwt(credentials: HTTPAuthorizationCredentials = Security(securi
         role = user_data.user_metadata.get("role", "applicant")
         
         # Get user from database to ensure they exist
-        db_user = supabase.table("users").select("*").eq("id", user_data.id).execute()
+        db_user = await db.execute(supabase.table("users").select("*").eq("id", user_data.id), "users", "select")
         
         if not db_user.data:
             # Automatically provision user record if missing
             service_client = get_supabase_client()
-            service_client.table("users").upsert({
+            await db.execute(service_client.table("users").upsert({
                 "id": user_data.id,
                 "email": user_data.email,
                 "role": role,
                 "full_name": user_data.user_metadata.get("full_name")
-            }).execute()
-            db_user = service_client.table("users").select("*").eq("id", user_data.id).execute()
+            }), "users", "upsert")
+            db_user = await db.execute(service_client.table("users").select("*").eq("id", user_data.id), "users", "select")
             if not db_user.data:
                 raise HTTPException(status_code=401, detail="User not found in database")
         
@@ -0,0 +1,107 @@
+"""
+Small in-process TTL caches for read-heavy endpoints.
+
+Entries expire after ``ttl_seconds`` and writers invalidate the keys they
+affect, so a stale value is never served longer than the TTL even if an
+invalidation is missed (e.g. a write made directly in Supabase).
+
+The public job catalogue is validated with ETags instead, derived from the
+shared ``catalogue_version`` row that a trigger on ``jobs`` bumps, so every
+worker issues the same tag for the same data and sees every write.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional
+
+from core.config import Config
+
+
+class TTLCache:
+    """Bounded LRU mapping whose entries expire ``ttl_seconds`` after being stored."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None):
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Signed CV preview URLs per (recruiter, application), dropped shortly before the signature expires
+signed_url_cache = TTLCache(
+    max(0, Config.CV_SIGNED_URL_TTL_SECONDS - Config.CV_SIGNED_URL_REFRESH_MARGIN_SECONDS),
+    max_entries=4096,
+)
+
+# Per-recruiter dashboard aggregates (routes/dashboard.py)
+dashboard_cache = TTLCache(Config.DASHBOARD_CACHE_TTL_SECONDS)
+
+
+def invalidate_dashboard(recruiter_id: Optional[str]):
+    """Drop a recruiter's cached dashboard after one of their jobs or applications changed."""
+    if recruiter_id:
+        dashboard_cache.invalidate(recruiter_id)
+
+
+# Called with (job, removed_job_id) after every job write. Modules holding
+# job-derived state register themselves when imported, so the write path
+# never imports them (or numpy) just to notify them.
+_job_write_listeners: List[Callable[[Optional[dict], Optional[str]], None]] = []
+
+
+def on_job_write(listener: Callable[[Optional[dict], Optional[str]], None]):
+    """Register ``listener`` to run after each job write; usable as a decorator."""
+    _job_write_listeners.append(listener)
+    return listener
+
+
+def notify_job_write(job: Optional[dict] = None, removed_job_id: Optional[str] = None):
+    for listener in _job_write_listeners:
+        listener(job, removed_job_id)
+
+
+def catalogue_etag(version: str, suffix: str = "") -> str:
+    """Weak ETag for catalogue ``version`` (``suffix`` distinguishes resources).
+
+    Weak because GZipMiddleware may compress the body after the tag is set,
+    so the bytes sent are not always the ones the tag describes.
+    """
+    tag = f"jobs-{version}"
+    return f'W/"{tag}-{suffix}"' if suffix else f'W/"{tag}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an ``If-None-Match`` header matches ``etag`` (weak comparison, as RFC 9110 requires)."""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    opaque = etag.removeprefix("W/")
+    return "*" in candidates or any(candidate.removeprefix("W/") == opaque for candidate in candidates)
@@ -18,6 +18,46 @@ class Config:
     LANGSMITH_API_KEY = os.getenv("LANGSMITH_API_KEY")
     LANGSMITH_PROJECT = os.getenv("LANGSMITH_PROJECT", "recruitment-agent")
     LANGSMITH_TRACING_V2 = os.getenv("LANGSMITH_TRACING_V2", "true")
+    # Deployment profile: "full" serves every route, "crud" leaves out the agent and ATS routes
+    DEPLOYMENT_PROFILE = os.getenv("DEPLOYMENT_PROFILE", "full").lower()
+    # Applicants scored per ATS prompt (1 disables batched scoring)
+    ATS_BATCH_SIZE = int(os.getenv("ATS_BATCH_SIZE", "5"))
+    # Applicants sent to the LLM after the local pre-screen (0 sends everyone)
+    ATS_PRESCREEN_TOP_K = int(os.getenv("ATS_PRESCREEN_TOP_K", "20"))
+    # Score each application against its job in a background task right after it is submitted
+    ATS_SCORE_ON_SUBMIT = os.getenv("ATS_SCORE_ON_SUBMIT", "true").lower() == "true"
+    # Disk cache for deterministic LLM extraction prompts
+    LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", str(Path(__file__).parent.parent / ".cache" / "llm_cache.sqlite3"))
+    LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))
+    # Worker threads available to blocking Supabase client calls
+    DB_MAX_CONCURRENCY = int(os.getenv("DB_MAX_CONCURRENCY", "20"))
+    # Debug: per-request span tracing (Server-Timing header + structured log line); exposes
+    # internal span and table names to clients, so keep it off outside development
+    TRACE_REQUESTS = os.getenv("TRACE_REQUESTS", "false").lower() == "true"
+    # Debug: count Supabase calls per request and warn above the threshold
+    TRACE_DB_CALLS = os.getenv("TRACE_DB_CALLS", "false").lower() == "true"
+    TRACE_DB_CALL_WARNING = int(os.getenv("TRACE_DB_CALL_WARNING", "10"))
+    # Recruiter dashboard aggregates: cache lifetime and length of the daily series
+    DASHBOARD_CACHE_TTL_SECONDS = float(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", "30"))
+    DASHBOARD_SERIES_DAYS = int(os.getenv("DASHBOARD_SERIES_DAYS", "30"))
+    # Browser/CDN freshness for the public job endpoints (revalidated with ETags afterwards)
+    JOBS_CACHE_MAX_AGE_SECONDS = int(os.getenv("JOBS_CACHE_MAX_AGE_SECONDS", "60"))
+    # Responses at least this large (bytes) are gzip-compressed for clients that accept it
+    GZIP_MINIMUM_SIZE = int(os.getenv("GZIP_MINIMUM_SIZE", "1024"))
+    GZIP_COMPRESS_LEVEL = int(os.getenv("GZIP_COMPRESS_LEVEL", "5"))
+    # CV preview links: lifetime of a signed URL and how long before expiry a cached one is re-signed
+    CV_SIGNED_URL_TTL_SECONDS = int(os.getenv("CV_SIGNED_URL_TTL_SECONDS", "600"))
+    CV_SIGNED_URL_REFRESH_MARGIN_SECONDS = int(os.getenv("CV_SIGNED_URL_REFRESH_MARGIN_SECONDS", "60"))
+    # Background ranking jobs: an active job with no progress for this long is resumed by another worker,
+    # how often a running job touches its row while it works, and how often the progress stream re-reads the job
+    RANKING_JOB_STALE_SECONDS = int(os.getenv("RANKING_JOB_STALE_SECONDS", "300"))
+    RANKING_JOB_HEARTBEAT_SECONDS = float(os.getenv("RANKING_JOB_HEARTBEAT_SECONDS", "60"))
+    RANKING_JOB_POLL_SECONDS = float(os.getenv("RANKING_JOB_POLL_SECONDS", "1.0"))
+    # Job recommendations: hashed TF-IDF feature count (memory is 4 bytes x features per open job)
+    # and how often the in-memory job vectors are rebuilt to pick up other workers' writes
+    JOB_RECOMMENDER_FEATURES = int(os.getenv("JOB_RECOMMENDER_FEATURES", "2048"))
+    JOB_RECOMMENDER_REFRESH_SECONDS = int(os.getenv("JOB_RECOMMENDER_REFRESH_SECONDS", "300"))
 
 
 def get_supabase_client() -> Client:
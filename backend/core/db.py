@@ -0,0 +1,63 @@
+"""
+Instrumented, non-blocking Supabase access.
+
+supabase-py is synchronous, so every PostgREST query, storage call and auth
+call runs on a worker thread (bounded by ``Config.DB_MAX_CONCURRENCY``)
+instead of on the event loop. Each query is counted and timed per table and
+operation on ``/metrics`` and recorded as a span on the current request's
+trace.
+"""
+
+import time
+from functools import partial
+from typing import Any, Callable, Optional
+
+import anyio
+import anyio.to_thread
+from fastapi import HTTPException
+
+from core.config import Config
+from core.metrics import DB_CALLS, DB_CALL_SECONDS
+from core.tracing import count_db_call, span
+
+_limiter: Optional[anyio.CapacityLimiter] = None
+
+
+def _get_limiter() -> anyio.CapacityLimiter:
+    global _limiter
+    if _limiter is None:
+        _limiter = anyio.CapacityLimiter(Config.DB_MAX_CONCURRENCY)
+    return _limiter
+
+
+async def run_sync(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking Supabase client call (storage, auth, ...) on the worker pool."""
+    return await anyio.to_thread.run_sync(partial(func, *args, **kwargs), limiter=_get_limiter())
+
+
+async def execute(query, table: str, operation: str):
+    """Run ``query.execute()`` off the event loop and record its latency and outcome."""
+    if Config.TRACE_DB_CALLS:
+        count_db_call(table, operation)
+    start = time.perf_counter()
+    status = "ok"
+    try:
+        with span(f"db.{operation}.{table}"):
+            return await run_sync(query.execute)
+    except Exception:
+        status = "error"
+        raise
+    finally:
+        DB_CALL_SECONDS.observe(time.perf_counter() - start, table, operation)
+        DB_CALLS.inc(table, operation, status)
+
+
+async def raise_for_missing_or_forbidden(supabase, table: str, record_id: str, not_found: str, forbidden: str):
+    """Explain why an ownership-filtered write matched no rows: 404 if the row is gone, else 403.
+
+    Only runs on the failure path; the successful write stays a single round trip.
+    """
+    existing = await execute(supabase.table(table).select("id").eq("id", record_id).limit(1), table, "select")
+    if not existing.data:
+        raise HTTPException(status_code=404, detail=not_found)
+    raise HTTPException(status_code=403, detail=forbidden)
@@ -52,6 +52,10 @@ class Job(NormalizedBaseModel):
     created_at: Optional[datetime] = Field(default=None)
 
 
+class RecommendedJob(Job):
+    score: float  # cosine similarity of the job to the applicant's CV, 0..1
+
+
 class JobCreate(NormalizedBaseModel):
     title: str
     description: str
@@ -65,6 +69,7 @@ class Application(NormalizedBaseModel):
     applicant_id: str
     job_id: str
     cv_url: str
+    cv_path: Optional[str] = None
     cover_letter: Optional[str] = None
     recruiter_id: Optional[str] = None
     applicant_name: Optional[str] = None
@@ -98,13 +103,31 @@ class RankedApplicant(NormalizedBaseModel):
     cv_url: str
     application_id: str
     skills: list[str]
+    provisional: bool = False  # True when only the local pre-screen scored this applicant
 
 
 class ATSRankingRequest(NormalizedBaseModel):
     job_id: str
 
 
+class CVPreviewBatchRequest(NormalizedBaseModel):
+    application_ids: list[str]
+
+
 class ATSRankingResponse(NormalizedBaseModel):
     job_id: str
     job_title: str
     applicants: list[RankedApplicant]
+
+
+class RankingJob(NormalizedBaseModel):
+    id: str
+    job_id: str
+    job_title: Optional[str] = None
+    status: str  # 'queued', 'running', 'completed', 'failed' or 'cancelled'
+    total: int = 0  # applicants on the shortlist sent to the ATS model
+    completed: int = 0
+    applicants: list[RankedApplicant] = []  # scored so far, best first
+    error: Optional[str] = None
+    created_at: Optional[datetime] = Field(default=None)
+    updated_at: Optional[datetime] = None
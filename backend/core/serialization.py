@@ -0,0 +1,62 @@
+"""
+Fast serialization for large lists of trusted database rows.
+
+List endpoints declare ``response_model=List[Job]`` and friends for the
+OpenAPI schema, but running thousands of Supabase rows through
+``NormalizedBaseModel`` validation and ``jsonable_encoder`` dominates the
+request. Rows we just read from our own tables are already well-typed, so
+``project_rows`` only applies what the models would change in the output
+(drop unknown columns, fill missing fields with their defaults, trim
+strings, default ``created_at``) and ``FastJSONResponse`` encodes the result
+with orjson.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Type
+
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+class FastJSONResponse(Response):
+    """JSON response rendered with orjson (datetimes, UUIDs and non-str keys supported)."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _defaults(model: Type[BaseModel]) -> Dict[str, Any]:
+    return {
+        name: (None if field.is_required() else field.get_default(call_default_factory=True))
+        for name, field in model.model_fields.items()
+    }
+
+
+def project_rows(rows: Iterable[Dict[str, Any]], model: Type[BaseModel]) -> List[Dict[str, Any]]:
+    """Shape trusted rows like ``model`` would serialize them, without validating each one."""
+    defaults = _defaults(model)
+    fields = list(defaults)
+    fill_created_at = "created_at" in defaults
+    now = None
+    projected = []
+    for row in rows:
+        item = {}
+        for name in fields:
+            value = row.get(name, defaults[name])
+            if isinstance(value, str):
+                value = value.strip()
+            item[name] = value
+        if fill_created_at and item["created_at"] is None:
+            # Same naive UTC default as NormalizedBaseModel
+            now = now or datetime.utcnow().isoformat()
+            item["created_at"] = now
+        projected.append(item)
+    return projected
+
+
+def fast_list_response(rows: Iterable[Dict[str, Any]], model: Type[BaseModel], **kwargs) -> FastJSONResponse:
+    """``FastJSONResponse`` of ``rows`` projected onto ``model``'s fields."""
+    return FastJSONResponse(project_rows(rows, model), **kwargs)
@@ -0,0 +1,128 @@
+"""
+Request-scoped span recorder.
+
+The HTTP middleware opens a ``RequestTrace`` and stores it in a context
+variable, so routes, auth, tools, graph nodes, LLM and Supabase calls can
+record spans without threading the trace through every signature. Tasks
+started with ``asyncio.gather`` and ``asyncio.to_thread`` inherit the same
+trace. At the end of the request the spans are rendered as a
+``Server-Timing`` header and one structured log line.
+"""
+
+import json
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+logger = logging.getLogger("recruitment.tracing")
+
+_TOKEN_UNSAFE = re.compile(r"[^A-Za-z0-9!#$%&'*+\-.^_`|~]")
+
+
+@dataclass
+class Span:
+    name: str
+    start: float
+    duration: float
+
+
+@dataclass
+class RequestTrace:
+    """Spans and Supabase call counts for one request."""
+
+    method: str
+    path: str
+    started: float = field(default_factory=time.perf_counter)
+    spans: List[Span] = field(default_factory=list)
+    db_calls: Counter = field(default_factory=Counter)
+
+    def add(self, name: str, start: float, duration: float):
+        self.spans.append(Span(name, start - self.started, duration))
+
+    def summary(self) -> List[dict]:
+        """Spans with the same name merged (total duration and count), in first-seen order."""
+        merged: dict[str, dict] = {}
+        for span in self.spans:
+            entry = merged.setdefault(span.name, {"name": span.name, "dur_ms": 0.0, "count": 0})
+            entry["dur_ms"] += span.duration * 1000
+            entry["count"] += 1
+        return list(merged.values())
+
+    def server_timing(self, total: float) -> str:
+        """``Server-Timing`` header value (metric names restricted to HTTP token characters)."""
+        parts = []
+        for entry in self.summary():
+            name = _TOKEN_UNSAFE.sub("_", entry["name"])
+            desc = f';desc="x{entry["count"]}"' if entry["count"] > 1 else ""
+            parts.append(f'{name};dur={entry["dur_ms"]:.1f}{desc}')
+        parts.append(f"total;dur={total * 1000:.1f}")
+        return ", ".join(parts)
+
+    def log_record(self, status: int, total: float) -> dict:
+        record = {
+            "method": self.method,
+            "path": self.path,
+            "status": status,
+            "total_ms": round(total * 1000, 1),
+            "spans": [
+                {"name": span.name, "offset_ms": round(span.start * 1000, 1), "dur_ms": round(span.duration * 1000, 1)}
+                for span in self.spans
+            ],
+        }
+        if self.db_calls:
+            record["db_calls"] = sum(self.db_calls.values())
+            record["db_calls_by_query"] = {key: count for key, count in self.db_calls.most_common()}
+        return record
+
+
+_CURRENT_TRACE: ContextVar[Optional[RequestTrace]] = ContextVar("request_trace", default=None)
+
+
+def start_trace(method: str, path: str):
+    """Open a trace for the current request; returns the token for ``end_trace``."""
+    trace = RequestTrace(method=method, path=path)
+    return trace, _CURRENT_TRACE.set(trace)
+
+
+def end_trace(token):
+    _CURRENT_TRACE.reset(token)
+
+
+def current_trace() -> Optional[RequestTrace]:
+    return _CURRENT_TRACE.get()
+
+
+@contextmanager
+def span(name: str):
+    """Record the duration of the ``with`` block on the current request's trace (no-op outside a request)."""
+    trace = _CURRENT_TRACE.get()
+    if trace is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(name, start, time.perf_counter() - start)
+
+
+def count_db_call(table: str, operation: str):
+    """Count one Supabase call on the current trace (used when DB call debugging is on)."""
+    trace = _CURRENT_TRACE.get()
+    if trace is not None:
+        trace.db_calls[f"{operation} {table}"] += 1
+
+
+def log_trace(trace: RequestTrace, status: int, total: float, db_call_warning: int):
+    """Emit the structured log line, as a warning when the request made too many Supabase calls."""
+    record = trace.log_record(status, total)
+    level = logging.INFO
+    if db_call_warning and record.get("db_calls", 0) > db_call_warning:
+        level = logging.WARNING
+        record["warning"] = "possible N+1 query pattern"
+    logger.log(level, json.dumps(record))
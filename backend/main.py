@@ -1,8 +1,15 @@
-from fastapi import FastAPI, HTTPException
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from routes import auth_router, jobs_router, applications_router, agent_router, files_router, ats_router
+from fastapi.middleware.gzip import GZipMiddleware
+from routes import auth_router, jobs_router, applications_router, agent_router, files_router, ats_router, dashboard_router
 import os
 from core.config import Config
+from core.metrics import CONTENT_TYPE_LATEST, HTTP_REQUESTS, HTTP_REQUEST_SECONDS, render_metrics
+from core.tracing import end_trace, log_trace, start_trace
 
 # Initialize LangSmith observability
 # LangSmith automatically traces LangChain and LangGraph components when env vars are set
@@ -15,7 +22,27 @@ if Config.LANGSMITH_API_KEY:
 else:
     print("LangSmith API key not found. Observability disabled.")
 
-app = FastAPI(title="Recruitment System API", version="1.0.0")
+# Structured per-request trace lines
+trace_logger = logging.getLogger("recruitment.tracing")
+if not trace_logger.handlers:
+    trace_logger.addHandler(logging.StreamHandler())
+    trace_logger.setLevel(logging.INFO)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Resume background ranking jobs left unfinished by a stopped worker."""
+    resume_task = None
+    if Config.DEPLOYMENT_PROFILE != "crud":
+        from agent.tools.ranking_jobs import resume_ranking_jobs_periodically
+
+        resume_task = asyncio.create_task(resume_ranking_jobs_periodically())
+    yield
+    if resume_task is not None:
+        resume_task.cancel()
+
+
+app = FastAPI(title="Recruitment System API", version="1.0.0", lifespan=lifespan)
 
 # CORS middleware
 app.add_middleware(
@@ -26,6 +53,55 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON bodies (job and application lists)
+app.add_middleware(GZipMiddleware, minimum_size=Config.GZIP_MINIMUM_SIZE, compresslevel=Config.GZIP_COMPRESS_LEVEL)
+
+
+# id(route) -> full template for routes of included routers, whose own ``path`` lacks the router prefix
+_ROUTE_TEMPLATES: dict[int, str] = {}
+
+
+def _route_template(request: Request) -> str:
+    """Template of the matched route (``/jobs/{job_id}``); ``"unmatched"`` keeps 404 paths out of the labels."""
+    route = request.scope.get("route")
+    if route is None:
+        return "unmatched"
+    return _ROUTE_TEMPLATES.get(id(route)) or getattr(route, "path", None) or "unmatched"
+
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """Count and time every request by its route template."""
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        path = _route_template(request)
+        HTTP_REQUEST_SECONDS.observe(time.perf_counter() - start, request.method, path)
+        HTTP_REQUESTS.inc(request.method, path, str(status))
+
+
+@app.middleware("http")
+async def trace_request(request: Request, call_next):
+    """Record request spans; return them as ``Server-Timing`` and log them as one JSON line."""
+    if not Config.TRACE_REQUESTS:
+        return await call_next(request)
+    trace, token = start_trace(request.method, request.url.path)
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        total = time.perf_counter() - trace.started
+        response.headers["Server-Timing"] = trace.server_timing(total)
+        return response
+    finally:
+        log_trace(trace, status, time.perf_counter() - trace.started, Config.TRACE_DB_CALL_WARNING if Config.TRACE_DB_CALLS else 0)
+        end_trace(token)
+
+
 # Health check
 @app.get("/")
 async def root():
@@ -37,13 +113,27 @@ async def health_check():
     return {"status": "ok"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus text exposition of in-process metrics."""
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+
 # Register routers
-app.include_router(auth_router, prefix="/auth", tags=["auth"])
-app.include_router(jobs_router, prefix="/jobs", tags=["jobs"])
-app.include_router(applications_router, prefix="/applications", tags=["applications"])
-app.include_router(agent_router, prefix="/agent", tags=["agent"])
-app.include_router(files_router, prefix="/files", tags=["files"])
-app.include_router(ats_router, prefix="/ats", tags=["ats"])
+def _include_router(router, prefix: str):
+    app.include_router(router, prefix=prefix, tags=[prefix.strip("/")])
+    for route in router.routes:
+        _ROUTE_TEMPLATES[id(route)] = prefix + route.path
+
+
+_include_router(auth_router, "/auth")
+_include_router(jobs_router, "/jobs")
+_include_router(applications_router, "/applications")
+_include_router(files_router, "/files")
+if Config.DEPLOYMENT_PROFILE != "crud":
+    _include_router(agent_router, "/agent")
+    _include_router(ats_router, "/ats")
+_include_router(dashboard_router, "/dashboard")
 
 
 if __name__ == "__main__":
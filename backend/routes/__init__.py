@@ -7,6 +7,7 @@ from .applications import router as applications_router
 from .agent import router as agent_router
 from .files import router as files_router
 from .ats import router as ats_router
+from .dashboard import router as dashboard_router
 
 __all__ = [
     "auth_router",
@@ -14,5 +15,6 @@ __all__ = [
     "applications_router",
     "agent_router",
     "files_router",
-    "ats_router"
+    "ats_router",
+    "dashboard_router"
 ]
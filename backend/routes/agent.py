@@ -1,6 +1,5 @@
 from fastapi import APIRouter, HTTPException
 from core.models import ChatMessage, ChatResponse
-from agent.orchestration import run_agent
 import uuid
 
 router = APIRouter()
@@ -10,6 +9,9 @@ router = APIRouter()
 async def chat(message: ChatMessage):
     """Chat with AI agent - uses user_id from the request to track job creation."""
     try:
+        # Imported on first chat so CRUD-only traffic never loads LangGraph/LangChain
+        from agent.orchestration import run_agent
+
         conversation_id = message.conversation_id or str(uuid.uuid4())
         
         # Use the user_id from the message to track who is creating jobs
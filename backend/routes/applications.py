@@ -1,21 +1,83 @@
 
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, UploadFile, File, Form
 from typing import List, Optional
-from core.config import get_supabase_client
+from core.config import Config, get_supabase_client
+from core import db
 from core.models import Application
-from core.auth import verify_jwt, User
+from core.serialization import fast_list_response
+from core.auth import verify_jwt, verify_recruiter, User
+from core.cache import invalidate_dashboard, signed_url_cache
+from core.tracing import span
+from agent.utils.skill_index import find_applications_by_skills, normalize_skills, remove_application_skills
 import uuid
 import os
 
 router = APIRouter()
 
+MAX_COUNT_JOB_IDS = 200
+
+# Columns returned by the list endpoint (leaves out the stored CV text)
+APPLICATION_COLUMNS = ", ".join(Application.model_fields)
+
+
+async def _process_cv_in_background(application: dict, cv_bytes: bytes, score: bool):
+    # Loaded on first use: CV parsing and ATS scoring are not needed by the other routes
+    from agent.utils.cv_parser import store_uploaded_cv_text
+
+    # Stored for every application: job recommendations read it even when nothing is scored
+    cv_text = await store_uploaded_cv_text(application["id"], cv_bytes)
+    if score:
+        from agent.tools import applicant_tools
+
+        await applicant_tools.score_application({**application, "cv_text": cv_text})
+
+
+@router.get("/counts")
+async def get_application_counts(job_ids: str, user: User = Depends(verify_jwt)):
+    """Get application counts for many jobs at once (comma-separated job_ids)."""
+    try:
+        ids = list(dict.fromkeys(job_id.strip() for job_id in job_ids.split(",") if job_id.strip()))
+        if not ids:
+            return {"counts": {}}
+        if len(ids) > MAX_COUNT_JOB_IDS:
+            raise HTTPException(status_code=400, detail=f"At most {MAX_COUNT_JOB_IDS} job_ids per request")
+        supabase = get_supabase_client()
+        response = await db.execute(supabase.table("jobs").select("id, application_count").in_("id", ids), "jobs", "select")
+        found = {row["id"]: row.get("application_count") or 0 for row in response.data or []}
+        return {"counts": {job_id: found.get(job_id, 0) for job_id in ids}}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/count/{job_id}")
 async def get_application_count(job_id: str, user: User = Depends(verify_jwt)):
     """Get the number of applications for a job (recruiter or applicant)."""
     try:
         supabase = get_supabase_client()
-        response = supabase.table("applications").select("id", count="exact").eq("job_id", job_id).execute()
-        return {"count": response.count or 0}
+        response = await db.execute(supabase.table("jobs").select("application_count").eq("id", job_id).limit(1), "jobs", "select")
+        return {"count": (response.data[0].get("application_count") or 0) if response.data else 0}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/by-skills")
+async def get_applications_by_skills(skills: str, match: str = "all", user: User = Depends(verify_recruiter)):
+    """Find the recruiter's applications by extracted skills (comma-separated, match all or any)."""
+    try:
+        if match not in {"all", "any"}:
+            raise HTTPException(status_code=400, detail="match must be 'all' or 'any'")
+        requested = [skill for skill in skills.split(",") if skill.strip()]
+        application_ids = await find_applications_by_skills(user.id, requested, match_all=(match == "all"))
+        return {
+            "skills": normalize_skills(requested),
+            "match": match,
+            "application_ids": application_ids,
+            "count": len(application_ids),
+        }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -25,7 +87,7 @@ async def get_applications(job_id: Optional[str] = None, user: User = Depends(ve
     """Get applications. Recruiters see all, applicants see only their own."""
     try:
         supabase = get_supabase_client()
-        query = supabase.table("applications").select("*")
+        query = supabase.table("applications").select(APPLICATION_COLUMNS)
         
         if user.role == "applicant":
             query = query.eq("applicant_id", user.id)
@@ -35,8 +97,8 @@ async def get_applications(job_id: Optional[str] = None, user: User = Depends(ve
         if job_id:
             query = query.eq("job_id", job_id)
         
-        response = query.order("created_at", desc=True).execute()
-        return response.data
+        response = await db.execute(query.order("created_at", desc=True), "applications", "select")
+        return fast_list_response(response.data or [], Application)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -46,7 +108,7 @@ async def get_application(application_id: str, user: User = Depends(verify_jwt))
     """Get a specific application."""
     try:
         supabase = get_supabase_client()
-        response = supabase.table("applications").select("*").eq("id", application_id).single().execute()
+        response = await db.execute(supabase.table("applications").select("*").eq("id", application_id).single(), "applications", "select")
         
         # Check authorization
         if user.role == "applicant" and response.data["applicant_id"] != user.id:
@@ -63,6 +125,7 @@ async def get_application(application_id: str, user: User = Depends(verify_jwt))
 
 @router.post("", response_model=Application)
 async def create_application(
+    background_tasks: BackgroundTasks,
     job_id: str = Form(...),
     cover_letter: Optional[str] = Form(None),
     motivation: str = Form(...),
@@ -70,7 +133,7 @@ async def create_application(
     cv_file: UploadFile = File(...),
     user: User = Depends(verify_jwt)
 ):
-    """Create a new application with CV upload."""
+    """Create a new application with CV upload; its CV text is stored (and ATS-scored) after the response."""
     try:
         if user.role != "applicant":
             raise HTTPException(status_code=403, detail="Only applicants can apply")
@@ -85,7 +148,7 @@ async def create_application(
 
         # Check if job exists
         supabase = get_supabase_client()
-        job = supabase.table("jobs").select("id", "created_by").eq("id", job_id).single().execute()
+        job = await db.execute(supabase.table("jobs").select("id", "created_by").eq("id", job_id).single(), "jobs", "select")
         if not job.data:
             raise HTTPException(status_code=404, detail="Job not found")
         recruiter_id = job.data.get("created_by")
@@ -101,27 +164,37 @@ async def create_application(
         if len(file_bytes) > 10 * 1024 * 1024:
             raise HTTPException(status_code=400, detail="File too large")
 
-        storage_response = supabase.storage.from_("cv-uploads").upload(
-            file_name,
-            file_bytes,
-            {"content-type": cv_file.content_type}
-        )
+        with span("storage.upload"):
+            storage_response = await db.run_sync(
+                supabase.storage.from_("cv-uploads").upload,
+                file_name,
+                file_bytes,
+                {"content-type": cv_file.content_type}
+            )
 
         # Get public URL
         cv_url = supabase.storage.from_("cv-uploads").get_public_url(file_name)
 
         # Create application record
         applicant_name = user.full_name or user.email
-        response = supabase.table("applications").insert({
+        response = await db.execute(supabase.table("applications").insert({
             "applicant_id": user.id,
             "job_id": job_id,
             "cv_url": cv_url,
+            "cv_path": file_name,
             "cover_letter": cover_letter,
             "recruiter_id": recruiter_id,
             "applicant_name": applicant_name,
             "motivation": motivation,
             "proud_project": proud_project
-        }).execute()
+        }), "applications", "insert")
+        invalidate_dashboard(recruiter_id)
+        background_tasks.add_task(
+            _process_cv_in_background,
+            response.data[0],
+            file_bytes,
+            Config.ATS_SCORE_ON_SUBMIT and Config.DEPLOYMENT_PROFILE != "crud",
+        )
 
         return response.data[0]
     except ValueError as e:
@@ -137,13 +210,19 @@ async def delete_application(application_id: str, user: User = Depends(verify_jw
     """Delete an application (applicant only, own applications)."""
     try:
         supabase = get_supabase_client()
-        
-        # Verify ownership
-        existing = supabase.table("applications").select("applicant_id").eq("id", application_id).single().execute()
-        if existing.data["applicant_id"] != user.id:
-            raise HTTPException(status_code=403, detail="Not authorized")
-        
-        supabase.table("applications").delete().eq("id", application_id).execute()
+
+        # Ownership is part of the filter, so the check and the delete are one statement
+        response = await db.execute(
+            supabase.table("applications").delete().eq("id", application_id).eq("applicant_id", user.id),
+            "applications",
+            "delete",
+        )
+        if not response.data:
+            await db.raise_for_missing_or_forbidden(supabase, "applications", application_id, "Application not found", "Not authorized")
+        remove_application_skills(application_id)
+        recruiter_id = response.data[0].get("recruiter_id")
+        signed_url_cache.invalidate((recruiter_id, application_id))
+        invalidate_dashboard(recruiter_id)
         return {"message": "Application deleted successfully"}
     except HTTPException:
         raise
@@ -1,8 +1,11 @@
+import asyncio
+
 from fastapi import APIRouter, HTTPException, Depends
-from core.models import ATSRankingRequest, ATSRankingResponse
+from fastapi.responses import StreamingResponse
+from core.models import ATSRankingRequest, ATSRankingResponse, RankingJob
 from core.auth import verify_recruiter, User
-from core.config import get_supabase_client
-from agent.tools.applicant_tools import rank_applicants_for_job
+from core.config import Config, get_supabase_client
+from core import db
 
 router = APIRouter()
 
@@ -13,15 +16,125 @@ async def rank_applicants(request: ATSRankingRequest, user: User = Depends(verif
     try:
         # Verify the job exists and that the requesting recruiter owns it
         supabase = get_supabase_client()
-        existing = supabase.table("jobs").select("created_by, title").eq("id", request.job_id).single().execute()
+        existing = await db.execute(supabase.table("jobs").select("created_by, title").eq("id", request.job_id).single(), "jobs", "select")
         if not existing.data:
             raise HTTPException(status_code=404, detail="Job not found")
         if existing.data.get("created_by") != user.id:
             raise HTTPException(status_code=403, detail="Not authorized to rank applicants for this job")
 
-        result = await rank_applicants_for_job(request.job_id)
+        # Loaded on first use: ATS scoring pulls in the LLM and CV parsing stack
+        from agent.tools import applicant_tools
+
+        result = await applicant_tools.rank_applicants_for_job(request.job_id)
         # attach job_title from DB for convenience (response model includes job_title)
         result.job_title = existing.data.get("title")
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/prescreen", response_model=ATSRankingResponse)
+async def prescreen_applicants(request: ATSRankingRequest, user: User = Depends(verify_recruiter)):
+    """Instant provisional ranking from the local keyword pre-screen (recruiter only)."""
+    try:
+        supabase = get_supabase_client()
+        existing = await db.execute(supabase.table("jobs").select("created_by, title").eq("id", request.job_id).single(), "jobs", "select")
+        if not existing.data:
+            raise HTTPException(status_code=404, detail="Job not found")
+        if existing.data.get("created_by") != user.id:
+            raise HTTPException(status_code=403, detail="Not authorized to rank applicants for this job")
+
+        from agent.tools import applicant_tools
+
+        return await applicant_tools.prescreen_applicants_for_job(request.job_id)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+async def _owned_ranking_job(ranking_job_id: str, user: User) -> dict:
+    from agent.tools import ranking_jobs
+
+    ranking_job = await ranking_jobs.get_ranking_job(ranking_job_id)
+    if not ranking_job:
+        raise HTTPException(status_code=404, detail="Ranking job not found")
+    if ranking_job.get("recruiter_id") != user.id:
+        raise HTTPException(status_code=403, detail="Not authorized to view this ranking job")
+    return ranking_job
+
+
+@router.post("/rank/jobs", response_model=RankingJob, status_code=202)
+async def submit_ranking_job(request: ATSRankingRequest, user: User = Depends(verify_recruiter)):
+    """Start ranking applicants in the background and return the job to poll (recruiter only)."""
+    try:
+        supabase = get_supabase_client()
+        existing = await db.execute(supabase.table("jobs").select("created_by, title").eq("id", request.job_id).single(), "jobs", "select")
+        if not existing.data:
+            raise HTTPException(status_code=404, detail="Job not found")
+        if existing.data.get("created_by") != user.id:
+            raise HTTPException(status_code=403, detail="Not authorized to rank applicants for this job")
+
+        from agent.tools import ranking_jobs
+
+        return await ranking_jobs.create_ranking_job(request.job_id, existing.data.get("title"), user.id)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/rank/jobs/{ranking_job_id}", response_model=RankingJob)
+async def get_ranking_job(ranking_job_id: str, user: User = Depends(verify_recruiter)):
+    """Progress of a ranking job with the applicants scored so far, best first (recruiter only)."""
+    try:
+        return await _owned_ranking_job(ranking_job_id, user)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/rank/jobs/{ranking_job_id}/events")
+async def stream_ranking_job(ranking_job_id: str, user: User = Depends(verify_recruiter)):
+    """Server-sent events with the ranking job each time it changes, ending once it finishes (recruiter only)."""
+    try:
+        await _owned_ranking_job(ranking_job_id, user)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    from agent.tools import ranking_jobs
+
+    async def events():
+        last_update = None
+        while True:
+            ranking_job = await ranking_jobs.get_ranking_job(ranking_job_id)
+            if ranking_job is None:
+                return
+            finished = ranking_job["status"] in ranking_jobs.TERMINAL_STATUSES
+            if ranking_job.get("updated_at") != last_update or finished:
+                last_update = ranking_job.get("updated_at")
+                event = ranking_job["status"] if finished else "progress"
+                yield f"event: {event}\ndata: {RankingJob(**ranking_job).model_dump_json()}\n\n"
+            if finished:
+                return
+            await asyncio.sleep(Config.RANKING_JOB_POLL_SECONDS)
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+@router.post("/rank/jobs/{ranking_job_id}/cancel", response_model=RankingJob)
+async def cancel_ranking_job(ranking_job_id: str, user: User = Depends(verify_recruiter)):
+    """Stop a queued or running ranking job; applicants scored so far are kept (recruiter only)."""
+    try:
+        await _owned_ranking_job(ranking_job_id, user)
+
+        from agent.tools import ranking_jobs
+
+        return await ranking_jobs.cancel_ranking_job(ranking_job_id)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
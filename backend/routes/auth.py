@@ -3,6 +3,7 @@ from pydantic import BaseModel, EmailStr, Field
 import re
 
 from core.config import get_supabase_anon_client, get_supabase_client
+from core import db
 
 router = APIRouter()
 
@@ -30,22 +31,22 @@ async def login(request: LoginRequest):
     """Login with email and password."""
     try:
         supabase = get_supabase_anon_client()
-        response = supabase.auth.sign_in_with_password({
+        response = await db.run_sync(supabase.auth.sign_in_with_password, {
             "email": request.email,
             "password": request.password
         })
 
         
         service_client = get_supabase_client()
-        user_record = service_client.table("users").select("*").eq("id", response.user.id).execute()
+        user_record = await db.execute(service_client.table("users").select("*").eq("id", response.user.id), "users", "select")
         if not user_record.data:
-            service_client.table("users").upsert({
+            await db.execute(service_client.table("users").upsert({
                 "id": response.user.id,
                 "email": response.user.email,
                 "role": response.user.user_metadata.get("role", "applicant"),
                 "full_name": response.user.user_metadata.get("full_name")
-            }).execute()
-            user_record = service_client.table("users").select("*").eq("id", response.user.id).execute()
+            }), "users", "upsert")
+            user_record = await db.execute(service_client.table("users").select("*").eq("id", response.user.id), "users", "select")
 
         user_row = user_record.data[0] if user_record.data else {}
         role = user_row.get("role", response.user.user_metadata.get("role", "applicant"))
@@ -90,7 +91,7 @@ async def signup(request: SignupRequest):
         full_name = f"{request.first_name} {request.last_name}"
         
         # Sign up with metadata
-        response = supabase.auth.sign_up({
+        response = await db.run_sync(supabase.auth.sign_up, {
             "email": request.email,
             "password": request.password,
             "options": {
@@ -108,12 +109,12 @@ async def signup(request: SignupRequest):
         
         # Create user record in users table using service role (bypasses RLS)
         supabase_service = get_supabase_client()
-        supabase_service.table("users").upsert({
+        await db.execute(supabase_service.table("users").upsert({
             "id": response.user.id,
             "email": request.email,
             "role": request.role,
             "full_name": full_name
-        }).execute()
+        }), "users", "upsert")
         
         return AuthResponse(
             access_token=response.session.access_token if response.session else "pending_confirmation",
@@ -0,0 +1,125 @@
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+
+from fastapi import APIRouter, HTTPException, Depends
+from core.config import Config, get_supabase_client
+from core import db
+from core.auth import verify_recruiter, User
+from core.cache import dashboard_cache, invalidate_dashboard
+
+router = APIRouter()
+
+JOB_COLUMNS = "id, title, location, status, created_at, application_count"
+
+
+def _daily_series(rows: list, days: int, today: date) -> list:
+    """Zero-filled ``[{day, count}]`` for the last ``days`` days from sparse aggregate rows."""
+    counts = {str(row.get("day")): row.get("applications") or 0 for row in rows}
+    start = today - timedelta(days=days - 1)
+    series = []
+    for offset in range(days):
+        day = (start + timedelta(days=offset)).isoformat()
+        series.append({"day": day, "count": counts.get(day, 0)})
+    return series
+
+
+async def _build_dashboard(recruiter_id: str) -> dict:
+    supabase = get_supabase_client()
+    now = datetime.now(timezone.utc)
+    days = max(1, Config.DASHBOARD_SERIES_DAYS)
+    since_day = (now.date() - timedelta(days=days - 1)).isoformat()
+
+    jobs_response, user_response, series_response = await asyncio.gather(
+        db.execute(
+            supabase.table("jobs").select(JOB_COLUMNS).eq("created_by", recruiter_id).order("created_at", desc=True),
+            "jobs",
+            "select",
+        ),
+        db.execute(
+            supabase.table("users").select("dashboard_last_seen_at, dashboard_seen_counts").eq("id", recruiter_id).limit(1),
+            "users",
+            "select",
+        ),
+        db.execute(
+            supabase.table("recruiter_daily_applications")
+            .select("day, applications")
+            .eq("recruiter_id", recruiter_id)
+            .gte("day", since_day)
+            .order("day"),
+            "recruiter_daily_applications",
+            "select",
+        ),
+    )
+
+    user_row = user_response.data[0] if user_response.data else {}
+    last_seen_at = user_row.get("dashboard_last_seen_at")
+    # application_count per job at the last visit; "new" is the growth since then
+    seen_counts = user_row.get("dashboard_seen_counts")
+
+    jobs = []
+    for job in jobs_response.data or []:
+        count = job.get("application_count") or 0
+        # Everything is new on the first visit and for jobs posted since the last one
+        new_count = max(count - seen_counts.get(job["id"], 0), 0) if seen_counts is not None else count
+        jobs.append({**job, "application_count": count, "new_applications": new_count})
+
+    return {
+        "jobs": jobs,
+        "totals": {
+            "jobs": len(jobs),
+            "open_jobs": sum(1 for job in jobs if (job.get("status") or "open") == "open"),
+            "applications": sum(job["application_count"] for job in jobs),
+            "new_applications": sum(job["new_applications"] for job in jobs),
+        },
+        "last_seen_at": last_seen_at,
+        "daily_applications": _daily_series(series_response.data or [], days, now.date()),
+    }
+
+
+@router.get("")
+async def get_dashboard(user: User = Depends(verify_recruiter)):
+    """Jobs with application counts, new applications since the last visit and a daily series (recruiter only).
+
+    Served from a short-lived per-recruiter cache that job and application writes invalidate.
+    "New" counts applications since the last visit recorded with ``POST /dashboard/seen``;
+    building or serving the dashboard never moves that marker.
+    """
+    try:
+        cached = dashboard_cache.get(user.id)
+        if cached is not None:
+            return cached
+        payload = await _build_dashboard(user.id)
+        dashboard_cache.set(user.id, payload)
+        return payload
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/seen")
+async def mark_dashboard_seen(user: User = Depends(verify_recruiter)):
+    """Record a dashboard visit; applications after it count as new on the next visit (recruiter only).
+
+    Stores each job's current ``application_count`` so later builds compute "new" from the jobs row alone.
+    """
+    try:
+        supabase = get_supabase_client()
+        seen_at = datetime.now(timezone.utc).isoformat()
+        jobs_response = await db.execute(
+            supabase.table("jobs").select("id, application_count").eq("created_by", user.id),
+            "jobs",
+            "select",
+        )
+        seen_counts = {job["id"]: job.get("application_count") or 0 for job in jobs_response.data or []}
+        await db.execute(
+            supabase.table("users").update({"dashboard_last_seen_at": seen_at, "dashboard_seen_counts": seen_counts}).eq("id", user.id),
+            "users",
+            "update",
+        )
+        invalidate_dashboard(user.id)
+        return {"last_seen_at": seen_at}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
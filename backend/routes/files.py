@@ -1,10 +1,15 @@
 from fastapi import APIRouter, HTTPException, Depends
-from core.config import get_supabase_client
+from core.config import Config, get_supabase_client
+from core import db
 from core.auth import verify_recruiter, User
-from typing import Optional
+from core.cache import signed_url_cache
+from core.models import CVPreviewBatchRequest
+from typing import Dict, List, Optional
 
 router = APIRouter()
 
+MAX_PREVIEW_BATCH = 200
+
 
 def _derive_cv_path(cv_url: Optional[str]) -> Optional[str]:
     if not cv_url:
@@ -18,6 +23,11 @@ def _derive_cv_path(cv_url: Optional[str]) -> Optional[str]:
     return None
 
 
+def _preview_cache_key(recruiter_id: str, application_id: str) -> tuple:
+    """Cached previews are per recruiter, so a hit never skips the ownership filter for someone else."""
+    return (recruiter_id, application_id)
+
+
 @router.get("/signed-url/{file_path:path}")
 async def get_signed_url(file_path: str, user: User = Depends(verify_recruiter)):
     """Get signed URL for CV access (recruiter only)."""
@@ -25,7 +35,8 @@ async def get_signed_url(file_path: str, user: User = Depends(verify_recruiter))
         supabase = get_supabase_client()
         
         # Generate signed URL valid for 1 hour
-        signed_url = supabase.storage.from_("cv-uploads").create_signed_url(
+        signed_url = await db.run_sync(
+            supabase.storage.from_("cv-uploads").create_signed_url,
             file_path,
             60 * 60  # 1 hour
         )
@@ -35,19 +46,35 @@ async def get_signed_url(file_path: str, user: User = Depends(verify_recruiter))
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _sign_cv_paths(supabase, paths: List[str]) -> Dict[str, str]:
+    """Sign many CV paths in one storage call; paths that failed to sign are left out."""
+    if not paths:
+        return {}
+    signed = await db.run_sync(
+        supabase.storage.from_("cv-uploads").create_signed_urls,
+        paths,
+        Config.CV_SIGNED_URL_TTL_SECONDS,
+    )
+    return {item["path"]: item["signedURL"] for item in signed if item.get("signedURL") and not item.get("error")}
+
+
 @router.get("/applications/{application_id}/preview")
 async def get_application_cv_preview(application_id: str, user: User = Depends(verify_recruiter)):
     """Generate a temporary signed URL for viewing an applicant's CV."""
     try:
+        cached = signed_url_cache.get(_preview_cache_key(user.id, application_id))
+        if cached is not None:
+            return {"signed_url": cached}
+
         supabase = get_supabase_client()
-        record = (
+        query = (
             supabase
             .table("applications")
-            .select("cv_url")
+            .select("cv_url, cv_path")
             .eq("id", application_id)
             .single()
-            .execute()
         )
+        record = await db.execute(query, "applications", "select")
 
         if not record.data:
             raise HTTPException(status_code=404, detail="Application not found")
@@ -56,11 +83,15 @@ async def get_application_cv_preview(application_id: str, user: User = Depends(v
         if not cv_url:
             raise HTTPException(status_code=400, detail="CV URL unavailable for this application")
 
-        cv_path = _derive_cv_path(cv_url)
+        # Older applications predate the stored path
+        cv_path = record.data.get("cv_path") or _derive_cv_path(cv_url)
 
         if cv_path:
             try:
-                signed = supabase.storage.from_("cv-uploads").create_signed_url(cv_path, 600)
+                signed = await db.run_sync(
+                    supabase.storage.from_("cv-uploads").create_signed_url, cv_path, Config.CV_SIGNED_URL_TTL_SECONDS
+                )
+                signed_url_cache.set(_preview_cache_key(user.id, application_id), signed["signedURL"])
                 return {"signed_url": signed["signedURL"]}
             except Exception:
                 # Fall back to returning the public URL if signing fails
@@ -71,3 +102,57 @@ async def get_application_cv_preview(application_id: str, user: User = Depends(v
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/applications/previews")
+async def get_application_cv_previews(request: CVPreviewBatchRequest, user: User = Depends(verify_recruiter)):
+    """Signed CV URLs for many of the recruiter's applications, signed in one storage call."""
+    try:
+        application_ids = list(dict.fromkeys(request.application_ids))
+        if len(application_ids) > MAX_PREVIEW_BATCH:
+            raise HTTPException(status_code=400, detail=f"At most {MAX_PREVIEW_BATCH} applications per request")
+
+        signed_urls = {}
+        missing = []
+        for application_id in application_ids:
+            cached = signed_url_cache.get(_preview_cache_key(user.id, application_id))
+            if cached is not None:
+                signed_urls[application_id] = cached
+            else:
+                missing.append(application_id)
+        if not missing:
+            return {"signed_urls": signed_urls}
+
+        supabase = get_supabase_client()
+        records = await db.execute(
+            supabase.table("applications").select("id, cv_url, cv_path").in_("id", missing).eq("recruiter_id", user.id),
+            "applications",
+            "select",
+        )
+        paths = {}
+        public_urls = {}
+        for row in records.data or []:
+            cv_path = row.get("cv_path") or _derive_cv_path(row.get("cv_url"))
+            if cv_path:
+                paths[row["id"]] = cv_path
+            if row.get("cv_url"):
+                public_urls[row["id"]] = row["cv_url"]
+
+        try:
+            signed_by_path = await _sign_cv_paths(supabase, list(dict.fromkeys(paths.values())))
+        except Exception:
+            signed_by_path = {}
+        for application_id, public_url in public_urls.items():
+            signed_url = signed_by_path.get(paths.get(application_id))
+            if signed_url:
+                signed_url_cache.set(_preview_cache_key(user.id, application_id), signed_url)
+                signed_urls[application_id] = signed_url
+            else:
+                # Fall back to the public URL if there is no path or signing failed
+                signed_urls[application_id] = public_url
+
+        return {"signed_urls": signed_urls}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
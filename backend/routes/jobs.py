@@ -1,29 +1,56 @@
 
-from fastapi import APIRouter, HTTPException, Depends, Body
-from typing import List
-from core.config import get_supabase_client
-from core.models import Job, JobCreate
+from fastapi import APIRouter, HTTPException, Depends, Body, Query, Request, Response
+from typing import List, Optional
+from core.config import Config, get_supabase_client
+from core import db
+from core.models import Job, JobCreate, RecommendedJob
+from core.serialization import fast_list_response
 from core.auth import verify_jwt, verify_recruiter, User
+from core.cache import catalogue_etag, etag_matches, invalidate_dashboard, notify_job_write
 # sanitizer removed by request — inputs are minimally normalized below
 
 router = APIRouter()
 
 
+def _caching_headers(etag: Optional[str]) -> Optional[dict]:
+    if etag is None:
+        return None
+    return {"ETag": etag, "Cache-Control": f"public, max-age={Config.JOBS_CACHE_MAX_AGE_SECONDS}"}
+
+
+async def _catalogue_etag(supabase, suffix: str = "") -> Optional[str]:
+    """ETag from the shared catalogue version (bumped by a trigger on ``jobs``); ``None`` if it cannot be read."""
+    try:
+        response = await db.execute(
+            supabase.table("catalogue_version").select("version").eq("id", 1).limit(1),
+            "catalogue_version",
+            "select",
+        )
+    except Exception:
+        return None
+    return catalogue_etag(str(response.data[0]["version"]), suffix) if response.data else None
+
+
+def _job_catalogue_changed(recruiter_id: str, job: Optional[dict] = None, removed_job_id: Optional[str] = None):
+    invalidate_dashboard(recruiter_id)
+    notify_job_write(job, removed_job_id)
+
+
 @router.post("/close/{job_id}")
 async def close_job(job_id: str, user: User = Depends(verify_recruiter)):
     """Mark a job as closed (recruiter only, own jobs)."""
     try:
         supabase = get_supabase_client()
 
-        # Verify ownership
-        existing = supabase.table("jobs").select("created_by").eq("id", job_id).single().execute()
-        if not existing.data:
-            raise HTTPException(status_code=404, detail="Job not found")
-        if existing.data["created_by"] != user.id:
-            raise HTTPException(status_code=403, detail="Not authorized to close this job")
-
-        # Ensure status column exists in DB; update to 'closed'
-        response = supabase.table("jobs").update({"status": "closed"}).eq("id", job_id).execute()
+        # Ownership is part of the filter, so the check and the write are one statement
+        response = await db.execute(
+            supabase.table("jobs").update({"status": "closed"}).eq("id", job_id).eq("created_by", user.id),
+            "jobs",
+            "update",
+        )
+        if not response.data:
+            await db.raise_for_missing_or_forbidden(supabase, "jobs", job_id, "Job not found", "Not authorized to close this job")
+        _job_catalogue_changed(user.id, job=response.data[0])
         return {"message": "Job closed successfully", "job": response.data[0]}
     except HTTPException:
         raise
@@ -37,30 +64,59 @@ async def get_jobs_by_recruiter(recruiter_id: str, user: User = Depends(verify_r
         if user.id != recruiter_id:
             raise HTTPException(status_code=403, detail="Not authorized to view these jobs")
         supabase = get_supabase_client()
-        response = supabase.table("jobs").select("*").eq("created_by", recruiter_id).order("created_at", desc=True).execute()
-        return response.data
+        response = await db.execute(supabase.table("jobs").select("*").eq("created_by", recruiter_id).order("created_at", desc=True), "jobs", "select")
+        return fast_list_response(response.data or [], Job)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/recommended", response_model=List[RecommendedJob])
+async def get_recommended_jobs(limit: int = Query(10, ge=1, le=50), user: User = Depends(verify_jwt)):
+    """Open jobs closest to the applicant's stored CV, best first (applicant only)."""
+    try:
+        if user.role != "applicant":
+            raise HTTPException(status_code=403, detail="Only applicants get job recommendations")
+
+        # Loaded on first use: keeps NumPy out of the app's import time
+        from agent.utils.job_recommender import recommend_jobs
+
+        return fast_list_response(await recommend_jobs(user.id, limit), RecommendedJob)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("", response_model=List[Job])
-async def get_jobs():
-    """Get all jobs (public)."""
+async def get_jobs(request: Request):
+    """Get all jobs (public).
+
+    Conditional requests whose ``If-None-Match`` matches the catalogue ETag get a 304 after a one-row version lookup instead of the full listing.
+    """
     try:
         supabase = get_supabase_client()
-        response = supabase.table("jobs").select("*").order("created_at", desc=True).execute()
-        return response.data
+        # Tag before reading so a concurrent write can only make the tag older than the data
+        etag = await _catalogue_etag(supabase)
+        if etag and etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=_caching_headers(etag))
+        response = await db.execute(supabase.table("jobs").select("*").order("created_at", desc=True), "jobs", "select")
+        return fast_list_response(response.data or [], Job, headers=_caching_headers(etag))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/{job_id}", response_model=Job)
-async def get_job(job_id: str):
-    """Get a specific job (public)."""
+async def get_job(job_id: str, request: Request, response: Response):
+    """Get a specific job (public), with the same ETag handling as the listing."""
     try:
         supabase = get_supabase_client()
-        response = supabase.table("jobs").select("*").eq("id", job_id).single().execute()
-        return response.data
+        etag = await _catalogue_etag(supabase, job_id)
+        if etag and etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=_caching_headers(etag))
+        result = await db.execute(supabase.table("jobs").select("*").eq("id", job_id).single(), "jobs", "select")
+        if etag:
+            response.headers.update(_caching_headers(etag))
+        return result.data
     except Exception as e:
         raise HTTPException(status_code=404, detail="Job not found")
 
@@ -98,14 +154,15 @@ async def create_job(job: dict = Body(...), user: User = Depends(verify_recruite
         salary = str(job_payload.salary).strip() if job_payload.salary else None
 
         supabase = get_supabase_client()
-        response = supabase.table("jobs").insert({
+        response = await db.execute(supabase.table("jobs").insert({
             "title": title,
             "description": description,
             "requirements": requirements,
             "location": location,
             "salary": salary,
             "created_by": user.id
-        }).execute()
+        }), "jobs", "insert")
+        _job_catalogue_changed(user.id, job=response.data[0])
         return response.data[0]
     except HTTPException:
         # re-raise friendly validation HTTPException
@@ -128,20 +185,19 @@ async def update_job(job_id: str, job: JobCreate, user: User = Depends(verify_re
         salary = str(job.salary).strip() if job.salary else None
 
         supabase = get_supabase_client()
-        
-        # Verify ownership
-        existing = supabase.table("jobs").select("created_by").eq("id", job_id).single().execute()
-        if existing.data["created_by"] != user.id:
-            raise HTTPException(status_code=403, detail="Not authorized to update this job")
-        
-        response = supabase.table("jobs").update({
+
+        # Ownership is part of the filter, so the check and the write are one statement
+        response = await db.execute(supabase.table("jobs").update({
             "title": title,
             "description": description,
             "requirements": requirements,
             "location": location,
             "salary": salary
-        }).eq("id", job_id).execute()
-        
+        }).eq("id", job_id).eq("created_by", user.id), "jobs", "update")
+        if not response.data:
+            await db.raise_for_missing_or_forbidden(supabase, "jobs", job_id, "Job not found", "Not authorized to update this job")
+        _job_catalogue_changed(user.id, job=response.data[0])
+
         return response.data[0]
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"Invalid input: {str(e)}")
@@ -156,13 +212,12 @@ async def delete_job(job_id: str, user: User = Depends(verify_recruiter)):
     """Delete a job (recruiter only, own jobs)."""
     try:
         supabase = get_supabase_client()
-        
-        # Verify ownership
-        existing = supabase.table("jobs").select("created_by").eq("id", job_id).single().execute()
-        if existing.data["created_by"] != user.id:
-            raise HTTPException(status_code=403, detail="Not authorized to delete this job")
-        
-        supabase.table("jobs").delete().eq("id", job_id).execute()
+
+        # Ownership is part of the filter, so the check and the delete are one statement
+        response = await db.execute(supabase.table("jobs").delete().eq("id", job_id).eq("created_by", user.id), "jobs", "delete")
+        if not response.data:
+            await db.raise_for_missing_or_forbidden(supabase, "jobs", job_id, "Job not found", "Not authorized to delete this job")
+        _job_catalogue_changed(user.id, removed_job_id=job_id)
         return {"message": "Job deleted successfully"}
     except HTTPException:
         raise
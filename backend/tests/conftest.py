@@ -61,3 +61,10 @@ def mock_verify_jwt_applicant():
             role="applicant"
         )
         yield mock
+
+
+@pytest.fixture(autouse=True)
+def disable_llm_cache():
+    """Keep mocked LLM responses out of the on-disk cache."""
+    with patch("core.config.Config.LLM_CACHE_ENABLED", False):
+        yield
@@ -0,0 +1,205 @@
+"""
+In-memory stand-in for the Supabase client, shared by the tests and the benchmarks.
+
+``FakeSupabase`` implements the subset of the supabase-py query builder the
+backend uses (select/insert/update/upsert/delete with eq/neq/in_/gt/lt/gte/lte
+filters, order, limit, range, single and exact counts) over plain lists of
+dicts, plus storage uploads and signed URLs. ``calls`` counts executed
+queries.
+"""
+
+import itertools
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+
+class FakeResponse:
+    def __init__(self, data: Any, count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+
+class FakeQuery:
+    """Chainable query over one in-memory table."""
+
+    def __init__(self, db: "FakeSupabase", table: str):
+        self._db = db
+        self._table = table
+        self._operation = "select"
+        self._columns = "*"
+        self._count: Optional[str] = None
+        self._payload: Any = None
+        self._filters: List[Callable[[dict], bool]] = []
+        self._order: List[tuple] = []
+        self._limit: Optional[int] = None
+        self._offset = 0
+        self._single = False
+
+    # Operations
+    def select(self, *columns: str, count: Optional[str] = None):
+        self._operation = "select"
+        self._columns = ",".join(columns) if columns else "*"
+        self._count = count
+        return self
+
+    def insert(self, payload):
+        self._operation, self._payload = "insert", payload
+        return self
+
+    def upsert(self, payload):
+        self._operation, self._payload = "upsert", payload
+        return self
+
+    def update(self, payload: dict):
+        self._operation, self._payload = "update", payload
+        return self
+
+    def delete(self):
+        self._operation = "delete"
+        return self
+
+    # Filters and modifiers
+    def eq(self, column: str, value):
+        self._filters.append(lambda row: str(row.get(column)) == str(value))
+        return self
+
+    def neq(self, column: str, value):
+        self._filters.append(lambda row: str(row.get(column)) != str(value))
+        return self
+
+    def in_(self, column: str, values):
+        wanted = {str(value) for value in values}
+        self._filters.append(lambda row: str(row.get(column)) in wanted)
+        return self
+
+    def gt(self, column: str, value):
+        self._filters.append(lambda row: row.get(column) is not None and row.get(column) > value)
+        return self
+
+    def lt(self, column: str, value):
+        self._filters.append(lambda row: row.get(column) is not None and row.get(column) < value)
+        return self
+
+    def gte(self, column: str, value):
+        self._filters.append(lambda row: row.get(column) is not None and row.get(column) >= value)
+        return self
+
+    def lte(self, column: str, value):
+        self._filters.append(lambda row: row.get(column) is not None and row.get(column) <= value)
+        return self
+
+    def order(self, column: str, desc: bool = False):
+        self._order.append((column, desc))
+        return self
+
+    def limit(self, count: int):
+        self._limit = count
+        return self
+
+    def range(self, start: int, end: int):
+        self._offset, self._limit = start, end - start + 1
+        return self
+
+    def single(self):
+        self._single = True
+        return self
+
+    def maybe_single(self):
+        return self.single()
+
+    # Execution
+    def _matching(self) -> List[dict]:
+        return [row for row in self._db.tables.setdefault(self._table, []) if all(f(row) for f in self._filters)]
+
+    def _project(self, row: dict) -> dict:
+        if "*" in self._columns or "(" in self._columns:
+            return dict(row)
+        return {column.strip(): row.get(column.strip()) for column in self._columns.split(",") if column.strip()}
+
+    def execute(self) -> FakeResponse:
+        self._db.calls += 1
+        if self._db.latency:
+            time.sleep(self._db.latency)
+        rows = self._db.tables.setdefault(self._table, [])
+
+        if self._operation in ("insert", "upsert"):
+            payload = self._payload if isinstance(self._payload, list) else [self._payload]
+            inserted = []
+            for item in payload:
+                row = {"id": str(uuid.uuid4()), "created_at": self._db.now(), **item}
+                existing = next((r for r in rows if r.get("id") == row["id"]), None) if self._operation == "upsert" else None
+                if existing is not None:
+                    existing.update(item)
+                    inserted.append(dict(existing))
+                else:
+                    rows.append(row)
+                    inserted.append(dict(row))
+            return FakeResponse(inserted)
+
+        matching = self._matching()
+        if self._operation == "update":
+            for row in matching:
+                row.update(self._payload)
+            return FakeResponse([dict(row) for row in matching])
+        if self._operation == "delete":
+            ids = {id(row) for row in matching}
+            rows[:] = [row for row in rows if id(row) not in ids]
+            return FakeResponse([dict(row) for row in matching])
+
+        for column, desc in reversed(self._order):
+            matching.sort(key=lambda row: (row.get(column) is None, row.get(column) or ""), reverse=desc)
+        total = len(matching)
+        if self._limit is not None:
+            matching = matching[self._offset:self._offset + self._limit]
+        data = [self._project(row) for row in matching]
+        if self._single:
+            data = data[0] if data else None
+        return FakeResponse(data, count=total if self._count == "exact" else None)
+
+
+class _FakeBucket:
+    def __init__(self, db: "FakeSupabase", name: str):
+        self._db = db
+        self._name = name
+
+    def upload(self, path: str, content: bytes, options: Optional[dict] = None):
+        if self._db.latency:
+            time.sleep(self._db.latency)
+        self._db.files[(self._name, path)] = content
+        return {"path": path}
+
+    def get_public_url(self, path: str) -> str:
+        return f"https://storage.example.com/{self._name}/{path}"
+
+    def create_signed_url(self, path: str, expires_in: int) -> dict:
+        return {"signedURL": f"https://storage.example.com/{self._name}/{path}?token=bench&expires={expires_in}"}
+
+    def create_signed_urls(self, paths: List[str], expires_in: int) -> List[dict]:
+        return [{"path": path, **self.create_signed_url(path, expires_in)} for path in paths]
+
+
+class _FakeStorage:
+    def __init__(self, db: "FakeSupabase"):
+        self._db = db
+
+    def from_(self, bucket: str) -> _FakeBucket:
+        return _FakeBucket(self._db, bucket)
+
+
+class FakeSupabase:
+    """In-memory Supabase client; ``latency`` adds a fixed delay per query."""
+
+    def __init__(self, tables: Optional[Dict[str, List[dict]]] = None, latency: float = 0.0):
+        self.tables: Dict[str, List[dict]] = {name: list(rows) for name, rows in (tables or {}).items()}
+        self.files: Dict[tuple, bytes] = {}
+        self.latency = latency
+        self.calls = 0
+        self.storage = _FakeStorage(self)
+        self._clock = itertools.count()
+
+    def now(self) -> str:
+        return f"2024-01-01T00:00:{next(self._clock) % 60:02d}+00:00"
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
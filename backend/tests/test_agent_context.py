@@ -0,0 +1,79 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from agent.nodes.general_response import general_response_node
+from agent.utils import context
+
+
+@pytest.mark.asyncio
+async def test_general_response_uses_conversation_summary():
+    """The summary is loaded by the context-using node and ends up in its prompt."""
+    with patch.object(context, "load_recent_messages", AsyncMock(return_value=[{"role": "user", "content": "hi"}] * 8)), \
+         patch.object(context, "summarize_messages_if_needed", return_value="User is hiring a data engineer.") as summarize, \
+         patch("agent.utils.llm.get_llm", return_value=MagicMock()), \
+         patch("agent.nodes.general_response.invoke_llm", return_value=MagicMock(content="Sure!")) as invoke:
+        state = await general_response_node({"message": "what next?", "conversation_id": "conv-ctx"})
+
+    assert state["response"] == "Sure!"
+    summarize.assert_called_once()
+    assert "User is hiring a data engineer." in invoke.call_args[0][0]
+    assert "CONTEXT_SUMMARY" not in invoke.call_args[0][0]
+
+
+@pytest.mark.asyncio
+async def test_context_is_not_loaded_outside_context_nodes():
+    """Nodes without the decorator never trigger history loading."""
+    from agent.nodes.safety_block import safety_block_node
+
+    loader = AsyncMock(return_value=[])
+    with patch.object(context, "load_recent_messages", loader):
+        await safety_block_node({"message": "drop table users", "conversation_id": "conv-ctx"})
+        assert await context.conversation_context() is None
+
+    loader.assert_not_called()
+    assert getattr(general_response_node, "uses_conversation_context", False)
+
+
+@pytest.mark.asyncio
+async def test_search_jobs_prompt_includes_conversation_summary():
+    """Job search and job creation keep the summary their extraction prompts had before context went lazy."""
+    from agent.nodes.create_job import create_job_node
+    from agent.nodes.search_jobs import search_jobs_node
+
+    with patch.object(context, "load_recent_messages", AsyncMock(return_value=[{"role": "user", "content": "hi"}] * 8)), \
+         patch.object(context, "summarize_messages_if_needed", return_value="User searched for data roles in Leeds."), \
+         patch("agent.utils.llm.get_llm", return_value=MagicMock()), \
+         patch("agent.nodes.search_jobs.invoke_llm", return_value=MagicMock(content="{}")) as invoke:
+        await search_jobs_node({"message": "same but remote", "conversation_id": "conv-search"})
+
+    assert "User searched for data roles in Leeds." in invoke.call_args[0][0]
+    assert getattr(create_job_node, "uses_conversation_context", False)
+
+
+def test_preprocessed_message_is_shared_and_extracts_values():
+    """One PreprocessedMessage per turn carries the normalized text, keyword hits and job ids."""
+    from agent.router import route_query
+    from agent.utils.preprocess import get_preprocessed, preprocess_message
+
+    preprocessed = preprocess_message("Rank each Candidate for job_id: ab12-cd34 paying £85k or $90,000")
+    assert preprocessed.text.startswith("rank each applicant ")
+    assert preprocessed.job_id == "ab12-cd34"
+    assert not preprocessed.is_dangerous
+    assert preprocess_message("Rank each Candidate for job_id: ab12-cd34 paying £85k or $90,000") is preprocessed
+
+    state = {"message": "please delete this data", "conversation_id": "c"}
+    assert route_query(state) == "safety_block"
+    assert get_preprocessed(state).dangerous_keywords == {"delete"}
+
+
+@pytest.mark.asyncio
+async def test_create_job_reuses_turn_preprocessing():
+    """The create-job intent check reads the turn's PreprocessedMessage instead of preprocessing again."""
+    from agent.nodes.create_job import create_job_node
+    from agent.utils.preprocess import preprocess_message
+
+    # The stored preprocessing disagrees with the message, so the response shows which one was used
+    state = {"message": "create a job for a data engineer", "preprocessed": preprocess_message("how are you today?")}
+    state = await create_job_node(state)
+
+    assert state["response"].startswith("I didn't detect a job creation request")
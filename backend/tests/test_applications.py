@@ -1,7 +1,7 @@
 import pytest
 from fastapi.testclient import TestClient
 from main import app
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from io import BytesIO
 
 from core.auth import verify_jwt
@@ -50,7 +50,8 @@ def test_get_applications_as_applicant():
 
 def test_create_application():
     """Test creating an application with CV upload."""
-    with patch("routes.applications.get_supabase_client") as mock_supabase:
+    with patch("routes.applications.get_supabase_client") as mock_supabase, \
+         patch("routes.applications._process_cv_in_background") as mock_process:
         
         async def applicant_override():
             return User(id="applicant1", email="applicant@example.com", role="applicant", full_name="Test Applicant")
@@ -105,6 +106,25 @@ def test_create_application():
         
         assert response.status_code == 200
         assert response.json()["cv_url"] == "https://example.com/cv.pdf"
+        # CV text extraction and ATS scoring of the new application are queued to run after the response
+        mock_process.assert_called_once()
+        assert mock_process.call_args.args[:2] == (mock_app_response.data[0], file_content)
+
+
+@pytest.mark.asyncio
+async def test_cv_text_stored_without_scoring():
+    """The uploaded CV's text is stored even when ATS scoring on submit is off."""
+    from tests.fakes import FakeSupabase
+    from routes.applications import _process_cv_in_background
+
+    supabase = FakeSupabase({"applications": [{"id": "app1", "job_id": "job1", "cv_text": None}]})
+    with patch("agent.utils.cv_parser.get_supabase_client", lambda: supabase), \
+         patch("agent.utils.cv_parser.extract_cv_text", return_value="Python engineer"), \
+         patch("agent.tools.applicant_tools.score_application", AsyncMock()) as score:
+        await _process_cv_in_background(supabase.tables["applications"][0], b"%PDF", score=False)
+
+    assert supabase.tables["applications"][0]["cv_text"] == "Python engineer"
+    score.assert_not_called()
 
 
 def test_create_application_as_recruiter_fails():
@@ -133,3 +153,74 @@ def test_create_application_as_recruiter_fails():
         app.dependency_overrides.pop(verify_jwt, None)
 
     assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_skill_index_intersects_normalized_skills():
+    """Skills are normalized and intersected per recruiter."""
+    from agent.utils import skill_index
+
+    with patch("agent.utils.skill_index.get_supabase_client") as mock_supabase:
+        mock_supabase.return_value.table.return_value.select.return_value.eq.return_value.execute.return_value = MagicMock(data=[])
+        await skill_index.record_application_skills("recruiter-idx", "app-1", "job1", ["Python", "K8s"])
+        await skill_index.record_application_skills("recruiter-idx", "app-2", "job1", ["python", "React"])
+        await skill_index.record_application_skills("other-recruiter", "app-3", "job2", ["Kubernetes"])
+        skill_index._LOADED_AT["recruiter-idx"] = float("inf")
+
+        assert await skill_index.find_applications_by_skills("recruiter-idx", ["kubernetes"]) == ["app-1"]
+        assert await skill_index.find_applications_by_skills("recruiter-idx", ["Python", "kubernetes"]) == ["app-1"]
+        assert await skill_index.find_applications_by_skills("recruiter-idx", ["react", "k8s"], match_all=False) == ["app-1", "app-2"]
+
+        skill_index.remove_application_skills("app-1")
+        assert await skill_index.find_applications_by_skills("recruiter-idx", ["kubernetes"]) == []
+
+
+def test_get_applications_by_skills_endpoint():
+    """Recruiters can query their applications by skill."""
+    from core.auth import verify_recruiter
+
+    async def recruiter_override():
+        return User(id="recruiter1", email="recruiter@example.com", role="recruiter")
+
+    app.dependency_overrides[verify_recruiter] = recruiter_override
+    try:
+        with patch("routes.applications.find_applications_by_skills", AsyncMock(return_value=["app1", "app2"])) as mock_find:
+            response = client.get(
+                "/applications/by-skills",
+                params={"skills": "Kubernetes, python", "match": "all"},
+                headers={"Authorization": "Bearer mock_token"}
+            )
+    finally:
+        app.dependency_overrides.pop(verify_recruiter, None)
+
+    assert response.status_code == 200
+    assert response.json()["count"] == 2
+    assert response.json()["skills"] == ["kubernetes", "python"]
+    mock_find.assert_called_once_with("recruiter1", ["Kubernetes", " python"], match_all=True)
+
+
+def test_get_application_counts_batch():
+    """Counts for many jobs come from the jobs counter column in one query."""
+    async def recruiter_override():
+        return User(id="recruiter1", email="recruiter@example.com", role="recruiter")
+
+    app.dependency_overrides[verify_jwt] = recruiter_override
+    try:
+        with patch("routes.applications.get_supabase_client") as mock_supabase:
+            mock_response = MagicMock()
+            mock_response.data = [{"id": "job1", "application_count": 3}, {"id": "job2", "application_count": 0}]
+            mock_select = mock_supabase.return_value.table.return_value.select
+            mock_select.return_value.in_.return_value.execute.return_value = mock_response
+
+            response = client.get(
+                "/applications/counts",
+                params={"job_ids": "job1,job2,job3,job1"},
+                headers={"Authorization": "Bearer mock_token"}
+            )
+    finally:
+        app.dependency_overrides.pop(verify_jwt, None)
+
+    assert response.status_code == 200
+    assert response.json() == {"counts": {"job1": 3, "job2": 0, "job3": 0}}
+    mock_supabase.return_value.table.assert_called_once_with("jobs")
+    mock_select.return_value.in_.assert_called_once_with("id", ["job1", "job2", "job3"])
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
 from fastapi import HTTPException
@@ -70,3 +72,334 @@ def test_rank_endpoint_unauthorized():
 
     # Should fail because user is not a recruiter
     assert response.status_code == 403
+
+
+def _profile(application_id):
+    return {
+        "application_id": application_id,
+        "applicant_id": f"user-{application_id}",
+        "name": "Candidate",
+        "email": "candidate@example.com",
+        "cv_url": "https://example.com/cv.pdf",
+        "cv_text": "Python, FastAPI",
+        "cover_letter": "",
+        "motivation": "",
+        "proud_project": "",
+    }
+
+
+def test_batch_scoring_parses_array():
+    """Batched scoring maps array entries back to applicants by id."""
+    from agent.tools import applicant_tools
+
+    job_context = {"title": "Engineer", "digest": "Must-have skills: Python"}
+    content = '[{"id": "a1", "score": 80, "summary": "Good", "skills": ["Python"]},' \
+              ' {"id": "a2", "score": 40, "summary": "Weak", "skills": []}]'
+
+    with patch("agent.tools.applicant_tools.invoke_llm", return_value=MagicMock(content=content)) as mock_llm:
+        ranked = applicant_tools._score_batch(job_context, [_profile("a1"), _profile("a2")])
+
+    assert mock_llm.call_count == 1
+    assert [r.score for r in ranked] == [80.0, 40.0]
+
+
+def test_batch_scoring_falls_back_to_single():
+    """Applicants missing from an unparseable batch response are scored individually."""
+    from agent.tools import applicant_tools
+
+    job_context = {"title": "Engineer", "digest": "Must-have skills: Python"}
+    responses = [
+        MagicMock(content="Sorry, I cannot help with that."),
+        MagicMock(content='{"score": 70, "summary": "Solid", "skills": ["Python"]}'),
+        MagicMock(content='{"score": 60, "summary": "Okay", "skills": []}'),
+    ]
+
+    with patch("agent.tools.applicant_tools.invoke_llm", side_effect=responses) as mock_llm:
+        ranked = applicant_tools._score_batch(job_context, [_profile("a1"), _profile("a2")])
+
+    assert mock_llm.call_count == 3
+    assert [r.score for r in ranked] == [70.0, 60.0]
+
+
+@pytest.mark.asyncio
+async def test_job_digest_extracted_once_per_version():
+    """The requirement digest is cached per job version and re-extracted on change."""
+    from agent.utils import job_digest
+
+    job_digest.DIGEST_CACHE.clear()
+    job = {"id": "job-digest", "title": "Engineer", "requirements": "5+ years Python", "description": "APIs"}
+    content = '{"must_have_skills": ["Python"], "min_years_experience": 5, "key_responsibilities": ["Build APIs"]}'
+
+    with patch("agent.utils.job_digest.invoke_llm", return_value=MagicMock(content=content)) as mock_llm, \
+         patch("agent.utils.job_digest.get_supabase_client"):
+        first = await job_digest.get_job_digest(job)
+        second = await job_digest.get_job_digest(dict(job))
+        await job_digest.get_job_digest({**job, "requirements": "8+ years Python"})
+
+    assert first == second
+    assert first["min_years_experience"] == 5
+    assert mock_llm.call_count == 2
+    assert "Must-have skills: Python" in job_digest.format_job_digest(job, first)
+
+
+def test_prescreen_ranks_matching_cv_first():
+    """The local pre-screen ranks CVs covering the must-have skills highest."""
+    from agent.utils.prescreen import prescreen_scores
+
+    scores = prescreen_scores(
+        "Backend engineer: Python, FastAPI, PostgreSQL, Kubernetes",
+        [
+            "Graphic designer skilled in Photoshop and Illustrator",
+            "Python developer building FastAPI services on Kubernetes with PostgreSQL",
+            "Java developer with some Python scripting",
+        ],
+        required_skills=["Python", "FastAPI", "Kubernetes"],
+    )
+
+    assert scores.shape == (3,)
+    assert scores.argmax() == 1
+    assert scores[0] < scores[2] < scores[1]
+
+
+@pytest.mark.asyncio
+async def test_get_applicants_node_scoped_to_recruiter():
+    """The applicants node only sees the caller's applications, fetches one page and reports the full count."""
+    from tests.fakes import FakeSupabase
+    from agent.nodes.get_applicants import get_applicants_node
+
+    applications = [
+        {"id": f"app{i}", "job_id": "job1", "recruiter_id": "recruiter1", "applicant_name": f"Candidate {i}",
+         "created_at": f"2024-01-{i + 1:02d}T00:00:00+00:00"}
+        for i in range(7)
+    ]
+    applications.append({"id": "other", "job_id": "job2", "recruiter_id": "recruiter2", "applicant_name": "Elsewhere"})
+    supabase = FakeSupabase({"applications": applications})
+
+    with patch("agent.tools.applicant_tools.get_supabase_client", lambda: supabase):
+        state = await get_applicants_node({"message": "show me the applicants", "user_id": "recruiter1"})
+
+    response = state["response"]
+    assert "Found 7 applicants" in response
+    assert "1. Candidate 6" in response
+    assert "Candidate 1\n" not in response
+    assert "Elsewhere" not in response
+    assert "...and 2 more applicants." in response
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("message", [
+    "show applicants with job id 1234",
+    "list applicants with status pending",
+    "show me candidates with the highest scores",
+])
+async def test_get_applicants_node_ignores_listing_qualifiers(message):
+    """Job ids, statuses and ranking phrases after "with" are not read as skill filters."""
+    from tests.fakes import FakeSupabase
+    from agent.nodes.get_applicants import get_applicants_node
+
+    applications = [
+        {"id": "app1", "job_id": "1234", "recruiter_id": "recruiter-q", "applicant_name": "Candidate 1",
+         "status": "pending", "created_at": "2024-01-01T00:00:00+00:00"},
+    ]
+    supabase = FakeSupabase({"applications": applications, "application_skills": []})
+
+    with patch("agent.tools.applicant_tools.get_supabase_client", lambda: supabase), \
+         patch("agent.utils.skill_index.get_supabase_client", lambda: supabase):
+        state = await get_applicants_node({"message": message, "user_id": "recruiter-q"})
+
+    assert "Found 1 applicant" in state["response"]
+
+
+@pytest.mark.asyncio
+async def test_get_applicants_node_filters_by_indexed_skills():
+    """Terms after "with" filter only when indexed; explicit phrasing always filters."""
+    from tests.fakes import FakeSupabase
+    from agent.nodes.get_applicants import _extract_skills
+
+    supabase = FakeSupabase({"application_skills": [
+        {"application_id": "app1", "recruiter_id": "recruiter-s", "job_id": "job1", "skill": "kubernetes"},
+    ]})
+
+    with patch("agent.utils.skill_index.get_supabase_client", lambda: supabase):
+        assert await _extract_skills("applicants with K8s and good vibes", "recruiter-s") == ["K8s"]
+        assert await _extract_skills("applicants with a portfolio", "recruiter-s") == []
+        assert await _extract_skills("candidates skilled in Rust and Go", "recruiter-s") == ["Rust", "Go"]
+
+
+def _ranked(application_id, score):
+    from core.models import RankedApplicant
+
+    return RankedApplicant(
+        application_id=application_id, applicant_id=f"user-{application_id}", name="Candidate",
+        email="candidate@example.com", score=score, summary="", cv_url="", skills=[],
+    )
+
+
+@pytest.mark.asyncio
+async def test_ranking_job_resumes_and_saves_partial_results():
+    """A stale ranking job is resumed, reuses saved scores and stores partial results best first."""
+    from tests.fakes import FakeSupabase
+    from agent.tools import ranking_jobs
+    from core.models import ATSRankingResponse
+
+    supabase = FakeSupabase({"ranking_jobs": [{
+        "id": "rj1", "job_id": "job1", "job_title": "Engineer", "recruiter_id": "recruiter1",
+        "status": "running", "total": 3, "completed": 1, "applicants": [_ranked("a1", 60).model_dump(mode="json")],
+        "updated_at": "2024-01-01T00:00:00+00:00",
+    }]})
+    snapshots = []
+
+    async def fake_rank(job_id, on_result=None, scored=None, **kwargs):
+        assert [applicant.application_id for applicant in scored] == ["a1"]
+        await on_result(list(scored), 3)
+        await on_result([_ranked("a2", 90)], 3)
+        snapshots.append([applicant["application_id"] for applicant in supabase.tables["ranking_jobs"][0]["applicants"]])
+        await on_result([_ranked("a3", 40)], 3)
+        applicants = sorted([*scored, _ranked("a2", 90), _ranked("a3", 40)], key=lambda a: a.score, reverse=True)
+        return ATSRankingResponse(job_id=job_id, job_title="Engineer", applicants=applicants)
+
+    with patch("agent.tools.ranking_jobs.get_supabase_client", lambda: supabase), \
+         patch("agent.tools.applicant_tools.rank_applicants_for_job", fake_rank):
+        assert await ranking_jobs.resume_ranking_jobs() == 1
+        await ranking_jobs._tasks["rj1"]
+
+    row = supabase.tables["ranking_jobs"][0]
+    assert snapshots == [["a2", "a1"]]
+    assert row["status"] == "completed"
+    assert row["completed"] == 3
+    assert [applicant["application_id"] for applicant in row["applicants"]] == ["a2", "a1", "a3"]
+
+
+@pytest.mark.asyncio
+async def test_ranking_job_cancelled_elsewhere_stops_at_next_batch():
+    """A job cancelled from another worker stops at its next progress write and stays cancelled."""
+    from tests.fakes import FakeSupabase
+    from agent.tools import ranking_jobs
+
+    supabase = FakeSupabase({"ranking_jobs": [{
+        "id": "rj2", "job_id": "job1", "recruiter_id": "recruiter1", "status": "queued", "applicants": [],
+        "lease_id": "lease-1", "updated_at": "2024-01-01T00:00:00+00:00",
+    }]})
+    batches = []
+
+    async def fake_rank(job_id, on_result=None, scored=None, **kwargs):
+        await on_result([_ranked("a1", 70)], 2)
+        batches.append("a1")
+        supabase.tables["ranking_jobs"][0]["status"] = "cancelled"
+        await on_result([_ranked("a2", 50)], 2)
+        batches.append("a2")
+
+    with patch("agent.tools.ranking_jobs.get_supabase_client", lambda: supabase), \
+         patch("agent.tools.applicant_tools.rank_applicants_for_job", fake_rank):
+        await ranking_jobs._run_ranking_job(dict(supabase.tables["ranking_jobs"][0]))
+
+    row = supabase.tables["ranking_jobs"][0]
+    assert batches == ["a1"]
+    assert row["status"] == "cancelled"
+    assert [applicant["application_id"] for applicant in row["applicants"]] == ["a1"]
+
+
+@pytest.mark.asyncio
+async def test_ranking_job_heartbeat_and_lease():
+    """A running job keeps updated_at fresh between batches and stops once another worker claims its lease."""
+    from tests.fakes import FakeSupabase
+    from agent.tools import ranking_jobs
+
+    supabase = FakeSupabase({"ranking_jobs": [{
+        "id": "rj4", "job_id": "job1", "recruiter_id": "recruiter1", "status": "queued", "applicants": [],
+        "lease_id": "lease-1", "updated_at": "2024-01-01T00:00:00+00:00",
+    }]})
+    row = supabase.tables["ranking_jobs"][0]
+    touched = []
+
+    async def fake_rank(job_id, on_result=None, scored=None, **kwargs):
+        started = row["updated_at"]
+        # Slow profile loading: no progress write, only heartbeats
+        await asyncio.sleep(0.05)
+        touched.append(row["updated_at"] > started)
+        row["lease_id"] = "lease-2"
+        await asyncio.sleep(0.05)
+        await on_result([_ranked("a1", 70)], 1)
+
+    with patch("agent.tools.ranking_jobs.get_supabase_client", lambda: supabase), \
+         patch("agent.tools.applicant_tools.rank_applicants_for_job", fake_rank), \
+         patch.object(ranking_jobs.Config, "RANKING_JOB_HEARTBEAT_SECONDS", 0.01):
+        task = ranking_jobs.start_ranking_job(dict(row))
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert touched == [True]
+    # The claimed job is left to the new lease holder
+    assert row["status"] == "running"
+    assert row["applicants"] == []
+
+
+def test_ranking_job_endpoints_scoped_to_owner():
+    """Ranking jobs are readable and streamable by their recruiter only."""
+    from tests.fakes import FakeSupabase
+
+    supabase = FakeSupabase({"ranking_jobs": [{
+        "id": "rj3", "job_id": "job1", "job_title": "Engineer", "recruiter_id": "recruiter1", "status": "completed",
+        "total": 1, "completed": 1, "applicants": [_ranked("a1", 80).model_dump(mode="json")],
+        "updated_at": "2024-01-01T00:00:00+00:00",
+    }]})
+    recruiter = {"id": "recruiter1"}
+
+    async def recruiter_override():
+        return User(id=recruiter["id"], email="recruiter@example.com", role="recruiter")
+
+    app.dependency_overrides[verify_recruiter] = recruiter_override
+    try:
+        with patch("agent.tools.ranking_jobs.get_supabase_client", lambda: supabase):
+            progress = client.get("/ats/rank/jobs/rj3", headers={"Authorization": "Bearer mock_token"})
+            events = client.get("/ats/rank/jobs/rj3/events", headers={"Authorization": "Bearer mock_token"})
+            recruiter["id"] = "recruiter2"
+            forbidden = client.get("/ats/rank/jobs/rj3", headers={"Authorization": "Bearer mock_token"})
+            missing = client.get("/ats/rank/jobs/nope", headers={"Authorization": "Bearer mock_token"})
+    finally:
+        app.dependency_overrides.pop(verify_recruiter, None)
+
+    assert progress.status_code == 200
+    assert progress.json()["applicants"][0]["application_id"] == "a1"
+    assert events.headers["content-type"].startswith("text/event-stream")
+    assert events.text.startswith("event: completed\ndata: ")
+    assert forbidden.status_code == 403
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_ranking_reuses_scores_for_current_job_version():
+    """Scores stored for the current job version are reused; stale and missing ones are rescored and stored."""
+    from tests.fakes import FakeSupabase
+    from agent.tools import applicant_tools
+    from agent.utils.job_digest import job_version
+
+    job = {"id": "job1", "title": "Engineer", "requirements": "Python", "description": "APIs", "created_by": "recruiter1"}
+    applications = [
+        {"id": app_id, "job_id": "job1", "applicant_id": f"user-{app_id}", "applicant_name": app_id,
+         "cv_url": f"https://example.com/{app_id}.pdf", "cv_text": "Python developer"}
+        for app_id in ("a1", "a2", "a3")
+    ]
+    supabase = FakeSupabase({
+        "jobs": [job],
+        "applications": applications,
+        "application_scores": [
+            {"application_id": "a1", "job_id": "job1", "job_version": job_version(job), "score": 88, "summary": "Stored", "skills": ["Python"]},
+            {"application_id": "a2", "job_id": "job1", "job_version": "outdated", "score": 10, "summary": "Old", "skills": []},
+        ],
+    })
+    content = '[{"id": "a2", "score": 70, "summary": "Fresh", "skills": []}, {"id": "a3", "score": 50, "summary": "Fresh", "skills": []}]'
+
+    with patch("agent.tools.applicant_tools.get_supabase_client", lambda: supabase), \
+         patch("agent.tools.applicant_tools.get_job_digest", AsyncMock(return_value=None)), \
+         patch("agent.tools.applicant_tools.download_and_extract_cv_text", AsyncMock()) as download, \
+         patch("agent.tools.applicant_tools.invoke_llm", return_value=MagicMock(content=content)) as mock_llm:
+        result = await applicant_tools.rank_applicants_for_job("job1", top_k=0, batch_size=5)
+
+    assert [(a.application_id, a.score) for a in result.applicants] == [("a1", 88.0), ("a2", 70.0), ("a3", 50.0)]
+    assert mock_llm.call_count == 1
+    assert "id: a1" not in mock_llm.call_args.args[0]
+    download.assert_not_called()
+    stored = {row["application_id"]: row for row in supabase.tables["application_scores"]}
+    assert stored["a2"]["job_version"] == job_version(job)
+    assert stored["a3"]["score"] == 50.0
@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+from unittest.mock import patch
+
+from tests.fakes import FakeSupabase
+from core.auth import verify_recruiter
+from core.cache import dashboard_cache, invalidate_dashboard
+from core.models import User
+from main import app
+
+
+client = TestClient(app)
+
+
+def _fake_supabase():
+    today = datetime.now(timezone.utc).date()
+    return FakeSupabase({
+        "jobs": [
+            {"id": "job1", "title": "Backend Engineer", "status": "open", "created_by": "recruiter1",
+             "created_at": "2024-01-02T00:00:00+00:00", "application_count": 3},
+            {"id": "job2", "title": "Designer", "status": "closed", "created_by": "recruiter1",
+             "created_at": "2024-01-01T00:00:00+00:00", "application_count": 1},
+            {"id": "job3", "title": "Other", "created_by": "recruiter2", "application_count": 9},
+        ],
+        "users": [{"id": "recruiter1", "dashboard_last_seen_at": "2024-03-01T00:00:00+00:00",
+                   "dashboard_seen_counts": {"job1": 2}}],
+        "recruiter_daily_applications": [
+            {"recruiter_id": "recruiter1", "day": today.isoformat(), "applications": 2},
+            {"recruiter_id": "recruiter1", "day": (today - timedelta(days=1)).isoformat(), "applications": 1},
+            {"recruiter_id": "recruiter1", "day": (today - timedelta(days=400)).isoformat(), "applications": 5},
+        ],
+    })
+
+
+def test_dashboard_aggregates_and_cache():
+    """One call returns jobs, counts, new applications and a daily series; repeats hit the cache."""
+    async def recruiter_override():
+        return User(id="recruiter1", email="recruiter@example.com", role="recruiter")
+
+    supabase = _fake_supabase()
+    dashboard_cache.clear()
+    app.dependency_overrides[verify_recruiter] = recruiter_override
+    try:
+        with patch("routes.dashboard.get_supabase_client", lambda: supabase):
+            first = client.get("/dashboard", headers={"Authorization": "Bearer mock_token"})
+            calls = supabase.calls
+            second = client.get("/dashboard", headers={"Authorization": "Bearer mock_token"})
+            assert supabase.calls == calls
+            assert calls == 3  # jobs, user and daily series; applications are never scanned
+
+            # Rebuilding after a write does not count as a visit
+            invalidate_dashboard("recruiter1")
+            third = client.get("/dashboard", headers={"Authorization": "Bearer mock_token"})
+
+            seen = client.post("/dashboard/seen", headers={"Authorization": "Bearer mock_token"})
+            fourth = client.get("/dashboard", headers={"Authorization": "Bearer mock_token"})
+    finally:
+        app.dependency_overrides.pop(verify_recruiter, None)
+        dashboard_cache.clear()
+
+    assert first.status_code == 200
+    body = first.json()
+    assert [job["id"] for job in body["jobs"]] == ["job1", "job2"]
+    assert [job["new_applications"] for job in body["jobs"]] == [1, 1]
+    assert body["totals"] == {"jobs": 2, "open_jobs": 1, "applications": 4, "new_applications": 2}
+    assert body["last_seen_at"] == "2024-03-01T00:00:00+00:00"
+    series = body["daily_applications"]
+    assert len(series) == 30
+    assert [point["count"] for point in series[-2:]] == [1, 2]
+    assert sum(point["count"] for point in series) == 3
+    assert second.json() == body
+
+    assert third.json()["totals"]["new_applications"] == 2
+    assert third.json()["last_seen_at"] == "2024-03-01T00:00:00+00:00"
+
+    # Marking the visit moves the marker and drops the cached payload
+    assert seen.status_code == 200
+    assert fourth.json()["last_seen_at"] == seen.json()["last_seen_at"]
+    assert fourth.json()["totals"]["new_applications"] == 0
@@ -0,0 +1,95 @@
+from fastapi.testclient import TestClient
+from unittest.mock import patch
+
+from tests.fakes import FakeSupabase
+from core.auth import verify_recruiter
+from core.cache import signed_url_cache
+from core.models import User
+from main import app
+
+
+client = TestClient(app)
+
+
+def _fake_supabase():
+    return FakeSupabase({"applications": [
+        {"id": "app1", "recruiter_id": "recruiter1", "cv_path": "u1/job1/cv.pdf",
+         "cv_url": "https://x.supabase.co/storage/v1/object/public/cv-uploads/u1/job1/cv.pdf"},
+        # Uploaded before cv_path was stored: the path is derived from the URL
+        {"id": "app2", "recruiter_id": "recruiter1", "cv_path": None,
+         "cv_url": "https://x.supabase.co/storage/v1/object/public/cv-uploads/u2/job1/cv.pdf"},
+        {"id": "app3", "recruiter_id": "recruiter2", "cv_path": "u3/job9/cv.pdf", "cv_url": "https://example.com/cv.pdf"},
+    ]})
+
+
+def test_cv_previews_batch_signs_once_and_caches():
+    """The batch endpoint signs every CV in one storage call and the single preview reuses the cached URL."""
+    async def recruiter_override():
+        return User(id="recruiter1", email="recruiter@example.com", role="recruiter")
+
+    supabase = _fake_supabase()
+    bucket = supabase.storage.from_("cv-uploads")
+    signed_paths = []
+
+    def create_signed_urls(paths, expires_in):
+        signed_paths.append(list(paths))
+        return type(bucket).create_signed_urls(bucket, paths, expires_in)
+
+    bucket.create_signed_urls = create_signed_urls
+    supabase.storage.from_ = lambda name: bucket
+
+    signed_url_cache.clear()
+    app.dependency_overrides[verify_recruiter] = recruiter_override
+    try:
+        with patch("routes.files.get_supabase_client", lambda: supabase):
+            response = client.post(
+                "/files/applications/previews",
+                json={"application_ids": ["app1", "app2", "app3"]},
+                headers={"Authorization": "Bearer mock_token"}
+            )
+            calls = supabase.calls
+            preview = client.get("/files/applications/app1/preview", headers={"Authorization": "Bearer mock_token"})
+            assert supabase.calls == calls
+    finally:
+        app.dependency_overrides.pop(verify_recruiter, None)
+        signed_url_cache.clear()
+
+    assert response.status_code == 200
+    signed_urls = response.json()["signed_urls"]
+    # Another recruiter's application is not signed
+    assert set(signed_urls) == {"app1", "app2"}
+    assert signed_paths == [["u1/job1/cv.pdf", "u2/job1/cv.pdf"]]
+    assert "token=" in signed_urls["app2"]
+    assert preview.json() == {"signed_url": signed_urls["app1"]}
+
+
+def test_cv_previews_cache_is_per_recruiter():
+    """A URL cached for one recruiter is not served to another recruiter asking for the same application."""
+    current = {"user": User(id="recruiter1", email="recruiter@example.com", role="recruiter")}
+
+    async def recruiter_override():
+        return current["user"]
+
+    supabase = _fake_supabase()
+    signed_url_cache.clear()
+    app.dependency_overrides[verify_recruiter] = recruiter_override
+    try:
+        with patch("routes.files.get_supabase_client", lambda: supabase):
+            first = client.post(
+                "/files/applications/previews",
+                json={"application_ids": ["app1"]},
+                headers={"Authorization": "Bearer mock_token"}
+            )
+            current["user"] = User(id="recruiter2", email="other@example.com", role="recruiter")
+            second = client.post(
+                "/files/applications/previews",
+                json={"application_ids": ["app1"]},
+                headers={"Authorization": "Bearer mock_token"}
+            )
+    finally:
+        app.dependency_overrides.pop(verify_recruiter, None)
+        signed_url_cache.clear()
+
+    assert set(first.json()["signed_urls"]) == {"app1"}
+    assert second.status_code == 200
+    assert second.json() == {"signed_urls": {}}
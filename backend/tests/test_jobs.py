@@ -1,3 +1,5 @@
+from datetime import datetime
+
 import pytest
 from fastapi.testclient import TestClient
 from main import app
@@ -105,10 +107,10 @@ def test_delete_job_unauthorized():
 
         app.dependency_overrides[verify_recruiter] = recruiter_override
         
-        mock_response = MagicMock()
-        mock_response.data = {"created_by": "recruiter1"}
-        
-        mock_supabase.return_value.table.return_value.select.return_value.eq.return_value.single.return_value.execute.return_value = mock_response
+        # Ownership-filtered delete matches nothing, but the job exists
+        mock_table = mock_supabase.return_value.table.return_value
+        mock_table.delete.return_value.eq.return_value.eq.return_value.execute.return_value = MagicMock(data=[])
+        mock_table.select.return_value.eq.return_value.limit.return_value.execute.return_value = MagicMock(data=[{"id": "job1"}])
         
         response = client.delete(
             "/jobs/job1",
@@ -117,3 +119,197 @@ def test_delete_job_unauthorized():
         app.dependency_overrides.pop(verify_recruiter, None)
         
         assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_overlap_blocking_db_calls():
+    """Blocking Supabase calls run off the event loop, so concurrent requests overlap."""
+    import asyncio
+    import time
+    import httpx
+
+    def slow_execute():
+        time.sleep(0.2)
+        return MagicMock(data=[])
+
+    with patch("routes.jobs.get_supabase_client") as mock_supabase:
+        mock_supabase.return_value.table.return_value.select.return_value.order.return_value.execute.side_effect = slow_execute
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+            started = time.perf_counter()
+            responses = await asyncio.gather(*(async_client.get("/jobs") for _ in range(5)))
+            elapsed = time.perf_counter() - started
+
+    assert all(response.status_code == 200 for response in responses)
+    # Serialized calls would take at least 1s
+    assert elapsed < 0.6
+
+
+def test_close_job_not_found():
+    """An ownership-filtered update that matches nothing returns 404 when the job does not exist."""
+    with patch("routes.jobs.get_supabase_client") as mock_supabase:
+
+        async def recruiter_override():
+            return User(id="recruiter1", email="recruiter@example.com", role="recruiter")
+
+        app.dependency_overrides[verify_recruiter] = recruiter_override
+
+        mock_table = mock_supabase.return_value.table.return_value
+        mock_table.update.return_value.eq.return_value.eq.return_value.execute.return_value = MagicMock(data=[])
+        mock_table.select.return_value.eq.return_value.limit.return_value.execute.return_value = MagicMock(data=[])
+
+        try:
+            response = client.post("/jobs/close/missing", headers={"Authorization": "Bearer mock_token"})
+        finally:
+            app.dependency_overrides.pop(verify_recruiter, None)
+
+        assert response.status_code == 404
+        mock_table.update.return_value.eq.return_value.eq.assert_called_once_with("created_by", "recruiter1")
+
+
+def test_get_jobs_conditional_request():
+    """A matching If-None-Match gets a 304 without listing jobs; a new shared catalogue version changes the ETag."""
+    with patch("routes.jobs.get_supabase_client") as mock_supabase:
+        version_query = mock_supabase.return_value.table.return_value.select.return_value.eq.return_value.limit.return_value
+        version_query.execute.return_value = MagicMock(data=[{"version": 7}])
+        mock_response = MagicMock()
+        mock_response.data = [
+            {"id": "job1", "title": "Engineer", "description": "d", "requirements": "r", "created_by": "user1"}
+        ]
+        mock_supabase.return_value.table.return_value.select.return_value.order.return_value.execute.return_value = mock_response
+
+        first = client.get("/jobs")
+        etag = first.headers["etag"]
+        # Weak, since the body may be gzip-encoded after the tag is computed
+        assert etag == 'W/"jobs-7"'
+        assert first.headers["cache-control"].startswith("public, max-age=")
+
+        listing = mock_supabase.return_value.table.return_value.select.return_value.order.return_value
+        listing.reset_mock()
+        cached = client.get("/jobs", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+        listing.execute.assert_not_called()
+
+        # A job write anywhere bumps the shared version row
+        version_query.execute.return_value = MagicMock(data=[{"version": 8}])
+        changed = client.get("/jobs", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
+
+def test_project_rows_matches_model_fields():
+    """The fast path keeps exactly the model's fields, trims strings and fills defaults like the model does."""
+    from core.models import Job
+    from core.serialization import FastJSONResponse, project_rows
+
+    rows = [{"id": "job1", "title": " Engineer ", "description": "d", "requirements": "r", "created_by": "user1",
+             "created_at": "2024-01-01T00:00:00+00:00", "requirements_digest": {"x": 1}, "application_count": 3}]
+    projected = project_rows(rows, Job)
+
+    assert set(projected[0]) == set(Job.model_fields)
+    assert projected[0]["title"] == Job.model_validate(rows[0]).title == "Engineer"
+    assert projected[0]["salary"] is None
+    assert b'"requirements_digest"' not in FastJSONResponse(projected).body
+    # A missing created_at gets the model's naive UTC default, not a tz-aware one
+    filled = project_rows([{**rows[0], "created_at": None}], Job)[0]["created_at"]
+    modelled = Job.model_validate({**rows[0], "created_at": None}).model_dump(mode="json")["created_at"]
+    assert datetime.fromisoformat(filled).tzinfo is None
+    assert datetime.fromisoformat(modelled).tzinfo is None
+
+
+def test_job_write_does_not_import_recommender():
+    """Job writes notify the recommender only once it is loaded; they never import it (or numpy) themselves."""
+    import os
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    code = (
+        "import main, sys; from routes.jobs import _job_catalogue_changed; "
+        "_job_catalogue_changed('r1', job={'id': 'job1', 'title': 'Engineer'}, removed_job_id='job2'); "
+        "print(sorted(m for m in ('numpy', 'agent.utils.job_recommender') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[1],
+        env={**os.environ, "GROQ_API_KEY": os.environ.get("GROQ_API_KEY", "test")},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_recommended_jobs_from_stored_cv():
+    """Recommendations rank open jobs by CV similarity, skip applied and closed jobs, and follow job writes."""
+    from tests.fakes import FakeSupabase
+    from core.auth import verify_jwt
+    from agent.utils.job_recommender import job_index
+
+    supabase = FakeSupabase({
+        "jobs": [
+            {"id": "py", "title": "Backend Engineer", "requirements": "Python, FastAPI, PostgreSQL", "description": "Build APIs", "created_by": "r1"},
+            {"id": "design", "title": "Graphic Designer", "requirements": "Photoshop, Illustrator", "description": "Brand work", "created_by": "r1"},
+            {"id": "applied", "title": "Python Developer", "requirements": "Python, FastAPI", "description": "APIs", "created_by": "r1"},
+            {"id": "closed", "title": "Python API Engineer", "requirements": "Python, FastAPI", "description": "APIs", "created_by": "r1", "status": "closed"},
+        ],
+        "applications": [
+            {"id": "app1", "job_id": "applied", "applicant_id": "applicant1", "cv_text": "Python engineer building FastAPI services on PostgreSQL"},
+        ],
+    })
+
+    async def applicant_override():
+        return User(id="applicant1", email="applicant@example.com", role="applicant")
+
+    app.dependency_overrides[verify_jwt] = applicant_override
+    job_index.built_at = None
+    try:
+        with patch("agent.utils.job_recommender.get_supabase_client", lambda: supabase):
+            first = client.get("/jobs/recommended?limit=5", headers={"Authorization": "Bearer mock_token"})
+            job_index.upsert({"id": "new", "title": "Senior Python Engineer", "requirements": "Python, FastAPI, PostgreSQL",
+                              "description": "Build APIs", "created_by": "r1"})
+            job_index.remove("design")
+            second = client.get("/jobs/recommended?limit=5", headers={"Authorization": "Bearer mock_token"})
+    finally:
+        app.dependency_overrides.pop(verify_jwt, None)
+        job_index.built_at = None
+
+    assert first.status_code == 200
+    assert [job["id"] for job in first.json()] == ["py"]
+    assert 0 < first.json()[0]["score"] <= 1
+    assert {job["id"] for job in second.json()} == {"py", "new"}
+    # The index was built once and updated in place afterwards
+    assert supabase.calls == 3
+
+
+def test_recommended_jobs_backfill_cv_text():
+    """Applications made before CV text was stored get it extracted once, on the first recommendation."""
+    from tests.fakes import FakeSupabase
+    from core.auth import verify_jwt
+    from agent.utils.job_recommender import job_index
+
+    supabase = FakeSupabase({
+        "jobs": [{"id": "py", "title": "Backend Engineer", "requirements": "Python, FastAPI", "description": "Build APIs", "created_by": "r1"}],
+        "applications": [{"id": "app1", "job_id": "other", "applicant_id": "applicant1", "cv_url": "https://example.com/cv.pdf"}],
+    })
+
+    async def applicant_override():
+        return User(id="applicant1", email="applicant@example.com", role="applicant")
+
+    app.dependency_overrides[verify_jwt] = applicant_override
+    job_index.built_at = None
+    try:
+        with patch("agent.utils.job_recommender.get_supabase_client", lambda: supabase), \
+             patch("agent.utils.cv_parser.get_supabase_client", lambda: supabase), \
+             patch("agent.utils.cv_parser.fetch_cv_text", AsyncMock(return_value="Python FastAPI engineer")) as fetch:
+            first = client.get("/jobs/recommended", headers={"Authorization": "Bearer mock_token"})
+            second = client.get("/jobs/recommended", headers={"Authorization": "Bearer mock_token"})
+    finally:
+        app.dependency_overrides.pop(verify_jwt, None)
+        job_index.built_at = None
+
+    assert [job["id"] for job in first.json()] == ["py"]
+    assert [job["id"] for job in second.json()] == ["py"]
+    fetch.assert_awaited_once_with("https://example.com/cv.pdf")
+    assert supabase.tables["applications"][0]["cv_text"] == "Python FastAPI engineer"
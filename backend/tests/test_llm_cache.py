@@ -0,0 +1,41 @@
+from unittest.mock import MagicMock, patch
+
+from agent.utils import llm_cache
+from agent.utils.llm import invoke_llm
+from agent.utils.llm_cache import CACHE_STATS, LLMResponseCache
+
+
+def _fake_llm(content):
+    client = MagicMock()
+    client.model_name = "test-model"
+    client.invoke.return_value = MagicMock(content=content, usage_metadata=None)
+    return client
+
+
+def test_invoke_llm_cache_hit(tmp_path):
+    store = LLMResponseCache(str(tmp_path / "cache.sqlite3"), 1024 * 1024)
+    client = _fake_llm('{"location": "London"}')
+    CACHE_STATS.pop("extract_filters", None)
+
+    with patch.object(llm_cache, "get_llm_cache", return_value=store), \
+         patch("agent.utils.llm.get_llm_cache", return_value=store):
+        first = invoke_llm("find jobs in London", "extract_filters", client=client, cache=True)
+        second = invoke_llm("find jobs in London", "extract_filters", client=client, cache=True)
+        invoke_llm("find jobs in Paris", "extract_filters", client=client, cache=True)
+
+    assert first.content == second.content == '{"location": "London"}'
+    assert client.invoke.call_count == 2
+    assert CACHE_STATS["extract_filters"] == {"hits": 1, "misses": 2}
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    store = LLMResponseCache(str(tmp_path / "cache.sqlite3"), 300)
+    store.set("a", "p", "m", "x" * 100)
+    store.set("b", "p", "m", "y" * 100)
+    assert store.get("a") is not None  # touch "a" so "b" is the oldest
+    store.set("c", "p", "m", "z" * 100)
+
+    assert store.get("b") is None
+    assert store.get("a") is not None
+    assert store.get("c") is not None
+    assert store.size_bytes() <= 300
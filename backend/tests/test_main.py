@@ -1,7 +1,7 @@
 import pytest
 from fastapi.testclient import TestClient
 from main import app
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 
 def test_health_check():
@@ -19,3 +19,72 @@ def test_root():
     assert response.status_code == 200
     assert "status" in response.json()
     assert response.json()["status"] == "healthy"
+
+
+def test_metrics_endpoint():
+    """Requests are counted per route template and exposed on /metrics."""
+    client = TestClient(app)
+    client.get("/health")
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert 'http_requests_total{method="GET",route="/health",status="200"}' in body
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/health",le="+Inf"}' in body
+
+
+def test_metrics_label_route_templates_only():
+    """Path values (including ``:path`` parameters) and unknown URLs never become metric labels."""
+    client = TestClient(app)
+    client.get("/files/signed-url/cvs/secret/cv.pdf")
+    client.get("/no-such-page/12345")
+    body = client.get("/metrics").text
+    assert 'route="/files/signed-url/{file_path:path}"' in body
+    assert 'route="unmatched",status="404"' in body
+    assert "secret" not in body
+    assert "no-such-page" not in body
+
+
+def test_server_timing_lists_db_spans():
+    """Supabase calls made while serving a request show up in Server-Timing and the trace log."""
+    client = TestClient(app)
+    with patch("routes.jobs.get_supabase_client") as mock_supabase, \
+         patch("core.config.Config.TRACE_REQUESTS", True), \
+         patch("core.config.Config.TRACE_DB_CALLS", True), \
+         patch("main.log_trace") as mock_log:
+        mock_supabase.return_value.table.return_value.select.return_value.order.return_value.execute.return_value = MagicMock(data=[])
+        response = client.get("/jobs")
+
+    assert response.status_code == 200
+    timing = response.headers["Server-Timing"]
+    assert "db.select.jobs;dur=" in timing
+    assert "total;dur=" in timing
+    trace = mock_log.call_args.args[0]
+    assert trace.db_calls == {"select catalogue_version": 1, "select jobs": 1}
+
+
+def test_server_timing_off_by_default():
+    """Span names are not sent to clients unless tracing is switched on."""
+    client = TestClient(app)
+    response = client.get("/health")
+    assert "Server-Timing" not in response.headers
+
+
+def test_importing_app_does_not_load_agent_stack():
+    """CRUD routes must not pull in LangGraph/LangChain at startup; the agent loads on first use."""
+    import os
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    code = "import main, sys; print(sorted({m.split('.')[0] for m in sys.modules if m.startswith(('langgraph', 'langchain', 'agent.orchestration'))}))"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[1],
+        env={**os.environ, "GROQ_API_KEY": os.environ.get("GROQ_API_KEY", "test")},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip().splitlines()[-1] == "[]"
@@ -0,0 +1,53 @@
+from agent.prompts.budget import (
+    count_tokens,
+    trim_to_tokens,
+    fit_fields,
+    format_prompt_within_budget,
+    PROMPT_BUDGETS,
+)
+
+
+def test_trim_to_tokens_caps_length():
+    """Trimmed text never exceeds the requested token count, marker included."""
+    text = "Python developer with Kubernetes experience " * 50
+    trimmed = trim_to_tokens(text, 20)
+    assert count_tokens(trimmed) == 20
+    assert trimmed.endswith("…")
+    assert trim_to_tokens("short text", 20) == "short text"
+
+
+def test_trim_to_tokens_keeps_tail():
+    """keep='end' drops the beginning and keeps the most recent text."""
+    text = " ".join(f"word{i}" for i in range(100))
+    trimmed = trim_to_tokens(text, 10, keep="end")
+    assert trimmed.endswith("word99")
+    assert "word0 " not in trimmed
+
+
+def test_fit_fields_trims_lowest_priority_first():
+    """Lower-priority fields are trimmed before higher-priority ones."""
+    fields = {
+        "cv_text": {"priority": 0, "max_tokens": 100, "min_tokens": 50},
+        "cover_letter": {"priority": 1, "max_tokens": 100},
+    }
+    values = {"cv_text": "skill " * 100, "cover_letter": "letter " * 100}
+    fitted = fit_fields(values, fields, available_tokens=120)
+
+    assert count_tokens(fitted["cv_text"]) >= 100
+    assert count_tokens(fitted["cover_letter"]) <= 20
+    assert count_tokens(fitted["cv_text"]) + count_tokens(fitted["cover_letter"]) <= 120
+
+
+def test_format_prompt_within_budget_respects_total():
+    """A huge CV still yields an ATS prompt within the template budget."""
+    prompt = format_prompt_within_budget(
+        "ats_analysis.md",
+        job_title="Backend Engineer",
+        job_digest="Must-have skills: Python, FastAPI",
+        cv_text="Experienced engineer. " * 5000,
+        cover_letter="Hire me. " * 2000,
+        motivation="",
+        proud_project="",
+    )
+    assert count_tokens(prompt) <= PROMPT_BUDGETS["ats_analysis.md"]["total_tokens"]
+    assert "Backend Engineer" in prompt
@@ -0,0 +1,62 @@
+from unittest.mock import patch
+
+import pytest
+
+from agent.nodes.sql_query import SAFE_QUERIES
+from agent.tools import sql_tools
+from agent.utils import safety
+from agent.utils.safety import is_dangerous_sql_query, sanitize_sql_query, validate_sql_query
+
+
+@pytest.mark.parametrize("query", list(SAFE_QUERIES.values()))
+def test_predefined_queries_are_safe(query):
+    verdict = validate_sql_query(query)
+    assert verdict.is_safe, verdict.error
+    assert verdict.tables[0] in {"jobs", "applications"}
+
+
+@pytest.mark.parametrize("query, error", [
+    ("DELETE FROM jobs", "Only SELECT"),
+    ("SELECT * FROM applications; DROP TABLE users", "dangerous operations"),
+    ("SELECT * FROM users UNION SELECT * FROM chat_messages", "dangerous patterns"),
+    ("SELECT * FROM jobs -- WHERE recruiter_id = 'x'", "dangerous patterns"),
+    ("SELECT * FROM jobs /* hidden */", "dangerous patterns"),
+    ("SELECT * FROM secrets", "Access to table 'secrets'"),
+    ("SELECT a FROM (SELECT a FROM secrets) s", "Access to table 'secrets'"),
+    ("SELECT 1", "Could not parse table name"),
+    ("SELECT * FROM jobs, secrets", "Access to table 'secrets'"),
+    ("SELECT * FROM jobs j JOIN users u ON j.created_by = u.id, secrets s", "Access to table 'secrets'"),
+    ("SELECT * FROM jobs, user", "Access to table 'user'"),
+    ('SELECT * FROM "Jobs"', "Access to table 'Jobs'"),
+])
+def test_unsafe_queries_are_rejected(query, error):
+    is_safe, message = sanitize_sql_query(query)
+    assert not is_safe
+    assert error in message
+
+
+def test_keywords_inside_string_literals_are_not_flagged():
+    query = "SELECT * FROM jobs WHERE title = 'delete me -- later'"
+    assert not is_dangerous_sql_query(query)
+    assert validate_sql_query(query).tables == ("jobs",)
+
+
+def test_table_lists_and_quoted_identifiers():
+    assert validate_sql_query("SELECT * FROM jobs j, applications AS a WHERE a.job_id = j.id").tables == ("jobs", "applications")
+    assert validate_sql_query('SELECT * FROM public."jobs" ORDER BY title, created_at').tables == ("jobs",)
+    assert validate_sql_query("SELECT title FROM jobs WHERE id IN (SELECT job_id FROM applications)").tables == ("jobs", "applications")
+
+
+def test_verdicts_are_cached_by_query():
+    query = "SELECT title FROM jobs WHERE location = 'Cache Test'"
+    with patch.object(safety, "_validate", wraps=safety._validate) as validate:
+        first = validate_sql_query(query)
+        second = validate_sql_query(query)
+    assert first is second
+    assert validate.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_run_sql_query_uses_verdict_tables():
+    result = await sql_tools.run_sql_query("SELECT * FROM secrets")
+    assert result == {"error": "Access to table 'secrets' is not allowed for security reasons."}
@@ -46,6 +46,157 @@ ALTER TABLE applications ADD COLUMN IF NOT EXISTS motivation TEXT;
 ALTER TABLE applications ADD COLUMN IF NOT EXISTS proud_project TEXT;
 ALTER TABLE applications ADD COLUMN IF NOT EXISTS cv_path TEXT;
 
+-- Cached requirement digest used by ATS scoring (re-extracted when the job changes)
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS requirements_digest JSONB;
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS requirements_digest_version TEXT;
+
+-- Per-job application counter, kept in sync by a trigger on applications so
+-- dashboards read one column instead of counting rows
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS application_count INTEGER NOT NULL DEFAULT 0;
+
+CREATE OR REPLACE FUNCTION update_job_application_count()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    UPDATE jobs SET application_count = application_count + 1 WHERE id = NEW.job_id;
+  ELSIF TG_OP = 'DELETE' THEN
+    UPDATE jobs SET application_count = GREATEST(application_count - 1, 0) WHERE id = OLD.job_id;
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS applications_count_trigger ON applications;
+CREATE TRIGGER applications_count_trigger
+  AFTER INSERT OR DELETE ON applications
+  FOR EACH ROW EXECUTE FUNCTION update_job_application_count();
+
+-- Backfill the counter for existing databases
+UPDATE jobs SET application_count = counts.total
+FROM (SELECT job_id, COUNT(*) AS total FROM applications GROUP BY job_id) AS counts
+WHERE jobs.id = counts.job_id;
+
+-- Recruiter dashboard: last visit marker and applications per recruiter per day,
+-- maintained by a trigger so the daily series never scans applications
+ALTER TABLE users ADD COLUMN IF NOT EXISTS dashboard_last_seen_at TIMESTAMPTZ;
+-- application_count per job at that visit ({job_id: count}); new = current count - seen count
+ALTER TABLE users ADD COLUMN IF NOT EXISTS dashboard_seen_counts JSONB;
+
+CREATE TABLE IF NOT EXISTS recruiter_daily_applications (
+  recruiter_id UUID REFERENCES users(id) ON DELETE CASCADE,
+  day DATE NOT NULL,
+  applications INTEGER NOT NULL DEFAULT 0,
+  PRIMARY KEY (recruiter_id, day)
+);
+
+CREATE OR REPLACE FUNCTION update_recruiter_daily_applications()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  IF TG_OP = 'INSERT' AND NEW.recruiter_id IS NOT NULL THEN
+    INSERT INTO recruiter_daily_applications (recruiter_id, day, applications)
+    VALUES (NEW.recruiter_id, (NEW.created_at AT TIME ZONE 'UTC')::date, 1)
+    ON CONFLICT (recruiter_id, day)
+    DO UPDATE SET applications = recruiter_daily_applications.applications + 1;
+  ELSIF TG_OP = 'DELETE' AND OLD.recruiter_id IS NOT NULL THEN
+    UPDATE recruiter_daily_applications
+    SET applications = GREATEST(applications - 1, 0)
+    WHERE recruiter_id = OLD.recruiter_id AND day = (OLD.created_at AT TIME ZONE 'UTC')::date;
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS applications_daily_trigger ON applications;
+CREATE TRIGGER applications_daily_trigger
+  AFTER INSERT OR DELETE ON applications
+  FOR EACH ROW EXECUTE FUNCTION update_recruiter_daily_applications();
+
+-- Backfill the daily series for existing databases
+INSERT INTO recruiter_daily_applications (recruiter_id, day, applications)
+SELECT recruiter_id, (created_at AT TIME ZONE 'UTC')::date, COUNT(*)
+FROM applications
+WHERE recruiter_id IS NOT NULL
+GROUP BY recruiter_id, (created_at AT TIME ZONE 'UTC')::date
+ON CONFLICT (recruiter_id, day) DO UPDATE SET applications = EXCLUDED.applications;
+
+-- Skills extracted by ATS scoring, indexed per recruiter for skill filtering
+CREATE TABLE IF NOT EXISTS application_skills (
+  application_id UUID REFERENCES applications(id) ON DELETE CASCADE,
+  recruiter_id UUID REFERENCES users(id) ON DELETE CASCADE,
+  job_id UUID REFERENCES jobs(id) ON DELETE CASCADE,
+  skill TEXT NOT NULL,
+  PRIMARY KEY (application_id, skill)
+);
+
+-- Text extracted from the uploaded CV at submission, so rankings skip the PDF download
+ALTER TABLE applications ADD COLUMN IF NOT EXISTS cv_text TEXT;
+
+-- ATS results computed in the background when an application is submitted (and by rankings).
+-- A score is only reused while job_version matches the job's current scoring fields.
+CREATE TABLE IF NOT EXISTS application_scores (
+  application_id UUID PRIMARY KEY REFERENCES applications(id) ON DELETE CASCADE,
+  job_id UUID REFERENCES jobs(id) ON DELETE CASCADE,
+  recruiter_id UUID REFERENCES users(id) ON DELETE CASCADE,
+  job_version TEXT NOT NULL,
+  score REAL NOT NULL,
+  summary TEXT,
+  skills JSONB NOT NULL DEFAULT '[]'::jsonb,
+  scored_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- Background ATS ranking jobs: progress and the applicants scored so far (best first)
+CREATE TABLE IF NOT EXISTS ranking_jobs (
+  id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+  job_id UUID REFERENCES jobs(id) ON DELETE CASCADE,
+  job_title TEXT,
+  recruiter_id UUID REFERENCES users(id) ON DELETE CASCADE,
+  status TEXT NOT NULL DEFAULT 'queued' CHECK (status IN ('queued', 'running', 'completed', 'failed', 'cancelled')),
+  total INTEGER NOT NULL DEFAULT 0,
+  completed INTEGER NOT NULL DEFAULT 0,
+  applicants JSONB NOT NULL DEFAULT '[]'::jsonb,
+  error TEXT,
+  lease_id UUID,
+  created_at TIMESTAMPTZ DEFAULT NOW(),
+  updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+-- Set on every start or resume; only the run holding the current lease may write progress
+ALTER TABLE ranking_jobs ADD COLUMN IF NOT EXISTS lease_id UUID;
+
+-- Shared version of the public job catalogue, bumped by a trigger on job writes.
+-- Every API worker derives the GET /jobs ETags from it.
+CREATE TABLE IF NOT EXISTS catalogue_version (
+  id INTEGER PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+  version BIGINT NOT NULL DEFAULT 0,
+  updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+INSERT INTO catalogue_version (id) VALUES (1) ON CONFLICT (id) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION bump_catalogue_version()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  UPDATE catalogue_version SET version = version + 1, updated_at = NOW() WHERE id = 1;
+  RETURN NULL;
+END;
+$$;
+
+-- Only columns served by the catalogue; application counters and digests do not invalidate it
+DROP TRIGGER IF EXISTS jobs_catalogue_version_trigger ON jobs;
+CREATE TRIGGER jobs_catalogue_version_trigger
+  AFTER INSERT OR DELETE OR UPDATE OF title, description, requirements, location, salary, status, created_by ON jobs
+  FOR EACH STATEMENT EXECUTE FUNCTION bump_catalogue_version();
+
 -- AI search logs table
 CREATE TABLE IF NOT EXISTS ai_search_logs (
   id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
@@ -60,13 +211,22 @@ CREATE INDEX IF NOT EXISTS idx_jobs_created_by ON jobs(created_by);
 CREATE INDEX IF NOT EXISTS idx_applications_applicant ON applications(applicant_id);
 CREATE INDEX IF NOT EXISTS idx_applications_job ON applications(job_id);
 CREATE INDEX IF NOT EXISTS idx_applications_recruiter ON applications(recruiter_id);
+CREATE INDEX IF NOT EXISTS idx_applications_recruiter_created ON applications(recruiter_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_application_scores_job_version ON application_scores(job_id, job_version);
+CREATE INDEX IF NOT EXISTS idx_ranking_jobs_active ON ranking_jobs(updated_at) WHERE status IN ('queued', 'running');
 CREATE INDEX IF NOT EXISTS idx_ai_logs_user ON ai_search_logs(user_id);
+CREATE INDEX IF NOT EXISTS idx_application_skills_recruiter_skill ON application_skills(recruiter_id, skill);
 
 -- Enable Row Level Security (RLS)
 ALTER TABLE users ENABLE ROW LEVEL SECURITY;
 ALTER TABLE jobs ENABLE ROW LEVEL SECURITY;
 ALTER TABLE applications ENABLE ROW LEVEL SECURITY;
 ALTER TABLE ai_search_logs ENABLE ROW LEVEL SECURITY;
+ALTER TABLE recruiter_daily_applications ENABLE ROW LEVEL SECURITY;
+ALTER TABLE application_skills ENABLE ROW LEVEL SECURITY;
+ALTER TABLE application_scores ENABLE ROW LEVEL SECURITY;
+ALTER TABLE ranking_jobs ENABLE ROW LEVEL SECURITY;
+ALTER TABLE catalogue_version ENABLE ROW LEVEL SECURITY;
 
 -- RLS Policies for users table
 CREATE POLICY "Users can view their own data"
@@ -83,6 +243,11 @@ CREATE POLICY "Anyone can view jobs"
   TO public
   USING (true);
 
+CREATE POLICY "Anyone can view the catalogue version"
+  ON catalogue_version FOR SELECT
+  TO public
+  USING (true);
+
 CREATE POLICY "Recruiters can create jobs"
   ON jobs FOR INSERT
   WITH CHECK (
@@ -144,6 +309,26 @@ CREATE POLICY "Applicants can delete their own applications"
   ON applications FOR DELETE
   USING (applicant_id = auth.uid());
 
+-- RLS Policies for application_skills table
+CREATE POLICY "Recruiters can view their applicants' skills"
+  ON application_skills FOR SELECT
+  USING (recruiter_id = auth.uid());
+
+-- RLS Policies for recruiter_daily_applications table
+CREATE POLICY "Recruiters can view their daily application counts"
+  ON recruiter_daily_applications FOR SELECT
+  USING (recruiter_id = auth.uid());
+
+-- RLS Policies for application_scores table
+CREATE POLICY "Recruiters can view their applicants' scores"
+  ON application_scores FOR SELECT
+  USING (recruiter_id = auth.uid());
+
+-- RLS Policies for ranking_jobs table
+CREATE POLICY "Recruiters can view their ranking jobs"
+  ON ranking_jobs FOR SELECT
+  USING (recruiter_id = auth.uid());
+
 -- RLS Policies for ai_search_logs table
 CREATE POLICY "Users can view their own logs"
   ON ai_search_logs FOR SELECT
@@ -14,6 +14,16 @@ export const applicationsApi = {
     return response.data.count;
   },
 
+  getApplicationCounts: async (
+    jobIds: string[]
+  ): Promise<Record<string, number>> => {
+    if (jobIds.length === 0) return {};
+    const response = await api.get("/applications/counts", {
+      params: { job_ids: jobIds.join(",") },
+    });
+    return response.data.counts;
+  },
+
   getById: async (id: string): Promise<Application> => {
     const response = await api.get(`/applications/${id}`);
     return response.data;
@@ -1,9 +1,25 @@
 import { api } from '@/lib/api';
-import { ATSRankingResponse } from '@/types';
+import { ATSRankingResponse, RankingJob } from '@/types';
 
 export const atsApi = {
   rankApplicants: async (jobId: string): Promise<ATSRankingResponse> => {
     const response = await api.post('/ats/rank', { job_id: jobId });
     return response.data;
   },
+
+  // Background ranking: submit, then poll until the job reaches a final status
+  startRankingJob: async (jobId: string): Promise<RankingJob> => {
+    const response = await api.post('/ats/rank/jobs', { job_id: jobId });
+    return response.data;
+  },
+
+  getRankingJob: async (rankingJobId: string): Promise<RankingJob> => {
+    const response = await api.get(`/ats/rank/jobs/${rankingJobId}`);
+    return response.data;
+  },
+
+  cancelRankingJob: async (rankingJobId: string): Promise<RankingJob> => {
+    const response = await api.post(`/ats/rank/jobs/${rankingJobId}/cancel`);
+    return response.data;
+  },
 };
@@ -0,0 +1,13 @@
+import { api } from '@/lib/api';
+import { DashboardResponse } from '@/types';
+
+export const dashboardApi = {
+  get: async (): Promise<DashboardResponse> => {
+    const response = await api.get('/dashboard');
+    return response.data;
+  },
+
+  markSeen: async (): Promise<void> => {
+    await api.post('/dashboard/seen');
+  },
+};
@@ -9,4 +9,14 @@ export const filesApi = {
     );
     return response.data;
   },
+
+  getCvPreviews: async (
+    applicationIds: string[]
+  ): Promise<Record<string, string>> => {
+    if (applicationIds.length === 0) return {};
+    const response = await api.post("/files/applications/previews", {
+      application_ids: applicationIds,
+    });
+    return response.data.signed_urls;
+  },
 };
@@ -1,5 +1,5 @@
 import { api } from "@/lib/api";
-import { Job, JobCreate } from "@/types";
+import { Job, JobCreate, RecommendedJob } from "@/types";
 
 export const jobsApi = {
   getAll: async (): Promise<Job[]> => {
@@ -12,6 +12,11 @@ export const jobsApi = {
     return response.data;
   },
 
+  getRecommended: async (limit = 6): Promise<RecommendedJob[]> => {
+    const response = await api.get("/jobs/recommended", { params: { limit } });
+    return response.data;
+  },
+
   getById: async (id: string): Promise<Job> => {
     const response = await api.get(`/jobs/${id}`);
     return response.data;
@@ -9,6 +9,14 @@ export const useJobs = () => {
   });
 };
 
+export const useRecommendedJobs = (enabled: boolean) => {
+  return useQuery({
+    queryKey: ['jobs', 'recommended'],
+    queryFn: () => jobsApi.getRecommended(),
+    enabled,
+  });
+};
+
 export const useJob = (id: string) => {
   return useQuery({
     queryKey: ['jobs', id],
@@ -1,4 +1,4 @@
-import { useState, useEffect } from "react";
+import { useState, useEffect, useRef } from "react";
 import { atsApi } from "@/api/ats";
 import { filesApi } from "@/api/files";
 import { useAuth } from "@/hooks/useAuth";
@@ -7,10 +7,13 @@ import { Button } from "@/components/ui/Button";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/Card";
 import { Spinner } from "@/components/ui/Spinner";
 import { ErrorMessage } from "@/components/ui/ErrorMessage";
-import { RankedApplicant } from "@/types";
+import { RankedApplicant, RankingJob } from "@/types";
 import { Trophy, Mail, FileText, X, Download } from "lucide-react";
 import { AxiosError } from "axios";
 
+// How often a running ranking job is re-read for progress
+const RANKING_POLL_MS = 1500;
+
 export const ATSRankingPage = () => {
   const { user } = useAuth();
   const [jobs, setJobs] = useState<any[] | undefined>(undefined);
@@ -36,26 +39,91 @@ export const ATSRankingPage = () => {
   const [jobTitle, setJobTitle] = useState("");
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState("");
+  const [rankingJob, setRankingJob] = useState<RankingJob | null>(null);
+  const pollTimer = useRef<number | undefined>(undefined);
   const [previewApplicant, setPreviewApplicant] =
     useState<RankedApplicant | null>(null);
   const [previewUrl, setPreviewUrl] = useState("");
   const [previewLoading, setPreviewLoading] = useState(false);
   const [previewError, setPreviewError] = useState("");
+  // Signed CV URLs fetched in one batch after ranking (they expire server-side after 10 minutes)
+  const [prefetchedUrls, setPrefetchedUrls] = useState<{
+    urls: Record<string, string>;
+    fetchedAt: number;
+  }>({ urls: {}, fetchedAt: 0 });
 
   useEffect(() => {
     document.title = "ATS Ranking - Recruitment System";
+    return () => window.clearTimeout(pollTimer.current);
   }, []);
 
+  const applyRankingJob = (job: RankingJob) => {
+    setRankingJob(job);
+    setRankedApplicants(job.applicants);
+    setJobTitle(job.job_title ?? "");
+  };
+
+  const finishRankingJob = (job: RankingJob) => {
+    setLoading(false);
+    if (job.status === "failed") {
+      setError(
+        job.error ||
+          "We couldn’t rank applicants just yet. Please try again in a moment."
+      );
+      return;
+    }
+    filesApi
+      .getCvPreviews(job.applicants.map((a) => a.application_id))
+      .then((urls) => setPrefetchedUrls({ urls, fetchedAt: Date.now() }))
+      .catch(() => undefined);
+  };
+
+  // Re-read the job until it finishes; partial results show as batches complete
+  const pollRankingJob = (rankingJobId: string) => {
+    pollTimer.current = window.setTimeout(async () => {
+      try {
+        const job = await atsApi.getRankingJob(rankingJobId);
+        applyRankingJob(job);
+        if (job.status === "queued" || job.status === "running") {
+          pollRankingJob(rankingJobId);
+        } else {
+          finishRankingJob(job);
+        }
+      } catch {
+        setLoading(false);
+        setError(
+          "We lost track of this ranking. Refresh in a moment to see its results."
+        );
+      }
+    }, RANKING_POLL_MS);
+  };
+
+  const handleCancel = async () => {
+    if (!rankingJob) return;
+    window.clearTimeout(pollTimer.current);
+    try {
+      const job = await atsApi.cancelRankingJob(rankingJob.id);
+      applyRankingJob(job);
+    } catch {
+      // keep the partial results already on screen
+    } finally {
+      setLoading(false);
+    }
+  };
+
   const handleRank = async () => {
     if (!selectedJobId) return;
 
+    window.clearTimeout(pollTimer.current);
     setLoading(true);
     setError("");
+    setRankedApplicants([]);
+    setRankingJob(null);
 
     try {
-      const response = await atsApi.rankApplicants(selectedJobId);
-      setRankedApplicants(response.applicants);
-      setJobTitle(response.job_title);
+      const job = await atsApi.startRankingJob(selectedJobId);
+      applyRankingJob(job);
+      pollRankingJob(job.id);
     } catch (errorResponse) {
       const axiosError = errorResponse as AxiosError<{ detail?: string }>;
       const detail = axiosError.response?.data?.detail;
@@ -77,7 +145,6 @@ export const ATSRankingPage = () => {
 
       setError(friendlyMessage);
       setRankedApplicants([]);
-    } finally {
       setLoading(false);
     }
   };
@@ -96,9 +163,13 @@ export const ATSRankingPage = () => {
     setPreviewUrl("");
 
     try {
-      const { signed_url } = await filesApi.getCvPreview(
-        applicant.application_id
-      );
+      const prefetched =
+        Date.now() - prefetchedUrls.fetchedAt < 5 * 60 * 1000
+          ? prefetchedUrls.urls[applicant.application_id]
+          : undefined;
+      const signed_url =
+        prefetched ??
+        (await filesApi.getCvPreview(applicant.application_id)).signed_url;
       setPreviewUrl(signed_url);
     } catch (previewErr) {
       const axiosError = previewErr as AxiosError<{ detail?: string }>;
@@ -196,13 +267,27 @@ export const ATSRankingPage = () => {
         </div>
       )}
 
-      {loading && (
+      {loading && rankingJob && (
+        <div className="flex flex-wrap items-center gap-4 rounded-3xl border border-white/10 bg-white/5 px-6 py-4 text-sm text-white/70">
+          <Spinner size="sm" />
+          <span>
+            {rankingJob.total > 0
+              ? `Scored ${rankingJob.completed} of ${rankingJob.total} shortlisted applicants…`
+              : "Preparing applicants for scoring…"}
+          </span>
+          <Button variant="ghost" size="sm" onClick={handleCancel}>
+            Stop ranking
+          </Button>
+        </div>
+      )}
+
+      {loading && rankedApplicants.length === 0 && (
         <div className="flex justify-center py-20">
           <Spinner size="lg" />
         </div>
       )}
 
-      {!loading && rankedApplicants.length > 0 && (
+      {rankedApplicants.length > 0 && (
         <div className="space-y-6">
           <div className="flex flex-col gap-2 sm:flex-row sm:items-center sm:justify-between">
             <h2 className="text-2xl font-semibold text-white">
@@ -1,4 +1,4 @@
-import { useMemo, useState } from "react";
+import { useEffect, useMemo, useState } from "react";
 import { useSearchParams, Link } from "react-router-dom";
 import { useApplications } from "@/hooks/useApplications";
 import { useJobs } from "@/hooks/useJobs";
@@ -51,6 +51,19 @@ export const ApplicationsPage = () => {
   const [previewUrl, setPreviewUrl] = useState("");
   const [previewLoading, setPreviewLoading] = useState(false);
   const [previewError, setPreviewError] = useState("");
+  // Recruiters get every listed CV signed in one batch request up front
+  const [prefetchedUrls, setPrefetchedUrls] = useState<{
+    urls: Record<string, string>;
+    fetchedAt: number;
+  }>({ urls: {}, fetchedAt: 0 });
+
+  useEffect(() => {
+    if (user?.role !== "recruiter" || myApplications.length === 0) return;
+    filesApi
+      .getCvPreviews(myApplications.map((application) => application.id))
+      .then((urls) => setPrefetchedUrls({ urls, fetchedAt: Date.now() }))
+      .catch(() => undefined);
+  }, [user, myApplications]);
 
   const closePreview = () => {
     setPreviewApplication(null);
@@ -66,7 +79,12 @@ export const ApplicationsPage = () => {
     setPreviewUrl("");
 
     try {
-      const { signed_url } = await filesApi.getCvPreview(application.id);
+      const prefetched =
+        Date.now() - prefetchedUrls.fetchedAt < 5 * 60 * 1000
+          ? prefetchedUrls.urls[application.id]
+          : undefined;
+      const signed_url =
+        prefetched ?? (await filesApi.getCvPreview(application.id)).signed_url;
       setPreviewUrl(signed_url);
     } catch (previewErr: any) {
       const message =
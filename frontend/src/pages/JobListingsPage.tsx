@@ -1,4 +1,5 @@
-import { useJobs } from "@/hooks/useJobs";
+import { useJobs, useRecommendedJobs } from "@/hooks/useJobs";
+import { useAuth } from "@/hooks/useAuth";
 import { JobCard } from "@/components/JobCard";
 import { Spinner } from "@/components/ui/Spinner";
 import { ErrorMessage } from "@/components/ui/ErrorMessage";
@@ -11,6 +12,10 @@ import { Card, CardContent } from "@/components/ui/Card";
 
 export const JobListingsPage = () => {
   const { data: jobs, isLoading, error, refetch, isFetching } = useJobs();
+  const { user } = useAuth();
+  const { data: recommendedJobs } = useRecommendedJobs(
+    user?.role === "applicant"
+  );
   const [searchTerm, setSearchTerm] = useState("");
   const quickPicks = ["AI engineer", "Remote-first", "Leadership", "Contract"];
 
@@ -131,6 +136,24 @@ export const JobListingsPage = () => {
         </Card>
       </section>
 
+      {recommendedJobs && recommendedJobs.length > 0 && !hasActiveSearch && (
+        <section className="mx-auto w-full max-w-6xl px-6 pb-12">
+          <div className="mb-6 flex items-center justify-between">
+            <h2 className="text-2xl font-semibold text-white">
+              Recommended for you
+            </h2>
+            <p className="text-xs uppercase tracking-[0.35em] text-white/40">
+              matched to your latest CV
+            </p>
+          </div>
+          <div className="grid gap-8 md:grid-cols-2 xl:grid-cols-3">
+            {recommendedJobs.map((job) => (
+              <JobCard key={job.id} job={job} />
+            ))}
+          </div>
+        </section>
+      )}
+
       <section className="mx-auto w-full max-w-6xl px-6 pb-24">
         {filteredJobs && filteredJobs.length > 0 ? (
           <div className="grid gap-8 md:grid-cols-2 xl:grid-cols-3">
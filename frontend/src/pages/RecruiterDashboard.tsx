@@ -1,50 +1,47 @@
 import { useEffect, useState } from "react";
 import { jobsApi } from "@/api/jobs";
-import { applicationsApi } from "@/api/applications";
+import { dashboardApi } from "@/api/dashboard";
+import { DashboardResponse } from "@/types";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/Card";
 import { Button } from "@/components/ui/Button";
 import { Spinner } from "@/components/ui/Spinner";
 import { useNavigate } from "react-router-dom";
 
-interface Job {
-  id: string;
-  title: string;
-  location: string;
-  status: string;
-  created_at: string;
-  application_count: number;
-}
+type Job = DashboardResponse["jobs"][number];
 
 export const RecruiterDashboard = () => {
   const [jobs, setJobs] = useState<Job[]>([]);
+  const [totals, setTotals] = useState<DashboardResponse["totals"] | null>(
+    null
+  );
+  const [daily, setDaily] = useState<DashboardResponse["daily_applications"]>(
+    []
+  );
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
   useEffect(() => {
-    fetchJobs();
+    fetchJobs(true);
   }, []);
 
-  const fetchJobs = async () => {
+  const fetchJobs = async (markSeen = false) => {
     setLoading(true);
     setError(null);
     try {
-      // Assume recruiter id is stored in localStorage
-      const userStr = localStorage.getItem("user");
-      if (!userStr) {
+      if (!localStorage.getItem("user")) {
         setError("Please login as recruiter.");
         setLoading(false);
         return;
       }
-      const user = JSON.parse(userStr);
-      const jobsData = await jobsApi.getJobsByRecruiter(user.id);
-      // For each job, fetch application count
-      const jobsWithCounts = await Promise.all(
-        jobsData.map(async (job: any) => {
-          const count = await applicationsApi.getApplicationCount(job.id);
-          return { ...job, application_count: count };
-        })
-      );
-      setJobs(jobsWithCounts);
+      // Jobs, counts and recent activity come back in one request
+      const dashboard = await dashboardApi.get();
+      setJobs(dashboard.jobs);
+      setTotals(dashboard.totals);
+      setDaily(dashboard.daily_applications);
+      if (markSeen) {
+        // This visit has been shown; the next one counts new applications from here
+        dashboardApi.markSeen().catch(() => undefined);
+      }
     } catch (err: any) {
       setError(err.message || "Failed to fetch jobs.");
     } finally {
@@ -83,12 +80,42 @@ export const RecruiterDashboard = () => {
     }
   };
 
+  const dailyPeak = Math.max(1, ...daily.map((point) => point.count));
+
   return (
     <div className="mx-auto w-full max-w-6xl px-6 py-24">
       <h1 className="text-4xl font-semibold mb-8 text-white">
         Recruiter Dashboard
       </h1>
       {loading && <Spinner size="lg" />}
+      {totals && totals.jobs > 0 && (
+        <div className="mb-8 flex flex-wrap items-end gap-8 text-white/85">
+          <div>
+            <div className="text-3xl font-semibold">{totals.open_jobs}</div>
+            <div className="text-sm text-white/60">Open roles</div>
+          </div>
+          <div>
+            <div className="text-3xl font-semibold">{totals.applications}</div>
+            <div className="text-sm text-white/60">Applications</div>
+          </div>
+          <div>
+            <div className="text-3xl font-semibold">
+              {totals.new_applications}
+            </div>
+            <div className="text-sm text-white/60">New since last visit</div>
+          </div>
+          <div className="flex h-12 items-end gap-[2px]">
+            {daily.map((point) => (
+              <div
+                key={point.day}
+                title={`${point.day}: ${point.count}`}
+                className="w-1.5 bg-white/40"
+                style={{ height: `${(point.count / dailyPeak) * 100}%` }}
+              />
+            ))}
+          </div>
+        </div>
+      )}
       {error && <div className="text-red-500 mb-4">{error}</div>}
       {jobs.length === 0 && !loading && !error && (
         <div className="text-center text-white/60 text-lg mt-16">
@@ -120,6 +147,11 @@ export const RecruiterDashboard = () => {
                   </div>
                   <div className="mb-2 text-white/85">
                     Applications: {job.application_count}
+                    {job.new_applications > 0 && (
+                      <span className="ml-2 text-emerald-400">
+                        (+{job.new_applications} new)
+                      </span>
+                    )}
                   </div>
                 </div>
                 <div className="flex flex-wrap gap-2 mt-4">
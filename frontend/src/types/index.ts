@@ -15,6 +15,10 @@ export interface Job {
   created_at: string;
 }
 
+export interface RecommendedJob extends Job {
+  score: number;
+}
+
 export interface JobCreate {
   title: string;
   description: string;
@@ -28,6 +32,7 @@ export interface Application {
   applicant_id: string;
   job_id: string;
   cv_url: string;
+  cv_path?: string;
   cover_letter?: string;
   recruiter_id?: string;
   applicant_name?: string;
@@ -65,6 +70,7 @@ export interface RankedApplicant {
   summary: string;
   cv_url: string;
   skills: string[];
+  provisional?: boolean;
 }
 
 export interface ATSRankingResponse {
@@ -73,7 +79,49 @@ export interface ATSRankingResponse {
   applicants: RankedApplicant[];
 }
 
+export type RankingJobStatus =
+  | 'queued'
+  | 'running'
+  | 'completed'
+  | 'failed'
+  | 'cancelled';
+
+export interface RankingJob {
+  id: string;
+  job_id: string;
+  job_title?: string;
+  status: RankingJobStatus;
+  total: number;
+  completed: number;
+  applicants: RankedApplicant[];
+  error?: string;
+  created_at?: string;
+  updated_at?: string;
+}
+
 export interface AuthResponse {
   access_token: string;
   user: User;
 }
+
+export interface DashboardJob {
+  id: string;
+  title: string;
+  location?: string;
+  status?: string;
+  created_at: string;
+  application_count: number;
+  new_applications: number;
+}
+
+export interface DashboardResponse {
+  jobs: DashboardJob[];
+  totals: {
+    jobs: number;
+    open_jobs: number;
+    applications: number;
+    new_applications: number;
+  };
+  last_seen_at: string | null;
+  daily_applications: { day: string; count: number }[];
+}